@@ -1,208 +1,544 @@
-""" This script file is the main script file which is the front interface of this app
-and also all other functionality of other modules can be accessed by the GUI interface
-it creates. This module basically creates the directory where the App content will
-be stored and also responsible for the support to every other modules.
-"""
-
-import ctypes
-import os
-import sys
-import time
-import tkinter as tk
-from sys import platform
-
-import appdirs
-import requests
-from windows_wifi_manager import top_level_window as db
-from windows_wifi_manager.display_data import WifiDisplayBox
-from windows_wifi_manager.wifi_connection import SystemWifiConnection
-
-SOFTWARE_NAME = "SavedPasswordFinder"
-SOFTWARE_AUTHOR = "NihalAgarwal"
-APP_DIR = appdirs.user_data_dir(SOFTWARE_NAME, SOFTWARE_AUTHOR)
-
-if not os.path.isdir(APP_DIR):
-    os.makedirs(APP_DIR)
-
-
-def main():
-    """ Main Method"""
-
-    # THE BELOW FUNCTIONS ARE THE FUNCTION WHICH ARE CALLED BY THE WIDGETS
-    # OR TRIGGERED BY THE WIDGETS
-
-    def about():
-        """ Describe about the software and what it does and also contact
-        details to developer, when user or end user face any issue.
-        """
-        db.About(main_window)
-
-    def update():
-        """ Check if software has latest version or not"""
-        try:
-            time.sleep(4)
-            _ = requests.get('http://www.google.com/', timeout=5)
-            db.MessageBox(main_window, "Version: 1.0v \n\n No Update Available!", "warning")
-        except requests.ConnectionError:
-            db.MessageBox(main_window, "Check Your Internet Connection", "error")
-
-    def add_profile():
-        """ Add new Wi-Fi profile to the system."""
-
-        db.AddProfile(main_window, APP_DIR)
-
-    def refresh_treeview():
-        """ Refresh the software and search for all saved networks and
-        add it to the TreeView.
-        """
-        temp = wdb.refresh_treeview()  # Generate a new list of saved Wi-Fi
-
-        if temp:
-            db.MessageBox(main_window, 'Refresh Successfully.', 'check')
-
-        else:
-            db.MessageBox(main_window, 'Facing issue.')
-
-    def delete_profile():
-        """ Call delete_profile method of WifiDisplayBox to delete a wifi profile."""
-        wdb.delete_profile(main_window)
-
-    def on_exiting():
-        """ End the process and quit the software"""
-
-        result = db.QuitWindow(main_window)
-        if result.temp.get():
-            for i in os.listdir(APP_DIR):
-                if i != 'temp_':
-                    os.remove(APP_DIR + "\\" + i)
-            main_window.destroy()
-
-    def find_network():
-        """ Check if system is connect to any network. If yes the
-        network name is return and button value is modified to 'refresh'
-        (if no network connected) otherwise button value is modified to
-        'disconnect' and label is updated as network name.
-        """
-        ssid_name = system_wifi_connection.is_connected()
-
-        if ssid_name is not None:
-            refresh_disconnect_button.configure(text="Disconnect",
-                                                command=disconnect_button)
-            current_network_label.configure(text=ssid_name, foreground="green")
-
-        else:
-            refresh_disconnect_button.configure(text="Refresh",
-                                                command=find_network)
-            current_network_label.configure(text="No Network", foreground="red")
-
-    def disconnect_button():
-        """ Disconnect form the current network. """
-        disconnected = system_wifi_connection.disconnect_connection()
-        if disconnected:
-            refresh_disconnect_button.configure(text="Refresh",
-                                                command=find_network)
-            current_network_label.configure(text="No Network", foreground="red")
-            text = "You had to manually connect to same or different network."
-            db.MessageBox(main_window, text, "warning")  # pop-up window
-
-    # Checking OS
-    if platform != "win32":
-        print("The package or Application is made only for window users. ")
-        print("The package development for other OS is still in development. ")
-        sys.exit(0)
-
-    # Creating and configuring Main Window
-    main_window = tk.Tk()
-    main_window.configure(background='white', highlightbackground="grey")
-    main_window.title("Windows Wi-Fi Manager")
-    try:
-        # the below line of code will avoid blurry looking GUI by increasing DPI.
-        ctypes.windll.shcore.SetProcessDpiAwareness(1)
-        main_window.geometry("900x600")
-
-    except Exception:
-        main_window.geometry("900x500")
-
-    main_window.minsize(800, 350)
-    path_dir = os.path.dirname(os.path.realpath(__file__))
-    main_window.iconbitmap(path_dir + "/data/images/wifi2.ico")
-
-    # Creating MENU and SUBMENU
-    menu = tk.Menu(main_window)
-    submenu = tk.Menu(main_window, tearoff=0)
-    main_window.config(menu=menu)
-    menu.add_cascade(label="Help", menu=submenu)
-    submenu.add_command(label="About", command=about)
-    submenu.add_separator()
-    submenu.add_command(label="Check for updates", command=update)
-    submenu.add_separator()
-    submenu.add_command(label="Quit", command=on_exiting)
-
-    # Theme for Buttons
-    style = tk.ttk.Style()
-    style.configure('TButton', font=("Playfair Display", 15))
-    style.map('TButton', font=[('active', ("Playfair Display", 12))],
-              background=[('active', 'blue')])
-
-    # Frame1 for system connected network display
-    top_horizontal_frame = tk.Frame(main_window)
-    # Frame2 for TreeView
-    tree_view_frame = tk.Frame(main_window, background='white')
-    # Frame3 for refresh, delete, add profile.
-    vertical_button_frame = tk.Frame(main_window, background='white')
-
-    # Create object to easily reference its method and fields(e.g., SSID name)
-    system_wifi_connection = SystemWifiConnection(main_window)
-
-    # Displays the heading(title)
-    heading_label = tk.Label(top_horizontal_frame, text="Current Network: ",
-                             font=("Playfair Display", 13, "bold"))
-
-    # Button for disconnection or refresh
-    refresh_disconnect_button = tk.ttk.Button(top_horizontal_frame, style='TButton')
-
-    # Displays network name
-    current_network_label = tk.Label(top_horizontal_frame,
-                                     font=("Playfair Display", 13, "bold"))
-
-    # packing
-    heading_label.pack(padx=10, pady=10, side=tk.LEFT)
-    current_network_label.pack(padx=10, pady=10, side=tk.LEFT)
-    refresh_disconnect_button.pack(padx=10, pady=10, side=tk.LEFT)
-    find_network()
-
-    # Defining and packing buttons for frame2
-    refresh_button = tk.ttk.Button(vertical_button_frame,
-                                   text="Refresh List", style='TButton',
-                                   cursor="hand2", command=refresh_treeview)
-
-    delete_button = tk.ttk.Button(vertical_button_frame,
-                                  text="Delete WiFi", style='TButton',
-                                  cursor="hand2", command=delete_profile)
-
-    add_profile_button = tk.ttk.Button(vertical_button_frame,
-                                       text="Add Profile", style='TButton',
-                                       cursor="hand2", command=add_profile)
-
-    # Creating TreeView and packing it to the frame2
-    wdb = WifiDisplayBox(APP_DIR, tree_view_frame)
-
-    # Packing all three buttons( refresh, delete, add_profile)
-    refresh_button.pack(side=tk.TOP, pady=25, padx=10, anchor="center")
-    delete_button.pack(side=tk.TOP, pady=25, padx=10, anchor="center")
-    add_profile_button.pack(side=tk.TOP, pady=25, padx=10, anchor="center")
-
-    # Packing frame1, frame2 and frame3
-
-    top_horizontal_frame.grid(row=0, column=0, columnspan=2, sticky='nsew')
-    vertical_button_frame.grid(row=1, column=1, sticky='nsew')
-    tree_view_frame.grid(row=1, column=0, sticky='nsew')
-    main_window.grid_columnconfigure(0, weight=1)
-    main_window.grid_rowconfigure(1, weight=1)
-
-    main_window.protocol("WM_DELETE_WINDOW", on_exiting)
-    main_window.mainloop()
-
-
-if __name__ == '__main__':
-    main()
+""" This script file is the main script file which is the front interface of this app
+and also all other functionality of other modules can be accessed by the GUI interface
+it creates. This module basically creates the directory where the App content will
+be stored and also responsible for the support to every other modules. Modules which are
+only needed by some action of the menu (like checking for updates) are imported when
+the action is used, so the App starts faster.
+"""
+
+import time
+
+# Noted before anything else is imported, to measure the start up time of the App.
+START_TIME = time.perf_counter_ns()
+
+import ctypes
+import logging
+import os
+import sys
+import tkinter as tk
+from sys import platform
+
+from windows_wifi_manager import command_runner, settings, tracing
+from windows_wifi_manager import top_level_window as db
+from windows_wifi_manager.background import BackgroundTasks
+from windows_wifi_manager.channel_analysis import ChannelAnalyser
+from windows_wifi_manager.display_data import NearbyNetworksBox, Sparkline, WifiDisplayBox
+from windows_wifi_manager.network_scanner import NetworkScanner
+from windows_wifi_manager.profiling import ActionProfiler
+from windows_wifi_manager.signal_history import SignalSampler
+from windows_wifi_manager.updates import UpdateChecker
+from windows_wifi_manager.wifi_connection import ConnectionMonitor, SystemWifiConnection
+
+LOGGER = logging.getLogger("windows_wifi_manager")
+
+
+def main():
+    """ Main Method, opens the main window or runs the command line interface if
+    any command is given (e.g. windows-wifi-manager list).
+    """
+
+    if len(sys.argv) > 1:
+        from windows_wifi_manager import cli  # No window is created for commands.
+        sys.exit(cli.main(sys.argv[1:]))
+
+    if settings.LOG_LEVEL:
+        logging.basicConfig(level=settings.LOG_LEVEL.upper(),
+                            format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    # THE BELOW FUNCTIONS ARE THE FUNCTION WHICH ARE CALLED BY THE WIDGETS
+    # OR TRIGGERED BY THE WIDGETS
+
+    def about():
+        """ Describe about the software and what it does and also contact
+        details to developer, when user or end user face any issue.
+        """
+        db.About(main_window)
+
+    def update():
+        """ Check if software has latest version or not. The check is done on a worker
+        thread and the result is displayed when it is available.
+        """
+        submenu.entryconfigure("Check for updates", state=tk.DISABLED)
+        tasks.submit(check_for_update, callback=update_result,
+                     error_callback=update_failed)
+
+    def update_result(result):
+        """ Display the result of check for updates."""
+        submenu.entryconfigure("Check for updates", state=tk.NORMAL)
+        if result["update_available"]:
+            text = "Version: " + result["latest_version"] + " is available.\n\n" \
+                   "Run 'pip install --upgrade windows-wifi-manager'"
+        else:
+            text = "Version: " + result["current_version"] + "\n\n No Update Available!"
+        db.MessageBox(main_window, text, "warning")
+
+    def update_failed(_):
+        """ Called if check for updates failed."""
+        submenu.entryconfigure("Check for updates", state=tk.NORMAL)
+        db.MessageBox(main_window, "Check Your Internet Connection", "error")
+
+    def performance_summary():
+        """ Display where the App spent its time (see tracing)."""
+        db.TextWindow(main_window, "Time spent by the App (slowest first, last %d spans)\n\n"
+                      % len(tracing.tracer.spans) + tracing.tracer.format_summary(limit=40))
+
+    def save_trace():
+        """ Save the recent spans to a file which can be opened in chrome://tracing."""
+        from tkinter import filedialog  # Only needed when trace is saved.
+
+        path = filedialog.asksaveasfilename(
+            parent=main_window, title="Save performance trace", defaultextension=".json",
+            filetypes=[("Chrome trace", "*.json"), ("All files", "*.*")])
+        if not path:
+            return
+        try:
+            tracing.tracer.export_chrome(path)
+        except OSError as error:
+            db.MessageBox(main_window, "Unable to save the file.\n(" + str(error) + ")",
+                          "error")
+
+    def toggle_profiling():
+        """ Turn profiling of the actions on or off (Help menu)."""
+        action_profiler.enabled = profile_actions.get()
+
+    def show_action_profile():
+        """ Display the functions which took the most time in the last profiled action."""
+        path = action_profiler.latest()
+        if path is None:
+            db.MessageBox(main_window, "No action is profiled yet. Turn on 'Profile Actions'"
+                                       "\nin Help menu and repeat the slow action.", "warning")
+            return
+        from windows_wifi_manager.profiling import report
+
+        try:
+            text = report(path)
+        except (OSError, EOFError, TypeError, ValueError) as error:
+            db.MessageBox(main_window, "Unable to read the profile.\n(" + str(error) + ")",
+                          "error")
+            return
+        db.TextWindow(main_window, "Saved in " + action_profiler.folder + "\n" + text,
+                      width=110, height=30)
+
+    def add_profile():
+        """ Add new Wi-Fi profile to the system."""
+
+        db.AddProfile(main_window, app_path)
+
+    def import_profiles():
+        """ Add profiles of every row of a CSV or JSON file chosen by the user, profiles
+        are added on a worker thread and the result is displayed at the end.
+        """
+        from tkinter import filedialog  # Only needed when profiles are imported.
+
+        path = filedialog.askopenfilename(
+            parent=main_window, title="Import Wi-Fi profiles",
+            filetypes=[("CSV or JSON", "*.csv *.json"), ("All files", "*.*")])
+        if not path:
+            return
+        from windows_wifi_manager.profile_import import import_file
+        profile_menu.entryconfigure("Import Profiles\u2026", state=tk.DISABLED)
+        batch_tasks.submit(import_file, path, app_path + "\\temp_",
+                           callback=profiles_imported, error_callback=import_failed)
+
+    def profiles_imported(results):
+        """ Display the result of import of profiles and add them to the list."""
+        profile_menu.entryconfigure("Import Profiles\u2026", state=tk.NORMAL)
+        wdb.refresh_treeview()
+        failed = [result for result in results if not result["added"]]
+        text = "Added %d of %d profiles." % (len(results) - len(failed), len(results))
+        if failed:
+            text += "\nUnable to add:\n" + "\n".join(
+                "Row %d (%s): %s" % (result["row"], result["ssid"], result["error"])
+                for result in failed[:10])
+            if len(failed) > 10:
+                text += "\n\u2026 and %d more." % (len(failed) - 10)
+        db.MessageBox(main_window, text, "error" if failed else "check")
+
+    def import_failed(error):
+        """ Called if the file can not be read."""
+        profile_menu.entryconfigure("Import Profiles\u2026", state=tk.NORMAL)
+        db.MessageBox(main_window, "Unable to read the file.\n(" + str(error) + ")", "error")
+
+    def save_profile_list():
+        """ Save the names of the saved profiles to a text file chosen by the user."""
+        from tkinter import filedialog  # Only needed when the list is saved.
+
+        path = filedialog.asksaveasfilename(
+            parent=main_window, title="Save list of Wi-Fi profiles", defaultextension=".txt",
+            initialdir=app_path, initialfile="Saved Wifi list.txt",
+            filetypes=[("Text file", "*.txt"), ("All files", "*.*")])
+        if not path:
+            return
+        information = wdb.getting_data_obj.wifi_information
+        try:
+            information.save_snapshot(path)
+        except OSError as error:
+            db.MessageBox(main_window, "Unable to save the list.\n(" + str(error) + ")", "error")
+            return
+        db.MessageBox(main_window, "Saved %d profile names." % len(information.list_of_wifi),
+                      "check")
+
+    def backup_profiles():
+        """ Back up every profile to a zip file chosen by the user, on a worker thread."""
+        from tkinter import filedialog  # Only needed when profiles are backed up.
+
+        path = filedialog.asksaveasfilename(
+            parent=main_window, title="Back up Wi-Fi profiles", defaultextension=".zip",
+            filetypes=[("Zip file", "*.zip"), ("All files", "*.*")])
+        if not path:
+            return
+        from windows_wifi_manager.profile_backup import create_backup
+        profile_menu.entryconfigure("Back up Profiles\u2026", state=tk.DISABLED)
+        batch_tasks.submit(create_backup, wdb.getting_data_obj.wifi_information, path,
+                           callback=profiles_backed_up, error_callback=backup_failed)
+
+    def profiles_backed_up(manifest):
+        """ Display the number of profiles in the backup."""
+        profile_menu.entryconfigure("Back up Profiles\u2026", state=tk.NORMAL)
+        db.MessageBox(main_window, "Backed up %d profiles.\nKeys are saved as plain text, "
+                                   "keep the file safe." % len(manifest["profiles"]), "check")
+
+    def backup_failed(error):
+        """ Called if the backup can not be made."""
+        profile_menu.entryconfigure("Back up Profiles\u2026", state=tk.NORMAL)
+        db.MessageBox(main_window, "Unable to back up profiles.\n(" + str(error) + ")", "error")
+
+    def restore_profiles():
+        """ Restore profiles from a backup chosen by the user, profiles which are already
+        on the system (identical) are skipped.
+        """
+        from tkinter import filedialog  # Only needed when profiles are restored.
+
+        path = filedialog.askopenfilename(
+            parent=main_window, title="Restore Wi-Fi profiles",
+            filetypes=[("Zip file", "*.zip"), ("All files", "*.*")])
+        if not path:
+            return
+        from windows_wifi_manager.profile_backup import restore_backup
+        profile_menu.entryconfigure("Restore Profiles\u2026", state=tk.DISABLED)
+        batch_tasks.submit(restore_backup, wdb.getting_data_obj.wifi_information, path,
+                           callback=profiles_restored, error_callback=restore_failed)
+
+    def profiles_restored(results):
+        """ Display the result of restore and add restored profiles to the list."""
+        profile_menu.entryconfigure("Restore Profiles\u2026", state=tk.NORMAL)
+        wdb.refresh_treeview()
+        failed = [result for result in results if result["status"] == "failed"]
+        skipped = sum(result["status"] == "skipped" for result in results)
+        text = "Restored %d of %d profiles, %d already on the system." % (
+            len(results) - len(failed) - skipped, len(results), skipped)
+        if failed:
+            text += "\nUnable to restore:\n" + "\n".join(
+                "%s: %s" % (result["name"], result["error"]) for result in failed[:10])
+            if len(failed) > 10:
+                text += "\n\u2026 and %d more." % (len(failed) - 10)
+        db.MessageBox(main_window, text, "error" if failed else "check")
+
+    def restore_failed(error):
+        """ Called if the backup can not be read."""
+        profile_menu.entryconfigure("Restore Profiles\u2026", state=tk.NORMAL)
+        db.MessageBox(main_window, "Unable to restore profiles.\n(" + str(error) + ")", "error")
+
+    def refresh_treeview():
+        """ Refresh the software and search for all saved networks and
+        add it to the TreeView.
+        """
+        temp = wdb.refresh_treeview()  # Generate a new list of saved Wi-Fi
+
+        if temp:
+            db.MessageBox(main_window, 'Refresh Successfully.', 'check')
+
+        else:
+            db.MessageBox(main_window, 'Facing issue.')
+
+    def delete_profile():
+        """ Call delete_profile method of WifiDisplayBox to delete a wifi profile."""
+        wdb.delete_profile(main_window)
+
+    def on_exiting():
+        """ End the process and quit the software"""
+
+        result = db.QuitWindow(main_window)
+        if result.temp.get():
+            for i in os.listdir(app_path):
+                if i not in ('temp_', 'profiles_'):  # Profiles are kept for bug reports.
+                    os.remove(app_path + "\\" + i)
+            connection_monitor.stop()
+            nearby.stop()
+            tasks.shutdown()
+            batch_tasks.shutdown()
+            if netsh_session is not None:
+                netsh_session.close()
+            main_window.destroy()
+
+    def find_network():
+        """ Check now if system is connect to any network (otherwise it is checked
+        in background from time to time), result is displayed by show_network.
+        """
+        connection_monitor.poll_now(action="find_network")
+
+    def show_network(ssid_name):
+        """ Called by connection monitor when the connection changes. If system is
+        connected to any network button value is modified to 'disconnect' and label
+        is updated as network name, otherwise button value is modified to 'refresh'.
+        If system has more than one Wi-Fi interface, user can choose one of them.
+        """
+        names = [interface.name for interface in system_wifi_connection.interfaces]
+        if len(names) > 1:
+            interface_combo.configure(values=names)
+            interface = system_wifi_connection.find_interface()
+            interface_combo.set(interface.name if interface is not None else "")
+            interface_combo.pack(padx=10, pady=10, side=tk.LEFT, before=heading_label)
+        else:
+            interface_combo.pack_forget()
+
+        if ssid_name is not None:
+            refresh_disconnect_button.configure(text="Disconnect",
+                                                command=disconnect_button)
+            current_network_label.configure(text=ssid_name, foreground="green")
+
+        else:
+            refresh_disconnect_button.configure(text="Refresh",
+                                                command=find_network)
+            current_network_label.configure(text="No Network", foreground="red")
+
+    def tab_changed(_=None):
+        """ Nearby networks are scanned only while their tab is displayed."""
+        if notebook.select() == str(nearby_frame):
+            nearby.start()
+        else:
+            nearby.stop()
+
+    def show_signal(histories):
+        """ Called by signal sampler after every sample, draws the recent signal
+        strength of the interface whose network is displayed.
+        """
+        interface = system_wifi_connection.find_interface()
+        history = histories.get(interface.name) if interface is not None else None
+        values = history.values("signal") if history is not None else []
+        signal_sparkline.draw(values)
+        if len(values) == 0 or values[-1] != values[-1]:  # No signal (NaN) now.
+            signal_label.configure(text="")
+            return
+        stats = history.summary("signal")
+        signal_label.configure(text="%d%% (min %d%%, avg %d%%)" % (
+            values[-1], stats["min"], round(stats["mean"])))
+
+    def export_signal_history(_=None):
+        """ Save the recent samples of the displayed interface to a CSV file."""
+        interface = system_wifi_connection.find_interface()
+        history = None
+        if interface is not None:
+            history = signal_sampler.histories.get(interface.name)
+        if history is None or len(history) == 0:
+            db.MessageBox(main_window, "Signal strength is not recorded yet.", "warning")
+            return
+        from tkinter import filedialog  # Only needed when history is exported.
+
+        path = filedialog.asksaveasfilename(
+            parent=main_window, title="Export signal history", defaultextension=".csv",
+            filetypes=[("CSV file", "*.csv"), ("All files", "*.*")])
+        if not path:
+            return
+        try:
+            history.export_csv(path)
+        except OSError as error:
+            db.MessageBox(main_window, "Unable to save the file.\n(" + str(error) + ")",
+                          "error")
+
+    def select_interface(_=None):
+        """ Called when user chooses another Wi-Fi interface, display its network."""
+        system_wifi_connection.selected_interface = interface_combo.get()
+        connection_monitor.poll_now()
+
+    def first_paint(event):
+        """ Called when main window is drawn, records the time taken from start up till
+        the main window is painted first time (shown in Performance Summary and logged).
+        """
+        if event.widget is main_window:
+            main_window.unbind("<Expose>")
+            duration = time.perf_counter_ns() - START_TIME
+            tracing.tracer.add("time to first paint", "ui", START_TIME, duration)
+            LOGGER.info("Time to first paint: %.0f ms", duration / 1e6)
+
+    def disconnect_button():
+        """ Disconnect form the current network. """
+        disconnected = system_wifi_connection.disconnect_connection()
+        if disconnected:
+            refresh_disconnect_button.configure(text="Refresh",
+                                                command=find_network)
+            current_network_label.configure(text="No Network", foreground="red")
+            connection_monitor.poll_now()
+            text = "You had to manually connect to same or different network."
+            db.MessageBox(main_window, text, "warning")  # pop-up window
+
+    # Checking OS
+    if platform != "win32":
+        print("The package or Application is made only for window users. ")
+        print("The package development for other OS is still in development. ")
+        sys.exit(0)
+
+    # Directory where the App content is stored.
+    app_path = settings.app_dir()
+
+    # Optional long-lived netsh process for 'netsh wlan show' commands.
+    netsh_session = None
+    if settings.NETSH_SESSION:
+        from windows_wifi_manager.netsh_session import NetshSession
+        netsh_session = NetshSession()
+        command_runner.set_runner(netsh_session)
+    update_checker = UpdateChecker(app_path + "\\temp_\\update_check.json",
+                                   interval=settings.UPDATE_CHECK_INTERVAL)
+
+    # Actions of the user are profiled (when turned on) and saved for bug reports.
+    action_profiler = ActionProfiler(app_path + "\\profiles_", keep=settings.PROFILE_KEEP,
+                                     enabled=settings.PROFILE_ACTIONS)
+    refresh_treeview = action_profiler.wrap("refresh_treeview", refresh_treeview)
+    add_profile = action_profiler.wrap("add_profile", add_profile)
+    # Actions which only hand the work over to a worker thread (deleting profiles,
+    # refreshing the current network and checking for updates) are profiled there, by
+    # wrapping the function run by the worker.
+    check_for_update = action_profiler.wrap("update", update_checker.check)
+
+    # Creating and configuring Main Window
+    main_window = tk.Tk()
+    main_window.configure(background='white', highlightbackground="grey")
+    main_window.title("Windows Wi-Fi Manager")
+    try:
+        # the below line of code will avoid blurry looking GUI by increasing DPI.
+        ctypes.windll.shcore.SetProcessDpiAwareness(1)
+        main_window.geometry("900x600")
+
+    except Exception:
+        main_window.geometry("900x500")
+
+    main_window.minsize(800, 350)
+    # Worker threads for slow work (netsh commands, checking for updates).
+    tasks = BackgroundTasks(main_window)
+    # Long batch jobs (import, backup, restore and deletion of profiles) run one after another on
+    # their own thread, so they never hold up the details of a row or the check of the
+    # connection.
+    batch_tasks = BackgroundTasks(main_window, max_workers=1)
+    path_dir = os.path.dirname(os.path.realpath(__file__))
+    main_window.iconbitmap(path_dir + "/data/images/wifi2.ico")
+
+    # Creating MENU and SUBMENU
+    menu = tk.Menu(main_window)
+    submenu = tk.Menu(main_window, tearoff=0)
+    profile_menu = tk.Menu(main_window, tearoff=0)
+    main_window.config(menu=menu)
+    menu.add_cascade(label="Profiles", menu=profile_menu)
+    profile_menu.add_command(label="Import Profiles\u2026", command=import_profiles)
+    profile_menu.add_command(label="Save Profile List\u2026", command=save_profile_list)
+    profile_menu.add_separator()
+    profile_menu.add_command(label="Back up Profiles\u2026", command=backup_profiles)
+    profile_menu.add_command(label="Restore Profiles\u2026", command=restore_profiles)
+    menu.add_cascade(label="Help", menu=submenu)
+    submenu.add_command(label="About", command=about)
+    submenu.add_separator()
+    submenu.add_command(label="Check for updates", command=update)
+    submenu.add_command(label="Performance Summary", command=performance_summary)
+    submenu.add_command(label="Save Performance Trace\u2026", command=save_trace)
+    profile_actions = tk.BooleanVar(main_window, value=action_profiler.enabled)
+    submenu.add_checkbutton(label="Profile Actions", variable=profile_actions,
+                            command=toggle_profiling)
+    submenu.add_command(label="Last Action Profile", command=show_action_profile)
+    submenu.add_separator()
+    submenu.add_command(label="Quit", command=on_exiting)
+
+    # Theme for Buttons
+    style = tk.ttk.Style()
+    style.configure('TButton', font=("Playfair Display", 15))
+    style.map('TButton', font=[('active', ("Playfair Display", 12))],
+              background=[('active', 'blue')])
+
+    # Frame1 for system connected network display
+    top_horizontal_frame = tk.Frame(main_window)
+    # Frame2 has two tabs, TreeView of saved profiles and TreeView of nearby networks
+    notebook = tk.ttk.Notebook(main_window)
+    tree_view_frame = tk.Frame(notebook, background='white')
+    nearby_frame = tk.Frame(notebook, background='white')
+    notebook.add(tree_view_frame, text="Saved Profiles")
+    notebook.add(nearby_frame, text="Nearby Networks")
+    # Frame3 for refresh, delete, add profile.
+    vertical_button_frame = tk.Frame(main_window, background='white')
+
+    # Create object to easily reference its method and fields(e.g., SSID name)
+    system_wifi_connection = SystemWifiConnection(main_window)
+    # Recent signal strength of every interface, sampled on every check of the connection.
+    signal_sampler = SignalSampler(show_signal, capacity=settings.SIGNAL_HISTORY_SIZE)
+    connection_monitor = ConnectionMonitor(system_wifi_connection, tasks, show_network,
+                                           interfaces_callback=signal_sampler.sample,
+                                           profiler=action_profiler)
+
+    # Drop-down list of Wi-Fi interfaces (only displayed if there are more than one)
+    interface_combo = tk.ttk.Combobox(top_horizontal_frame, state="readonly", width=14)
+    interface_combo.bind("<<ComboboxSelected>>", select_interface)
+
+    # Displays the heading(title)
+    heading_label = tk.Label(top_horizontal_frame, text="Current Network: ",
+                             font=("Playfair Display", 13, "bold"))
+
+    # Button for disconnection or refresh
+    refresh_disconnect_button = tk.ttk.Button(top_horizontal_frame, text="Refresh",
+                                              style='TButton', command=find_network)
+
+    # Displays network name
+    current_network_label = tk.Label(top_horizontal_frame, text="Searching\u2026",
+                                     foreground="grey", font=("Playfair Display", 13, "bold"))
+
+    # Recent signal strength of the network, click to export it as CSV.
+    signal_sparkline = Sparkline(top_horizontal_frame, cursor="hand2")
+    signal_label = tk.Label(top_horizontal_frame, text="", foreground="grey",
+                            font=("Calibri", 10))
+    signal_sparkline.bind("<Button-1>", export_signal_history)
+
+    # packing
+    heading_label.pack(padx=10, pady=10, side=tk.LEFT)
+    current_network_label.pack(padx=10, pady=10, side=tk.LEFT)
+    signal_sparkline.pack(padx=(0, 5), pady=10, side=tk.LEFT)
+    signal_label.pack(padx=(0, 10), pady=10, side=tk.LEFT)
+    refresh_disconnect_button.pack(padx=10, pady=10, side=tk.LEFT)
+    connection_monitor.start()
+
+    # Defining and packing buttons for frame2
+    refresh_button = tk.ttk.Button(vertical_button_frame,
+                                   text="Refresh List", style='TButton',
+                                   cursor="hand2", command=refresh_treeview)
+
+    delete_button = tk.ttk.Button(vertical_button_frame,
+                                  text="Delete WiFi", style='TButton',
+                                  cursor="hand2", command=delete_profile)
+
+    add_profile_button = tk.ttk.Button(vertical_button_frame,
+                                       text="Add Profile", style='TButton',
+                                       cursor="hand2", command=add_profile)
+
+    # Creating TreeView and packing it to the frame2
+    wdb = WifiDisplayBox(app_path, tree_view_frame, tasks, profiler=action_profiler,
+                         batch_tasks=batch_tasks)
+    nearby = NearbyNetworksBox(nearby_frame, tasks, NetworkScanner(ttl=settings.SCAN_TTL),
+                               wdb.saved_ssids, interval=settings.SCAN_INTERVAL,
+                               analyser=ChannelAnalyser(window=settings.CHANNEL_WINDOW))
+    notebook.bind("<<NotebookTabChanged>>", tab_changed)
+
+    # Packing all three buttons( refresh, delete, add_profile)
+    refresh_button.pack(side=tk.TOP, pady=25, padx=10, anchor="center")
+    delete_button.pack(side=tk.TOP, pady=25, padx=10, anchor="center")
+    add_profile_button.pack(side=tk.TOP, pady=25, padx=10, anchor="center")
+
+    # Packing frame1, frame2 and frame3
+
+    top_horizontal_frame.grid(row=0, column=0, columnspan=2, sticky='nsew')
+    vertical_button_frame.grid(row=1, column=1, sticky='nsew')
+    notebook.grid(row=1, column=0, sticky='nsew')
+    main_window.grid_columnconfigure(0, weight=1)
+    main_window.grid_rowconfigure(1, weight=1)
+
+    main_window.protocol("WM_DELETE_WINDOW", on_exiting)
+    main_window.bind("<Expose>", first_paint)
+    main_window.mainloop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+""" This module runs slow work (like netsh commands) on a small pool of worker threads so
+the Tk mainloop never blocks. Tkinter widgets must only be touched from the thread which
+runs the mainloop, so the result of every task is put into a queue by the worker thread
+and the queue is emptied on the Tk thread using after(), from where the callbacks are
+called. Work done on a worker thread and every callback are recorded as tracing spans.
+An exception raised by a callback is reported like in any other Tk callback, and the
+exception of a task which has no error_callback is logged.
+"""
+
+import logging
+import queue
+import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
+
+from windows_wifi_manager import tracing
+
+LOGGER = logging.getLogger(__name__)
+
+
+class BackgroundTasks:
+    """ Bounded pool of worker threads whose results are handed over to the Tk thread."""
+
+    def __init__(self, widget, max_workers=2, poll_interval=50):
+        """ widget is any Tk widget used to schedule after() calls, max_workers is the
+        maximum number of threads and poll_interval is in milliseconds.
+        """
+
+        self.widget = widget
+        self.poll_interval = poll_interval
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.results = queue.Queue()
+        self.pending = set()
+        self._polling = False
+
+    def submit(self, function, *args, callback=None, error_callback=None):
+        """ Run function(*args) on a worker thread. When it finishes, callback(result) or
+        error_callback(exception) is called on the Tk thread. Return the Future object
+        which can be cancelled, in that case none of the callbacks is called.
+        """
+
+        name = _name(function)
+        future = self.executor.submit(tracing.traced(name, "task")(function), *args)
+        self.pending.add(future)
+        future.add_done_callback(
+            lambda done: self.results.put((done, name, callback, error_callback)))
+        self._schedule()
+        return future
+
+    def _schedule(self):
+        """ Start emptying the queue of results, if it is not already done."""
+
+        if not self._polling:
+            self._polling = True
+            try:
+                self.widget.after(self.poll_interval, self._poll)
+            except tk.TclError:  # widget is already destroyed
+                self._polling = False
+
+    def _poll(self):
+        """ Call the callbacks of finished tasks (runs on the Tk thread)."""
+
+        self._polling = False
+        try:
+            while True:
+                try:
+                    future, name, callback, error_callback = self.results.get_nowait()
+                except queue.Empty:
+                    break
+
+                self.pending.discard(future)
+                if future.cancelled():
+                    continue
+                # A failing callback must not stop the callbacks of the other tasks.
+                try:
+                    self._dispatch(future, name, callback, error_callback)
+                except Exception as error:
+                    self._report(error)
+        finally:
+            if self.pending:
+                self._schedule()
+
+    def _dispatch(self, future, name, callback, error_callback):
+        """ Call the callback of the finished task (name is the name of its function)."""
+
+        error = future.exception()
+        if error is None:
+            if callback is not None:
+                with tracing.span(_name(callback), "ui"):
+                    callback(future.result())
+        elif error_callback is not None:
+            with tracing.span(_name(error_callback), "ui"):
+                error_callback(error)
+        else:
+            LOGGER.error("Task %s failed", name, exc_info=error)
+
+    def _report(self, error):
+        """ Report the exception raised by a callback in the same way as Tk does."""
+
+        try:
+            root = self.widget.nametowidget(".")
+            root.report_callback_exception(type(error), error, error.__traceback__)
+        except tk.TclError:  # widget is already destroyed
+            LOGGER.error("Callback failed", exc_info=error)
+
+    def shutdown(self):
+        """ Cancel the tasks which are not started yet and stop the worker threads."""
+
+        for future in list(self.pending):
+            future.cancel()
+        self.executor.shutdown(wait=False)
+
+
+def _name(function):
+    """ Return the name of the span of the function (bound method, function or lambda)."""
+
+    return getattr(function, "__qualname__", None) or repr(function)
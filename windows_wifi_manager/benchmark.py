@@ -0,0 +1,1565 @@
+""" This module is used to load-test the parsing and caching code of the app on any OS.
+It generates the output of 'netsh' for a large number of synthetic Wi-Fi profiles,
+installs a ReplayRunner (so no real command is executed) and measures how long the
+different operations of WifiInformation takes and how long each (replayed) netsh call
+took. A transcript recorded on a real system can also be replayed using --transcript.
+It also measures the import time of the entry point of the App and fails (exit status 1)
+if it is more than the budget or if a module which should be imported on first use is
+imported at start up.
+
+    python -m windows_wifi_manager.benchmark details --profiles 5000
+    python -m windows_wifi_manager.benchmark importtime --budget 50
+    python -m windows_wifi_manager.benchmark xml --profiles 2000
+    python -m windows_wifi_manager.benchmark netsh --profiles 5000
+    python -m windows_wifi_manager.benchmark session --profiles 100
+    python -m windows_wifi_manager.benchmark import --profiles 500
+    python -m windows_wifi_manager.benchmark backup --profiles 500
+    python -m windows_wifi_manager.benchmark scan --networks 200
+    python -m windows_wifi_manager.benchmark signal --samples 100000
+    python -m windows_wifi_manager.benchmark channels --scans 1000
+    python -m windows_wifi_manager.benchmark trace --calls 100000
+    python -m windows_wifi_manager.benchmark profile --actions 50
+    python -m windows_wifi_manager.benchmark treeview --profiles 5000
+
+The 'session' benchmark compares one-shot netsh calls with a NetshSession. On a machine
+which is not running Windows, a stand-in for netsh ('netsh-standin' subcommand, which
+answers from a transcript like netsh does, interactively or one-shot) is used.
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import re
+import shlex
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from io import BytesIO
+from itertools import groupby
+from xml.sax.saxutils import escape
+
+from windows_wifi_manager import command_runner
+
+# Modules which are only used by some actions of the App and must not be imported at start up.
+DEFERRED_MODULES = ["requests", "appdirs", "xml.dom.minidom", "webbrowser",
+                    "xml.etree.ElementTree", "http.server", "cProfile", "pstats"]
+AUTHENTICATIONS = ["WPA2-Personal", "WPA-Personal", "Open"]
+SPECIAL_NAMES = ["Redm\"i=", "abc:>gh=", "café ☕", "\U0001F4F6 Hotspot",
+                 "Сеть", "name with  spaces"]
+
+
+def synthetic_profiles(count, seed=0):
+    """ Return list of synthetic profiles in the form of [(name, authentication, key),].
+    Some of the names contain unicode, emoji and symbols which are hard for the shell.
+    """
+
+    generator = random.Random(seed)
+    profiles = []
+    for index in range(count):
+        if index < len(SPECIAL_NAMES):
+            name = SPECIAL_NAMES[index]
+        else:
+            name = "Network-%05d-%s" % (index, generator.choice(["Home", "Office", "Cafe"]))
+        authentication = generator.choice(AUTHENTICATIONS)
+        key = None if authentication == "Open" else "key-%08x" % generator.getrandbits(32)
+        profiles.append((name, authentication, key))
+    return profiles
+
+
+def profile_list_output(profiles):
+    """ Return output of 'netsh wlan show profile' for the given profiles."""
+
+    lines = ["", "Profiles on interface Wi-Fi:", "", "Group policy profiles (read only)",
+             "---------------------------------", "    <None>", "", "User profiles",
+             "-------------"]
+    lines.extend("    All User Profile     : " + name for name, _, _ in profiles)
+    return "\n".join(lines) + "\n"
+
+
+def profile_detail_output(name, authentication, key):
+    """ Return the whole output of 'netsh wlan show profile name=... key=clear' for the
+    given profile (the App picks the required fields itself).
+    """
+
+    lines = ["", "Profile " + name + " on interface Wi-Fi:",
+             "=======================================================================", "",
+             "Applied: All User Profile", "", "Profile information",
+             "-------------------",
+             "    Version                : 1",
+             "    Type                   : Wireless LAN",
+             "    Name                   : " + name,
+             "    Control options        : ",
+             "        Connection mode    : Connect automatically",
+             "        Network broadcast  : Connect only if this network is broadcasting",
+             "        AutoSwitch         : Do not switch to other networks",
+             "        MAC Randomization  : Disabled", "",
+             "Connectivity settings", "---------------------",
+             "    Number of SSIDs        : 1",
+             "    SSID name              : \"" + name + "\"",
+             "    Network type           : Infrastructure",
+             "    Radio type             : [ Any Radio Type ]",
+             "    Vendor extension          : Not present", "",
+             "Security settings", "-----------------",
+             "    Authentication         : " + authentication,
+             "    Cipher                 : " + ("None" if key is None else "CCMP")]
+    if key is None:
+        lines.append("    Security key           : Absent")
+    else:
+        lines.append("    Security key           : Present")
+        lines.append("    Key Content            : " + key)
+    lines.extend(["", "Cost settings", "-------------",
+                  "    Cost                   : Unrestricted",
+                  "    Congested              : No"])
+    return "\n".join(lines) + "\n"
+
+
+def profile_xml(name, authentication, key):
+    """ Return the XML of the profile as exported by 'netsh wlan export profile key=clear'."""
+
+    name = escape(name)
+    auth = {"WPA2-Personal": "WPA2PSK", "WPA-Personal": "WPAPSK"}.get(authentication, "open")
+    shared_key = ""
+    if key is not None:
+        shared_key = "<sharedKey><keyType>passPhrase</keyType><protected>false</protected>" \
+                     "<keyMaterial>" + escape(key) + "</keyMaterial></sharedKey>"
+    return ('<?xml version="1.0"?>\n'
+            '<WLANProfile xmlns="http://www.microsoft.com/networking/WLAN/profile/v1">'
+            '<name>' + name + '</name><SSIDConfig><SSID><hex>00</hex><name>' + name +
+            '</name></SSID></SSIDConfig><connectionType>ESS</connectionType>'
+            '<connectionMode>auto</connectionMode><MSM><security><authEncryption>'
+            '<authentication>' + auth + '</authentication><encryption>' +
+            ("none" if key is None else "AES") + '</encryption><useOneX>false</useOneX>'
+            '</authEncryption>' + shared_key + '</security></MSM>'
+            '<MacRandomization xmlns="http://www.microsoft.com/networking/WLAN/profile/v3">'
+            '<enableRandomization>false</enableRandomization>'
+            '<randomizationSeed>1234567890</randomizationSeed></MacRandomization>'
+            '</WLANProfile>')
+
+
+def write_exported_profiles(folder, profiles):
+    """ Write the XML file of every profile to the folder, like netsh export does."""
+
+    for index, (name, authentication, key) in enumerate(profiles):
+        # netsh replaces characters which are not allowed in a file name.
+        file_name = "Wi-Fi-" + "".join("_" if char in '\\/:*?"<>|' else char for char in name)
+        if os.path.exists(os.path.join(folder, file_name + ".xml")):
+            file_name += "-%d" % index
+        with open(os.path.join(folder, file_name + ".xml"), "w", encoding="utf-8") as file:
+            file.write(profile_xml(name, authentication, key))
+
+
+def synthetic_transcript(profiles, export_folder=None):
+    """ Return ReplayRunner transcript (dictionary) for the given profiles. If
+    export_folder is given, the export command succeeds (XML files are expected to be
+    written by write_exported_profiles()), otherwise it is not recorded and fails.
+    """
+
+    key = command_runner.command_key
+    transcript = {key(["netsh", "wlan", "show", "profile"]): {
+        "returncode": 0, "stdout": profile_list_output(profiles)}}
+    if export_folder is not None:
+        command = ["netsh", "wlan", "export", "profile", "key=clear", "folder=" + export_folder]
+        transcript[key(command)] = {"returncode": 0, "stdout": ""}
+    for name, authentication, profile_key in profiles:
+        command = ["netsh", "wlan", "show", "profile", "name=" + name, "key=clear"]
+        transcript[key(command)] = {
+            "returncode": 0, "stdout": profile_detail_output(name, authentication, profile_key)}
+    return transcript
+
+
+def timed(results, label, function, *args):
+    """ Call the function, save time taken by it in results and return its result."""
+
+    start = time.perf_counter()
+    value = function(*args)
+    results.append((label, time.perf_counter() - start))
+    return value
+
+
+def bench_wifi_information(app_path):
+    """ Measure the operations of WifiInformation using the installed runner."""
+
+    from windows_wifi_manager.wifi_data import WifiInformation
+
+    results = []
+    information = timed(results, "WifiInformation()", WifiInformation, app_path)
+    names = [item[0] for item in timed(results, "retrieving_list_of_wifi",
+                                       information.retrieving_list_of_wifi)]
+
+    def resolve_all():
+        for name in names:
+            information.wifi_details(name)
+
+    timed(results, "wifi_details x %d (cold)" % len(names), resolve_all)
+    timed(results, "wifi_details x %d (warm)" % len(names), resolve_all)
+    return results
+
+
+def print_results(results):
+    """ Print the measured operations and the per command timings."""
+
+    for label, seconds in results:
+        print("%-45s %10.2f ms" % (label, seconds * 1000))
+
+    summary = command_runner.timings.summary()
+    calls = sum(item["calls"] for item in summary.values())
+    total = sum(item["total"] for item in summary.values())
+    print("\n%d netsh calls (%d distinct), %.2f ms total" % (calls, len(summary), total * 1000))
+    slowest = sorted(summary.items(), key=lambda item: item[1]["max"], reverse=True)[:5]
+    for command, item in slowest:
+        print("  max %8.3f ms  mean %8.3f ms  x%-5d %s" % (
+            item["max"] * 1000, item["mean"] * 1000, item["calls"], command[:60]))
+
+
+def measure_import(module):
+    """ Import the module in a new interpreter with '-X importtime' and return its
+    cumulative import time (in seconds) and the set of all modules it imported.
+    """
+
+    output = subprocess.run([sys.executable, "-X", "importtime", "-c", "import " + module],
+                            capture_output=True, text=True, check=True)
+    cumulative = 0
+    imported = set()
+    for line in output.stderr.splitlines():
+        # Line is in the form of 'import time: self [us] | cumulative | imported package'
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        fields = line[len("import time:"):].split("|")
+        if not fields[1].strip().isdigit():
+            continue  # Heading line.
+        name = fields[2].strip()
+        imported.add(name)
+        if name == module:
+            cumulative = int(fields[1])
+    return cumulative / 1000000, imported
+
+
+def run_importtime(args):
+    """ Measure import time of the entry point and check it against the budget."""
+
+    # Best of a few runs, so a single slow run (e.g. disk cache) doesn't fail the check.
+    results = [measure_import(args.module) for _ in range(args.repeat)]
+    seconds = min(result[0] for result in results)
+    imported = results[0][1]
+    print("%s imported in %.1f ms (budget %d ms)" % (args.module, seconds * 1000, args.budget))
+
+    failed = False
+    eager = [name for name in DEFERRED_MODULES if name in imported]
+    if eager:
+        print("Imported at start up, should be imported on first use: " + ", ".join(eager))
+        failed = True
+    if seconds * 1000 > args.budget:
+        print("Import time is over the budget.")
+        failed = True
+    return 1 if failed else 0
+
+
+def parse_with_elementtree(path):
+    """ Reference path the profile reader is compared with: build the whole tree, find
+    the namespace with a regex and search name, SSID, authentication and key.
+    """
+
+    import xml.etree.ElementTree as etree
+
+    tree = etree.parse(path)
+    namespace = re.match(r"{[^\s\n\r]+}", tree.getroot().tag).group()
+    name = tree.getroot().find(namespace + "name").text
+    ssid = tree.find(".//" + namespace + "SSID").find(".//" + namespace + "name").text
+    authentication = tree.find(".//" + namespace + "authentication").text
+    key = None
+    if authentication != "open":
+        key = tree.find(".//" + namespace + "keyMaterial").text
+    return name, ssid, authentication, key
+
+
+def run_xml(args):
+    """ Compare the streaming profile reader with the ElementTree reference path over a
+    corpus of generated profile XML files.
+    """
+
+    from windows_wifi_manager.profile_xml import read_profile
+
+    with tempfile.TemporaryDirectory() as folder:
+        write_exported_profiles(folder, synthetic_profiles(args.profiles))
+        paths = [os.path.join(folder, name) for name in sorted(os.listdir(folder))]
+
+        timings = {}
+        results = {}
+        for label, parse in (("ElementTree parse + find", parse_with_elementtree),
+                             ("profile_xml.read_profile", read_profile)):
+            best = None
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                results[label] = [tuple(parse(path)) for path in paths]
+                seconds = time.perf_counter() - start
+                best = seconds if best is None else min(best, seconds)
+            timings[label] = best
+            print("%-30s %10.2f ms  (%d files)" % (label, best * 1000, len(paths)))
+
+    first, second = results.values()
+    print("speed up: %.2fx" % (timings["ElementTree parse + find"] /
+                               timings["profile_xml.read_profile"]))
+    if first != second:
+        print("Results are different!")
+        return 1
+    return 0
+
+
+def interfaces_output(count, seed=0):
+    """ Return output of 'netsh wlan show interfaces' for count interfaces, every second
+    one is connected to one of the synthetic profiles.
+    """
+
+    generator = random.Random(seed)
+    profiles = synthetic_profiles(count, seed)
+    lines = ["", "There are %d interfaces on the system: " % count, ""]
+    for index, (name, _, _) in enumerate(profiles):
+        lines.extend(["    Name                   : Wi-Fi %d" % (index + 1),
+                      "    Description            : Synthetic Wireless Adapter",
+                      "    Physical address       : 00:11:22:33:44:%02x" % (index % 256)])
+        if index % 2:
+            lines.append("    State                  : disconnected")
+        else:
+            lines.extend(["    State                  : connected",
+                          "    SSID                   : " + name,
+                          "    AP BSSID               : aa:bb:cc:dd:ee:%02x" % (index % 256),
+                          "    Signal                 : %d%%" % generator.randint(1, 100),
+                          "    Channel                : %d" % generator.choice([1, 6, 11, 36]),
+                          "    Receive rate (Mbps)    : 866.7",
+                          "    Transmit rate (Mbps)   : 433",
+                          "    Profile                : " + name])
+        lines.append("")
+    return "\n".join(lines)
+
+
+def fuzz_names(count, seed=0):
+    """ Return count random profile names made of letters, digits, spaces, symbols used
+    by netsh (colon, quotes, '<', '>') and characters outside of the BMP (emoji).
+    """
+
+    generator = random.Random(seed)
+    alphabet = "abcXYZ019 :;\"'<>()-=_é☕Сеть\U0001F4F6\U0001F600"
+    names = []
+    for _ in range(count):
+        name = "".join(generator.choice(alphabet) for _ in range(generator.randint(1, 32)))
+        names.append(name.strip() or "x")  # netsh never shows leading or trailing spaces.
+    return names
+
+
+def parse_with_regex(list_output, detail_outputs):
+    """ Reference path the netsh parser is compared with: a separate re.findall() scan with
+    its own pattern for every field, as the App did before.
+    """
+
+    names = re.findall(r"[\n\r-<>():].*All User Profile\s*: ([^\n\r]*)", list_output)
+    details = []
+    for output in detail_outputs:
+        name = re.findall(r"[\n\r-<>():].*Name\s*: ([^\n\r]*)", output)[0]
+        authentication = re.findall(r"[\n\r-<>():].*Authentication\s*: ([^\n\r]*)",
+                                    output)[0]
+        key = None
+        if authentication != "Open":
+            key = re.findall(r"[\n\r-<>():].*Key Content\s*: ([^\n\r]*)", output)[0]
+        details.append((name, authentication, key))
+    return names, details
+
+
+def parse_with_netsh_parser(list_output, detail_outputs):
+    """ Same as parse_with_regex() using the netsh_parser module."""
+
+    from windows_wifi_manager import netsh_parser
+
+    names = netsh_parser.parse_profile_names(list_output)
+    details = []
+    for output in detail_outputs:
+        profile = netsh_parser.parse_profile_details(output)[0]
+        details.append((profile["name"], profile["authentication"], profile["key"]))
+    return names, details
+
+
+def run_netsh(args):
+    """ Check the netsh parser with random names and large outputs, then compare it with
+    the regular expressions used before.
+    """
+
+    from windows_wifi_manager import netsh_parser
+
+    failed = False
+    names = fuzz_names(args.fuzz)
+    profiles = [(name, "WPA2-Personal", "k:" + name) for name in names]
+    if netsh_parser.parse_profile_names(profile_list_output(profiles)) != names:
+        print("Profile names are not parsed correctly!")
+        failed = True
+    for name, authentication, key in profiles:
+        for newline in ("\n", "\r\n"):
+            output = profile_detail_output(name, authentication, key).replace("\n", newline)
+            expected = {"name": name, "ssid": name, "authentication": authentication,
+                        "key": key}
+            if netsh_parser.parse_profile_details(output) != [expected]:
+                print("Details are not parsed correctly: %r" % name)
+                failed = True
+    interfaces = netsh_parser.parse_interfaces(interfaces_output(args.interfaces))
+    if len(interfaces) != args.interfaces or interfaces[0].profile != SPECIAL_NAMES[0] or \
+            interfaces[0].bssid != "aa:bb:cc:dd:ee:00" or interfaces[1].ssid is not None:
+        print("Interfaces are not parsed correctly!")
+        failed = True
+    print("fuzz: %d names, %d interfaces checked" % (len(names), len(interfaces)))
+
+    profiles = synthetic_profiles(args.profiles)
+    list_output = profile_list_output(profiles)
+    detail_outputs = [profile_detail_output(*profile) for profile in profiles]
+    timings = {}
+    results = {}
+    for label, parse in (("re.findall per field", parse_with_regex),
+                         ("netsh_parser", parse_with_netsh_parser)):
+        best = None
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            results[label] = parse(list_output, detail_outputs)
+            seconds = time.perf_counter() - start
+            best = seconds if best is None else min(best, seconds)
+        timings[label] = best
+        print("%-30s %10.2f ms  (%d profiles)" % (label, best * 1000, len(profiles)))
+    print("speed up: %.2fx" % (timings["re.findall per field"] / timings["netsh_parser"]))
+
+    first, second = results.values()
+    if first != second:
+        print("Results are different!")
+        failed = True
+    return 1 if failed else 0
+
+
+def run_standin(args):
+    """ Act like netsh using the outputs of the transcript. With arguments, print the
+    output of that single command. Without arguments, read commands from stdin like the
+    interactive netsh does, until the end of stdin.
+    """
+
+    with open(args.transcript, "r", encoding="utf-8") as file:
+        transcript = json.load(file)
+    time.sleep(args.startup)  # Time taken by netsh to start.
+
+    def answer(arguments, line):
+        """ Print the output of the command, return its returncode."""
+
+        output = transcript.get(command_runner.command_key(["netsh"] + arguments))
+        if isinstance(output, list):
+            output = output[0]
+        if output is None:
+            print("The following command was not found: " + line + ".")
+            return 1
+        sys.stdout.write(output.get("stdout", ""))
+        return output.get("returncode", 0)
+
+    if args.arguments:
+        return answer(args.arguments, " ".join(args.arguments))
+
+    sys.stdout.write("netsh>")
+    sys.stdout.flush()
+    for line in sys.stdin:
+        line = line.strip()
+        if line:
+            # netsh splits the line at spaces, except inside quotes, like name="My Wi-Fi".
+            lexer = shlex.shlex(line, posix=True)
+            lexer.whitespace_split = True
+            lexer.escape = ""
+            answer(list(lexer), line)
+        sys.stdout.write("netsh>")
+        sys.stdout.flush()
+    return 0
+
+
+class StandInRunner(command_runner.SubprocessRunner):
+    """ Run the program instead of netsh (one-shot), with the same arguments."""
+
+    def __init__(self, program):
+        self.program = program
+
+    def run(self, command):
+        return super().run(self.program + command[1:])
+
+
+def run_session(args):
+    """ Compare one-shot netsh calls with a NetshSession (using the netsh stand-in
+    unless --real is given) and check that both give the same outputs.
+    """
+
+    from windows_wifi_manager.netsh_session import NetshSession
+
+    profiles = synthetic_profiles(args.profiles)
+    commands = [["netsh", "wlan", "show", "profile", "name=" + name, "key=clear"]
+                for name, _, _ in profiles]
+    commands.append(["netsh", "wlan", "show", "interfaces"])
+    commands.append(["netsh", "wlan", "show", "profile"])
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        if args.real:
+            one_shot = command_runner.SubprocessRunner()
+            session = NetshSession()
+        else:
+            transcript = synthetic_transcript(profiles)
+            transcript[command_runner.command_key(commands[-2])] = {
+                "returncode": 0, "stdout": interfaces_output(2)}
+            path = os.path.join(temp_dir, "transcript.json")
+            with open(path, "w", encoding="utf-8") as file:
+                json.dump(transcript, file, ensure_ascii=False)
+            program = [sys.executable, "-m", "windows_wifi_manager.benchmark", "netsh-standin",
+                       "--transcript", path, "--startup", str(args.startup)]
+            one_shot = StandInRunner(program)
+            session = NetshSession(program=program, fallback=one_shot)
+
+        outputs = {}
+        for label, runner in (("one-shot", one_shot), ("session", session)):
+            start = time.perf_counter()
+            outputs[label] = [runner.run(command).stdout for command in commands]
+            seconds = time.perf_counter() - start
+            outputs[label + " seconds"] = seconds
+            print("%-10s %10.2f ms  %8.2f ms per call  (%d calls)"
+                  % (label, seconds * 1000, seconds * 1000 / len(commands), len(commands)))
+
+        # The session must start a new netsh if the running one dies.
+        if session.process is not None:
+            session.process.kill()
+            session.process.wait()
+        restarted = session.run(commands[-1]).stdout == outputs["one-shot"][-1]
+        print("restarted after kill: %s (restarts: %d)" % (restarted, session.restarts))
+        session.close()
+
+    print("speed up: %.2fx" % (outputs["one-shot seconds"] / outputs["session seconds"]))
+    if outputs["one-shot"] != outputs["session"] or not restarted:
+        print("Outputs are different!")
+        return 1
+    return 0
+
+
+def render_with_minidom(row, template_path):
+    """ Reference path the profile template is compared with (only for time, without
+    lxml its sharedKey element is not in the profile namespace): parse the sample
+    profile, fill the details and pretty print it through minidom, as 'Add Profile' did
+    before.
+    """
+
+    import xml.etree.ElementTree as etree
+    from xml.dom import minidom
+
+    root_tree = etree.parse(template_path).getroot()
+    root_tree[0].text = row.ssid
+    root_tree[1][0][0].text = row.ssid
+    root_tree[3].text = row.connection_mode
+    security = root_tree[4][0]
+    security[0][0].text = row.authentication
+    security[0][1].text = row.encryption
+    if row.authentication != "open":
+        etree.SubElement(security, "sharedKey")
+        etree.SubElement(security[1], "keyType").text = "passPhrase"
+        etree.SubElement(security[1], "protected").text = "false"
+        etree.SubElement(security[1], "keyMaterial").text = row.key
+    return minidom.parseString(etree.tostring(root_tree)).toprettyxml(indent="        ")
+
+
+class AddProfileRunner:
+    """ Runner which accepts every 'netsh wlan add profile' after latency seconds, if
+    the XML file is a valid profile. Records the profiles which are added.
+    """
+
+    def __init__(self, latency):
+        self.latency = latency
+        self.added = []
+
+    def run(self, command):
+        from windows_wifi_manager.profile_xml import read_profile
+
+        time.sleep(self.latency)
+        try:
+            profile = read_profile(command[-1][len("filename="):])
+        except Exception as error:
+            return subprocess.CompletedProcess(command, 1, "", str(error))
+        self.added.append(tuple(profile))
+        return subprocess.CompletedProcess(command, 0, "Profile is added on the system.", "")
+
+
+def run_import(args):
+    """ Compare the profile template with the minidom reference path, check that the
+    generated XMLs are read back correctly and measure add_profiles() with 1 and more
+    workers (every add takes --latency milliseconds).
+    """
+
+    from windows_wifi_manager import profile_import
+    from windows_wifi_manager.profile_xml import read_profile
+
+    auth = {"WPA2-Personal": "WPA2PSK", "WPA-Personal": "WPAPSK", "Open": "open"}
+    rows = [{"ssid": name, "authentication": auth[authentication],
+             "key": "" if key is None else key + "-passphrase"}
+            for name, authentication, key in synthetic_profiles(args.profiles)]
+    profile_rows = [profile_import.normalise_row(row) for row in rows]
+    expected = [(row.ssid, row.ssid, row.authentication,
+                 None if row.authentication == "open" else row.key) for row in profile_rows]
+
+    failed = False
+    timings = {}
+    template = profile_import.ProfileTemplate()
+    for label, render in (
+            ("ElementTree + minidom", lambda row: render_with_minidom(
+                row, profile_import.TEMPLATE_PATH)),
+            ("ProfileTemplate.render", template.render)):
+        start = time.perf_counter()
+        documents = [render(row) for row in profile_rows]
+        timings[label] = time.perf_counter() - start
+        print("%-30s %10.2f ms  (%d profiles)" % (label, timings[label] * 1000, len(rows)))
+    read = [tuple(read_profile(BytesIO(document.encode("utf-8")))) for document in documents]
+    if read != expected:
+        print("Generated profiles are not read back correctly!")
+        failed = True
+    print("speed up: %.2fx" % (timings["ElementTree + minidom"] /
+                               timings["ProfileTemplate.render"]))
+
+    with tempfile.TemporaryDirectory() as folder:
+        for workers in (1, args.workers):
+            runner = AddProfileRunner(args.latency / 1000)
+            previous = command_runner.set_runner(runner)
+            try:
+                start = time.perf_counter()
+                results = profile_import.add_profiles(rows, folder, max_workers=workers)
+                seconds = time.perf_counter() - start
+            finally:
+                command_runner.set_runner(previous)
+            print("add_profiles, %d workers %13.2f ms  (%d added)"
+                  % (workers, seconds * 1000, sum(result["added"] for result in results)))
+            if sorted(runner.added) != sorted(expected) or \
+                    not all(result["added"] for result in results):
+                print("Profiles are not added correctly!")
+                failed = True
+    return 1 if failed else 0
+
+
+class ProfileStoreRunner:
+    """ Runner which acts like the profiles of a system: lists them, exports them to a
+    folder and adds (or replaces) a profile from an XML file after latency seconds. The
+    exported file of a profile is exactly the file it was added from.
+    """
+
+    def __init__(self, profiles, latency):
+        self.latency = latency
+        self.profiles = {name: profile_xml(name, authentication, key).encode("utf-8")
+                         for name, authentication, key in profiles}
+        self.lock = threading.Lock()
+
+    def run(self, command):
+        from windows_wifi_manager.profile_xml import read_profile
+
+        if command[1:4] == ["wlan", "show", "profile"] and len(command) == 4:
+            return subprocess.CompletedProcess(command, 0, profile_list_output(
+                [(name, None, None) for name in self.profiles]), "")
+        if command[1:4] == ["wlan", "export", "profile"]:
+            with self.lock:
+                profiles = list(self.profiles.items())
+            folder = command[-1][len("folder="):]
+            for index, (name, data) in enumerate(profiles):
+                file_name = "Wi-Fi-" + "".join("_" if char in '\\/:*?"<>|' else char
+                                               for char in name) + "-%d.xml" % index
+                with open(os.path.join(folder, file_name), "wb") as file:
+                    file.write(data)
+            return subprocess.CompletedProcess(command, 0, "", "")
+        if command[1:4] == ["wlan", "add", "profile"]:
+            time.sleep(self.latency)
+            with open(command[-1][len("filename="):], "rb") as file:
+                data = file.read()
+            with self.lock:
+                self.profiles[read_profile(BytesIO(data)).name] = data
+            return subprocess.CompletedProcess(command, 0, "Profile is added on the system.", "")
+        return subprocess.CompletedProcess(command, 1, "", "Not supported by the stand-in")
+
+
+def run_backup(args):
+    """ Back up a system of synthetic profiles, remove or change some of them and
+    measure restore (which must skip the unchanged ones) with 1 and more workers, then
+    compare restore of an unchanged system with and without skipping identical profiles.
+    """
+
+    from windows_wifi_manager import profile_backup
+    from windows_wifi_manager.wifi_data import WifiInformation
+
+    profiles = synthetic_profiles(args.profiles)
+    failed = False
+    with tempfile.TemporaryDirectory() as temp_dir:
+        app_path = os.path.join(temp_dir, "app")
+        os.mkdir(app_path)
+        archive = os.path.join(temp_dir, "profiles.zip")
+        runner = ProfileStoreRunner(profiles, args.latency / 1000)
+        original = dict(runner.profiles)
+        previous = command_runner.set_runner(runner)
+        try:
+            information = WifiInformation(app_path)
+            start = time.perf_counter()
+            manifest = profile_backup.create_backup(information, archive)
+            print("create_backup %25.2f ms  (%d profiles, %d bytes)" % (
+                (time.perf_counter() - start) * 1000, len(manifest["profiles"]),
+                os.path.getsize(archive)))
+            if len(manifest["profiles"]) != len(profiles):
+                print("Backup does not have every profile!")
+                failed = True
+
+            for workers in (1, args.workers):
+                # Half of the profiles are removed and a quarter changed, rest is same.
+                runner.profiles = dict(original)
+                for index, (name, authentication, key) in enumerate(profiles):
+                    if index % 2 == 0:
+                        del runner.profiles[name]
+                    elif index % 4 == 1:
+                        runner.profiles[name] = profile_xml(
+                            name, authentication, "changed-key").encode("utf-8")
+                changed = len(profiles) - len(runner.profiles) + sum(
+                    index % 4 == 1 for index in range(len(profiles)))
+                start = time.perf_counter()
+                results = profile_backup.restore_backup(information, archive, workers)
+                seconds = time.perf_counter() - start
+                restored = sum(result["status"] == "restored" for result in results)
+                print("restore_backup, %d workers %13.2f ms  (%d restored, %d skipped)" % (
+                    workers, seconds * 1000, restored,
+                    sum(result["status"] == "skipped" for result in results)))
+                if runner.profiles != original or restored != changed:
+                    print("Profiles are not restored correctly!")
+                    failed = True
+
+            for label, force in (("restore unchanged, force", True),
+                                 ("restore unchanged, skip identical", False)):
+                start = time.perf_counter()
+                results = profile_backup.restore_backup(information, archive, args.workers,
+                                                        force)
+                print("%-33s %7.2f ms  (%d restored)" % (
+                    label, (time.perf_counter() - start) * 1000,
+                    sum(result["status"] == "restored" for result in results)))
+            information.cache.close()
+        finally:
+            command_runner.set_runner(previous)
+    return 1 if failed else 0
+
+
+def synthetic_networks(count, bssids, seed=0):
+    """ Return list of NetworkRecord of count networks with 1 to bssids access points
+    each, some of the networks are hidden (empty SSID).
+    """
+
+    from windows_wifi_manager.netsh_parser import NetworkRecord
+
+    generator = random.Random(seed)
+    names = fuzz_names(count, seed)
+    networks = []
+    for index in range(count):
+        ssid = "" if index % 17 == 5 else names[index]
+        authentication = generator.choice(["WPA2-Personal", "WPA3-Personal", "Open"])
+        encryption = "None" if authentication == "Open" else "CCMP"
+        for _ in range(generator.randint(1, bssids)):
+            bssid = ":".join("%02x" % generator.getrandbits(8) for _ in range(6))
+            channel = generator.choice([1, 6, 11, 36, 40, 44, 149])
+            networks.append(NetworkRecord("Wi-Fi", ssid, "Infrastructure", authentication,
+                                          encryption, bssid, generator.randint(1, 100),
+                                          "802.11ax", channel,
+                                          "2.4 GHz" if channel < 14 else "5 GHz"))
+    return networks
+
+
+def networks_text(networks):
+    """ Return output of 'netsh wlan show networks mode=bssid' which shows the networks
+    (list of NetworkRecord, access points of a network one after another).
+    """
+
+    lines = ["", "Interface name : Wi-Fi"]
+    number = 0
+    for fields, access_points in groupby(networks, lambda network: network[:5]):
+        number += 1
+        _, ssid, network_type, authentication, encryption = fields
+        lines.extend(["", "SSID %d : %s" % (number, ssid),
+                      "    Network type            : " + network_type,
+                      "    Authentication          : " + authentication,
+                      "    Encryption              : " + encryption])
+        for index, network in enumerate(access_points):
+            lines.extend(["    BSSID %d                 : %s" % (index + 1, network.bssid),
+                          "         Signal             : %d%%  " % network.signal,
+                          "         Radio type         : " + network.radio_type,
+                          "         Band               : " + network.band,
+                          "         Channel            : %d " % network.channel,
+                          "         Basic rates (Mbps) : 1 2 5.5 11",
+                          "         Other rates (Mbps) : 6 9 12 18 24 36 48 54"])
+    lines.insert(2, "There are %d networks currently visible." % number)
+    return "\n".join(lines) + "\n"
+
+
+def networks_output(count, bssids, seed=0):
+    """ Return output of 'netsh wlan show networks mode=bssid' with count networks of
+    1 to bssids access points each, and the list of NetworkRecord expected from it.
+    """
+
+    networks = synthetic_networks(count, bssids, seed)
+    return networks_text(networks), networks
+
+
+def run_scan(args):
+    """ Check parse_networks() with generated output, measure it and count the netsh
+    calls of a view which refreshes the list every --refresh seconds for a minute, with
+    and without the cache of NetworkScanner.
+    """
+
+    from windows_wifi_manager.netsh_parser import parse_networks
+    from windows_wifi_manager.network_scanner import NetworkScanner
+
+    output, expected = networks_output(args.networks, args.bssids)
+    failed = False
+    if parse_networks(output) != expected:
+        print("Nearby networks are not parsed correctly!")
+        failed = True
+    best = None
+    for _ in range(args.repeat):
+        start = time.perf_counter()
+        parse_networks(output)
+        seconds = time.perf_counter() - start
+        best = seconds if best is None else min(best, seconds)
+    print("parse_networks %24.2f ms  (%d networks, %d BSSIDs)" % (
+        best * 1000, args.networks, len(expected)))
+
+    runner = command_runner.ReplayRunner()
+    runner.add(command_runner.command_key(["netsh", "wlan", "show", "networks", "mode=bssid"]),
+               {"returncode": 0, "stdout": output})
+    previous = command_runner.set_runner(runner)
+    try:
+        for label, ttl in (("no cache", 0), ("ttl %gs" % args.ttl, args.ttl)):
+            now = [0.0]
+            scanner = NetworkScanner(ttl=ttl, clock=lambda: now[0])
+            start = time.perf_counter()
+            while now[0] < 60:
+                if len(scanner.scan()) != len(expected):
+                    failed = True
+                now[0] += args.refresh
+            print("refresh every %gs, %-10s %8.2f ms  (%d netsh calls)" % (
+                args.refresh, label, (time.perf_counter() - start) * 1000, scanner.scans))
+    finally:
+        command_runner.set_runner(previous)
+    return 1 if failed else 0
+
+
+def run_signal(args):
+    """ Add --samples samples to InterfaceHistory and to a list of tuples and compare the
+    memory used by them, check that the ring buffer keeps the last --capacity samples in
+    order and measure summary() and export_csv(). Samples of another network must
+    start a new history.
+    """
+
+    import tracemalloc
+    from collections import deque
+
+    from windows_wifi_manager.netsh_parser import InterfaceRecord
+    from windows_wifi_manager.signal_history import FIELDS, InterfaceHistory
+
+    generator = random.Random(0)
+    samples = []
+    for index in range(args.samples):
+        connected = generator.random() > 0.05
+        samples.append((index, InterfaceRecord(
+            "Wi-Fi", "connected" if connected else "disconnected", "Home", None,
+            generator.randint(1, 100) if connected else None, generator.choice([6, 36]),
+            generator.choice([144.4, 866.7]), generator.choice([144.4, 866.7]), "Home")))
+
+    failed = False
+    tracemalloc.start()
+    history = InterfaceHistory(args.capacity)
+    start = time.perf_counter()
+    for sample_time, interface in samples:
+        history.add(sample_time, interface)
+    seconds = time.perf_counter() - start
+    ring_memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    unbounded = [(sample_time,) + tuple(getattr(interface, field) for field in FIELDS)
+                 for sample_time, interface in samples]
+    list_memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print("InterfaceHistory.add x %d %13.2f ms" % (args.samples, seconds * 1000))
+    print("memory, ring buffer (%d samples) %10d bytes" % (args.capacity, ring_memory))
+    print("memory, list of every sample %12d bytes" % list_memory)
+
+    expected = deque(unbounded, maxlen=args.capacity)
+    if list(history.times.values()) != [row[0] for row in expected] or \
+            [value if value == value else None for value in history.values("signal")] != \
+            [row[1] for row in expected]:
+        print("Ring buffer does not have the last samples in order!")
+        failed = True
+
+    start = time.perf_counter()
+    for field in FIELDS:
+        history.summary(field)
+    print("summary of %d fields %20.2f ms" % (len(FIELDS), (time.perf_counter() - start) * 1000))
+    with tempfile.TemporaryDirectory() as folder:
+        start = time.perf_counter()
+        history.export_csv(os.path.join(folder, "signal.csv"))
+        print("export_csv %30.2f ms" % ((time.perf_counter() - start) * 1000))
+        with open(os.path.join(folder, "signal.csv"), encoding="utf-8") as file:
+            if len(file.readlines()) != len(history) + 1:
+                print("CSV file does not have every sample!")
+                failed = True
+
+    history.add(args.samples, InterfaceRecord("Wi-Fi", "disconnected", None, None, None,
+                                              None, None, None, None))
+    history.add(args.samples + 1, InterfaceRecord("Wi-Fi", "connected", "Office", None, 42,
+                                                  11, 144.4, 144.4, "Office"))
+    if list(history.values("signal")) != [42]:
+        print("Samples of the previous network are not removed!")
+        failed = True
+    return 1 if failed else 0
+
+
+def channel_loads_with_loop(scans):
+    """ Reference for ChannelAnalyser.channels(): the same loads found by a Python loop
+    over every access point of every scan.
+    """
+
+    from windows_wifi_manager.channel_analysis import ChannelLoad, band_of
+
+    counts, totals, bssids = {}, {}, {}
+    for networks in scans:
+        for network in networks:
+            if network.bssid is None or network.channel is None:
+                continue
+            key = (network.channel, network.band)
+            counts[key] = counts.get(key, 0) + 1
+            totals[key] = totals.get(key, 0) + (network.signal or 0)
+            bssids.setdefault(key, set()).add(network.bssid)
+    loads = [ChannelLoad(band_of(band, channel), channel, len(bssids[(channel, band)]),
+                         counts[(channel, band)] / len(scans),
+                         totals[(channel, band)] / 100 / len(scans))
+             for channel, band in counts]
+    return sorted(loads, key=lambda load: (load.band, load.channel))
+
+
+def run_channels(args):
+    """ Replay --scans scans of a busy floor (signals change and some access points are
+    missed in every scan) from a transcript through NetworkScanner into ChannelAnalyser,
+    compare its loads with a Python loop over every access point and measure both.
+    """
+
+    from windows_wifi_manager.channel_analysis import ChannelAnalyser, collect
+    from windows_wifi_manager.network_scanner import NetworkScanner
+
+    generator = random.Random(1)
+    networks = synthetic_networks(args.networks, args.bssids)
+    scans = []
+    for _ in range(args.scans):
+        scans.append([network._replace(signal=min(100, max(1, network.signal +
+                                                          generator.randint(-10, 10))))
+                      for network in networks if generator.random() > 0.1])
+
+    failed = False
+    with tempfile.TemporaryDirectory() as folder:
+        transcript = os.path.join(folder, "scans.json")
+        with open(transcript, "w", encoding="utf-8") as file:
+            json.dump({command_runner.command_key(
+                ["netsh", "wlan", "show", "networks", "mode=bssid"]):
+                [{"returncode": 0, "stdout": networks_text(scan)} for scan in scans]},
+                file, ensure_ascii=False)
+        previous = command_runner.set_runner(command_runner.ReplayRunner(transcript))
+        try:
+            start = time.perf_counter()
+            analyser = collect(NetworkScanner(ttl=0), ChannelAnalyser(window=float("inf")),
+                               args.scans, 0)
+            print("replay and parse %d scans %15.2f ms  (%d access points)" % (
+                args.scans, (time.perf_counter() - start) * 1000, sum(map(len, scans))))
+        finally:
+            command_runner.set_runner(previous)
+
+    # Scans are reduced when they are added, so that time is measured too.
+    start = time.perf_counter()
+    for scan in scans:
+        ChannelAnalyser(window=float("inf")).add_scan(scan)
+    print("ChannelAnalyser.add_scan x %d %12.2f ms" % (
+        args.scans, (time.perf_counter() - start) * 1000))
+
+    start = time.perf_counter()
+    loads = analyser.channels()
+    recommended = analyser.recommend(loads)
+    seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    reference = channel_loads_with_loop(scans)
+    loop_seconds = time.perf_counter() - start
+    print("ChannelAnalyser.channels + recommend %7.2f ms" % (seconds * 1000))
+    print("Python loop over every access point %8.2f ms" % (loop_seconds * 1000))
+    if [load[:3] for load in loads] != [load[:3] for load in reference] or not all(
+            math.isclose(load[3], other[3]) and math.isclose(load[4], other[4])
+            for load, other in zip(loads, reference)):
+        print("Loads of the channels are not same as the reference!")
+        failed = True
+    for band, (channel, score) in recommended.items():
+        print("%-8s least congested channel %3d (occupancy %.2f)" % (band, channel, score))
+    return 1 if failed else 0
+
+
+def run_trace(args):
+    """ Measure the time added by a tracing span to every call of a function, check that
+    the buffer keeps only the last --max-spans spans and that the Chrome trace is valid
+    JSON with an event for every span.
+    """
+
+    from windows_wifi_manager.tracing import Tracer
+
+    def function(value):
+        return value
+
+    tracer = Tracer(max_spans=args.max_spans)
+    traced_function = tracer.traced(category="app")(function)
+    results = {}
+    for label, target in (("plain call", function), ("traced call", traced_function)):
+        best = None
+        for _ in range(args.repeat):
+            tracer.clear()
+            start = time.perf_counter()
+            for value in range(args.calls):
+                target(value)
+            seconds = time.perf_counter() - start
+            best = seconds if best is None else min(best, seconds)
+        results[label] = best
+        print("%-12s x %d %12.2f ms" % (label, args.calls, best * 1000))
+    print("overhead per span %19.3f us" % (
+        (results["traced call"] - results["plain call"]) / args.calls * 1e6))
+
+    failed = False
+    if len(tracer.spans) != min(args.calls, args.max_spans):
+        print("Buffer has %d spans instead of %d!" % (len(tracer.spans),
+                                                      min(args.calls, args.max_spans)))
+        failed = True
+    with tempfile.TemporaryDirectory() as folder:
+        start = time.perf_counter()
+        tracer.export_chrome(os.path.join(folder, "trace.json"))
+        print("export_chrome (%d spans) %12.2f ms" % (len(tracer.spans),
+                                                     (time.perf_counter() - start) * 1000))
+        with open(os.path.join(folder, "trace.json"), encoding="utf-8") as file:
+            events = json.load(file)["traceEvents"]
+    if sum(event["ph"] == "X" for event in events) != len(tracer.spans):
+        print("Chrome trace does not have every span!")
+        failed = True
+    start = time.perf_counter()
+    tracer.format_summary()
+    print("format_summary %22.2f ms" % ((time.perf_counter() - start) * 1000))
+    return 1 if failed else 0
+
+
+def run_profile(args):
+    """ Profile --actions actions (listing of synthetic profiles) with ActionProfiler, check
+    that only the newest --keep files are left and that the report of the last one has the
+    functions of the action. The cost of the wrapper while profiling is off is measured too.
+    """
+
+    from windows_wifi_manager.netsh_parser import parse_profile_names
+    from windows_wifi_manager.profiling import ActionProfiler, report
+
+    output = profile_list_output(synthetic_profiles(args.profiles))
+
+    def action():
+        return parse_profile_names(output)
+
+    failed = False
+    with tempfile.TemporaryDirectory() as folder:
+        profiler = ActionProfiler(os.path.join(folder, "profiles_"), keep=args.keep)
+        wrapped = profiler.wrap("action", action)
+        for label, target in (("plain action", action), ("profiling off", wrapped)):
+            start = time.perf_counter()
+            for _ in range(args.actions):
+                target()
+            print("%-13s x %d %12.2f ms" % (label, args.actions,
+                                           (time.perf_counter() - start) * 1000))
+
+        profiler.enabled = True
+        start = time.perf_counter()
+        for _ in range(args.actions):
+            wrapped()
+        print("%-13s x %d %12.2f ms" % ("profiling on", args.actions,
+                                       (time.perf_counter() - start) * 1000))
+
+        files = profiler.files()
+        if len(files) != min(args.actions, args.keep) or files[-1] != profiler.latest():
+            print("%d profiles are kept instead of the newest %d!" % (
+                len(files), min(args.actions, args.keep)))
+            failed = True
+        if "parse_profile_names" not in report(profiler.latest()):
+            print("Report does not have the functions of the action!")
+            failed = True
+    return 1 if failed else 0
+
+
+def run_details(args):
+    """ Measure WifiInformation over a synthetic or recorded transcript."""
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        app_path = os.path.join(temp_dir, "app")
+        os.mkdir(app_path)
+
+        if args.transcript:
+            runner = command_runner.ReplayRunner(args.transcript)
+        else:
+            runner = command_runner.ReplayRunner()
+            profiles = synthetic_profiles(args.profiles)
+            export_folder = None
+            if args.export:
+                export_folder = app_path + "\\temp_"
+                os.mkdir(export_folder)
+                write_exported_profiles(export_folder, profiles)
+            transcript = synthetic_transcript(profiles, export_folder)
+            for command, output in transcript.items():
+                runner.add(command, output)
+            if args.save_transcript:
+                with open(args.save_transcript, "w", encoding="utf-8") as file:
+                    json.dump(transcript, file, ensure_ascii=False)
+
+        previous = command_runner.set_runner(runner)
+        command_runner.timings.clear()
+        try:
+            print_results(bench_wifi_information(app_path))
+        finally:
+            command_runner.set_runner(previous)
+    return 0
+
+
+class StubTreeview:
+    """ Stands in for ttk.Treeview of WifiDisplayBox (no window is needed), it keeps the
+    values of every item and the order of the attached items.
+    """
+
+    def __init__(self, height):
+        self.height = height
+        self.values = {}  # {iid: values}
+        self.children = []  # Attached items in the displayed order.
+        self.selected = ()
+        self.focused = ""
+
+    def insert(self, parent, index, values=(), tags=()):
+        iid = "I%03d" % (len(self.values) + 1)
+        self.values[iid] = tuple(values)
+        self.children.append(iid)  # Rows are only added at the end.
+        return iid
+
+    def delete(self, *iids):
+        for iid in iids:
+            del self.values[iid]
+            if iid in self.children:
+                self.children.remove(iid)
+        self.selection_remove(*iids)
+
+    def detach(self, iid):
+        self.children.remove(iid)
+
+    def move(self, iid, parent, index):
+        if iid in self.children:
+            self.children.remove(iid)
+        self.children.insert(index, iid)
+
+    def item(self, iid, values):
+        self.values[iid] = tuple(values)
+
+    def selection(self):
+        return self.selected
+
+    def selection_set(self, items):
+        self.selected = tuple(items)
+
+    def selection_remove(self, *items):
+        self.selected = tuple(iid for iid in self.selected if iid not in items)
+
+    def focus(self, iid=None):
+        if iid is None:
+            return self.focused
+        self.focused = iid
+        return None
+
+    def cget(self, option):
+        return self.height if option == "height" else ""
+
+    def bbox(self, iid):
+        return ""  # Nothing is drawn, so the number of rows is never fitted.
+
+    def identify_row(self, y):
+        return self.children[y] if 0 <= y < len(self.children) else ""  # y is the row.
+
+    def after_idle(self, function):
+        pass
+
+    def tag_bind(self, *args, **kwargs):
+        pass
+
+
+class StubScrollbar:
+    """ Stands in for the vertical ttk.Scrollbar, keeps the last position set."""
+
+    def __init__(self):
+        self.position = (0, 1)
+
+    def set(self, first, last):
+        self.position = (first, last)
+
+
+class StubVariable:
+    """ Stands in for tk.StringVar of the filter entry."""
+
+    def __init__(self):
+        self.value = ""
+
+    def get(self):
+        return self.value
+
+    def set(self, value):
+        self.value = value
+
+
+class StubTasks:
+    """ Stands in for BackgroundTasks, nothing is run (details of a row stay 'loading')."""
+
+    def submit(self, function, *args, callback=None, error_callback=None):
+        from concurrent.futures import Future
+
+        return Future()
+
+
+def stub_display_box(app_path, rows):
+    """ Return WifiDisplayBox which displays rows rows in a StubTreeview, the list of
+    profiles is retrieved with the installed runner.
+    """
+
+    from windows_wifi_manager.display_data import WifiDisplayBox
+
+    class StubDisplayBox(WifiDisplayBox):
+        def create_treeview(self):
+            self.tree_view = StubTreeview(rows)
+            self.vertical_scrollbar = StubScrollbar()
+            self.filter_text = StubVariable()
+
+    tasks = StubTasks()
+    return StubDisplayBox(app_path, None, tasks, batch_tasks=tasks)
+
+
+def view_problem(box):
+    """ Return what is wrong in the rows displayed by the box (from stub_display_box),
+    None if they show the model correctly from box.first.
+    """
+
+    tree = box.tree_view
+    if not 0 <= box.first <= max(0, len(box.model) - len(box.rows)):
+        return "first row %d is out of the list of %d rows" % (box.first, len(box.model))
+    shown = box.model.names[box.first:box.first + len(box.rows)]
+    if [tree.values[iid][0] for iid in tree.children] != shown:
+        return "rows don't show the names of the model in order"
+    for iid, name in zip(tree.children, shown):
+        values = tuple(box.selected_values) if name == box.selected else (name, "", "", "")
+        if tree.values[iid] != values:
+            return "row of %r has wrong values %r" % (name, tree.values[iid])
+    if set(tree.selection()) != {iid for iid, name in zip(tree.children, shown)
+                                 if name in box.marked}:
+        return "selected rows are not the rows of the selected profiles"
+    if box.model and box.vertical_scrollbar.position[0] != box.first / len(box.model):
+        return "scrollbar is not at the first row"
+    return None
+
+
+def check_view(box, runner, profiles, steps, generator):
+    """ Scroll, select, filter (by name or SSID) and refresh the list of the box (from
+    stub_display_box) at random steps times, the list of profiles of the system is
+    changed in the runner before a refresh. After every step the shown names are
+    compared with the profiles which match the filter sorted by sorted(), and the
+    displayed rows and the selection are checked (see view_problem). Return True if a
+    check failed.
+    """
+
+    from types import SimpleNamespace
+
+    key = command_runner.command_key(["netsh", "wlan", "show", "profile"])
+    pool = profiles + [("Added-%04d" % index, "Open", None) for index in range(len(profiles))]
+    listed = {name for name, _, _ in profiles}  # Profiles of the system now.
+    ssids = {}
+    cache = box.getting_data_obj.wifi_information.cache
+    words = ["Home", "Cafe", "Office", "Guest", "Lab", "Café ☕"]
+
+    def random_query():
+        query = box.filter_text.get()
+        roll = generator.random()
+        if roll < 0.15:
+            return ""
+        if roll < 0.5 or not query:
+            text = generator.choice([generator.choice(pool)[0], "SSID-" + generator.choice(words)])
+            start = generator.randrange(len(text))
+            query = text[start:start + generator.randint(1, 6)]
+            return generator.choice([query, query.upper(), " " + query.lower() + " "])
+        if roll < 0.8:
+            return query + generator.choice("aeo0123-")  # Narrows the previous result.
+        return query[:-1]
+
+    def filter_():
+        box.filter_text.set(random_query())
+        box.apply_filter()
+
+    def new_ssids():
+        for name in generator.sample(sorted(listed), min(len(listed), 20)):
+            ssids[name] = "SSID-" + generator.choice(words)
+            cache.put(name, ssids[name], "WPA2PSK", "key")
+        box.apply_filter()  # SSIDs retrieved since last time are searched too.
+
+    def refresh():
+        chosen = generator.sample(pool, generator.randint(0, len(profiles)))
+        runner.add(key, {"returncode": 0, "stdout": profile_list_output(chosen)})
+        listed.clear()
+        listed.update(name for name, _, _ in chosen)
+        box.refresh_treeview()
+
+    def click(method):
+        method(SimpleNamespace(y=generator.randrange(len(box.rows))))
+
+    actions = [
+        ("scroll_by", lambda: box.scroll_by(generator.randint(-50, 50))),
+        ("moveto", lambda: box.scroll("moveto", str(generator.uniform(-0.1, 1.1)))),
+        ("page", lambda: box.scroll("scroll", generator.choice([-1, 1]), "pages")),
+        ("move_selection", lambda: box.move_selection(generator.randint(-30, 30))),
+        ("select", lambda: box.model and box.select(generator.choice(box.model.names))),
+        ("toggle_mark", lambda: click(box.toggle_mark)),
+        ("mark_range", lambda: click(box.mark_range)),
+        ("mark_all", box.mark_all),
+        ("filter", filter_),
+        ("filter", filter_),
+        ("new SSIDs", new_ssids),
+        ("refresh", refresh),
+    ]
+    start = time.perf_counter()
+    for step in range(steps):
+        label, action = generator.choice(actions)
+        action()
+        query = box.filter_text.get().strip().casefold()
+        shown = sorted((name for name in listed
+                        if query in (name + "\n" + ssids.get(name, "")).casefold()),
+                       key=lambda name: (name.lower(), name))
+        problem = view_problem(box)
+        if box.model.names != shown:
+            problem = "shown names are not the sorted names which match %r" % query
+        elif box.selected is not None and box.selected not in box.model:
+            problem = "selected profile %r is not shown" % box.selected
+        elif not box.marked <= set(box.model.names):
+            problem = "a selected profile is not shown"
+        if problem is not None:
+            print("After %s (step %d): %s!" % (label, step, problem))
+            return True
+    print("scroll, select, filter, refresh x %d %5.2f ms" % (
+        steps, (time.perf_counter() - start) * 1000))
+    return False
+
+
+def run_treeview(args):
+    """ Check ProfileListModel against sorted() while names are removed and the list is
+    replaced, then change WifiDisplayBox (with a StubTreeview) at random (see
+    check_view) and check that the selected row is still selected when it is scrolled
+    out of the window and back.
+    """
+
+    from windows_wifi_manager.display_data import ProfileListModel
+
+    generator = random.Random(args.seed)
+    profiles = synthetic_profiles(args.profiles, args.seed)
+    profiles += [(name, "Open", None) for name in ("cafe", "Cafe", "CAFE")]  # Same lowercase.
+    names = [name for name, _, _ in profiles]
+    generator.shuffle(names)
+
+    def expected(items):
+        return sorted(items, key=lambda name: (name.lower(), name))
+
+    failed = False
+    start = time.perf_counter()
+    model = ProfileListModel(names)
+    print("ProfileListModel(%d names) %12.2f ms" % (len(names),
+                                                    (time.perf_counter() - start) * 1000))
+    current = set(names)
+    seconds = 0
+    for step in range(args.steps):
+        if step % 10 == 9:  # List is replaced, like after Refresh List.
+            current = set(generator.sample(names, generator.randint(0, len(names))))
+            start = time.perf_counter()
+            model.update(current)
+            seconds += time.perf_counter() - start
+        elif model:
+            name = generator.choice(model.names)
+            start = time.perf_counter()
+            model.remove(name)
+            seconds += time.perf_counter() - start
+            current.discard(name)
+        if model.names != expected(current) or model.all_names != model.names:
+            print("ProfileListModel is not sorted like sorted() after step %d!" % step)
+            failed = True
+            break
+    print("model updates x %d %20.2f ms" % (args.steps, seconds * 1000))
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        runner = command_runner.ReplayRunner()
+        for command, output in synthetic_transcript(profiles).items():
+            runner.add(command, output)
+        previous = command_runner.set_runner(runner)
+        try:
+            box = stub_display_box(temp_dir, args.rows)
+            if box.model.names != expected(names):
+                print("WifiDisplayBox does not show every profile in order!")
+                failed = True
+
+            # Selected row is scrolled out of the window and back.
+            name = box.model[len(box.model) // 2]
+            box.select(name)
+            box.scroll_by(3 * len(box.rows))
+            hidden = name not in box.model.names[box.first:box.first + len(box.rows)]
+            hidden_problem = view_problem(box)
+            box.scroll_by(-3 * len(box.rows))
+            iid = box.rows[box.model.index(name) - box.first]
+            if not hidden or hidden_problem is not None or view_problem(box) is not None or \
+                    box.selected != name or box.tree_view.selection() != (iid,):
+                print("Selection does not survive scrolling!")
+                failed = True
+
+            failed = check_view(box, runner, profiles, args.steps, generator) or failed
+        finally:
+            command_runner.set_runner(previous)
+    return 1 if failed else 0
+
+
+def main(argv=None):
+    """ Parse the arguments and run the benchmark."""
+
+    parser = argparse.ArgumentParser(prog="python -m windows_wifi_manager.benchmark")
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    details = subparsers.add_parser("details", help="measure WifiInformation operations")
+    details.add_argument("--profiles", type=int, default=1000,
+                         help="number of synthetic profiles (default: 1000)")
+    details.add_argument("--export", action="store_true",
+                         help="let the export command succeed with generated XML files")
+    details.add_argument("--transcript", help="replay this recorded transcript instead")
+    details.add_argument("--save-transcript", help="save the synthetic transcript to file")
+    details.set_defaults(function=run_details)
+
+    importtime = subparsers.add_parser("importtime", help="check import time of the App")
+    importtime.add_argument("--budget", type=int, default=50,
+                            help="maximum import time in milliseconds (default: 50)")
+    importtime.add_argument("--repeat", type=int, default=3,
+                            help="number of runs, the fastest is used (default: 3)")
+    importtime.add_argument("--module", default="windows_wifi_manager.__main__",
+                            help="module to import (default: windows_wifi_manager.__main__)")
+    importtime.set_defaults(function=run_importtime)
+
+    xml = subparsers.add_parser("xml", help="compare profile XML readers")
+    xml.add_argument("--profiles", type=int, default=2000,
+                     help="number of generated profile XML files (default: 2000)")
+    xml.add_argument("--repeat", type=int, default=3,
+                     help="number of runs, the fastest is used (default: 3)")
+    xml.set_defaults(function=run_xml)
+
+    netsh = subparsers.add_parser("netsh", help="fuzz and compare netsh output parsers")
+    netsh.add_argument("--profiles", type=int, default=5000,
+                       help="number of profiles in the generated output (default: 5000)")
+    netsh.add_argument("--fuzz", type=int, default=2000,
+                       help="number of random profile names checked (default: 2000)")
+    netsh.add_argument("--interfaces", type=int, default=8,
+                       help="number of interfaces in the generated output (default: 8)")
+    netsh.add_argument("--repeat", type=int, default=3,
+                       help="number of runs, the fastest is used (default: 3)")
+    netsh.set_defaults(function=run_netsh)
+
+    session = subparsers.add_parser("session", help="compare one-shot netsh with a session")
+    session.add_argument("--profiles", type=int, default=100,
+                         help="number of profiles looked up (default: 100)")
+    session.add_argument("--startup", type=float, default=0.0,
+                         help="extra seconds taken by the stand-in to start (default: 0)")
+    session.add_argument("--real", action="store_true",
+                         help="use the real netsh of the system (Windows only)")
+    session.set_defaults(function=run_session)
+
+    import_ = subparsers.add_parser("import", help="measure bulk import of profiles")
+    import_.add_argument("--profiles", type=int, default=500,
+                         help="number of profiles imported (default: 500)")
+    import_.add_argument("--workers", type=int, default=4,
+                         help="number of profiles added at the same time (default: 4)")
+    import_.add_argument("--latency", type=float, default=5,
+                         help="milliseconds taken by every add (default: 5)")
+    import_.set_defaults(function=run_import)
+
+    backup = subparsers.add_parser("backup", help="measure backup and restore of profiles")
+    backup.add_argument("--profiles", type=int, default=500,
+                        help="number of profiles on the system (default: 500)")
+    backup.add_argument("--workers", type=int, default=4,
+                        help="number of profiles restored at the same time (default: 4)")
+    backup.add_argument("--latency", type=float, default=5,
+                        help="milliseconds taken by every add (default: 5)")
+    backup.set_defaults(function=run_backup)
+
+    scan = subparsers.add_parser("scan", help="check and measure the nearby networks scanner")
+    scan.add_argument("--networks", type=int, default=200,
+                      help="number of networks in the generated output (default: 200)")
+    scan.add_argument("--bssids", type=int, default=4,
+                      help="maximum number of BSSIDs of a network (default: 4)")
+    scan.add_argument("--ttl", type=float, default=5,
+                      help="seconds for which a scan is used again (default: 5)")
+    scan.add_argument("--refresh", type=float, default=0.5,
+                      help="seconds between two refreshes of the view (default: 0.5)")
+    scan.add_argument("--repeat", type=int, default=3,
+                      help="number of runs, the fastest is used (default: 3)")
+    scan.set_defaults(function=run_scan)
+
+    signal = subparsers.add_parser("signal", help="check and measure the signal history")
+    signal.add_argument("--samples", type=int, default=100000,
+                        help="number of samples added (default: 100000)")
+    signal.add_argument("--capacity", type=int, default=600,
+                        help="number of samples kept (default: 600)")
+    signal.set_defaults(function=run_signal)
+
+    channels = subparsers.add_parser("channels", help="check and measure channel analysis")
+    channels.add_argument("--scans", type=int, default=1000,
+                          help="number of scans replayed (default: 1000)")
+    channels.add_argument("--networks", type=int, default=60,
+                          help="number of networks on the floor (default: 60)")
+    channels.add_argument("--bssids", type=int, default=4,
+                          help="maximum number of BSSIDs of a network (default: 4)")
+    channels.set_defaults(function=run_channels)
+
+    trace = subparsers.add_parser("trace", help="measure overhead of tracing spans")
+    trace.add_argument("--calls", type=int, default=100000,
+                       help="number of calls of the traced function (default: 100000)")
+    trace.add_argument("--max-spans", type=int, default=20000,
+                       help="number of spans kept (default: 20000)")
+    trace.add_argument("--repeat", type=int, default=3,
+                       help="number of runs, the fastest is used (default: 3)")
+    trace.set_defaults(function=run_trace)
+
+    profile = subparsers.add_parser("profile", help="check profiling of actions")
+    profile.add_argument("--actions", type=int, default=50,
+                         help="number of profiled actions (default: 50)")
+    profile.add_argument("--keep", type=int, default=20,
+                         help="number of profiles kept (default: 20)")
+    profile.add_argument("--profiles", type=int, default=2000,
+                         help="number of synthetic profiles listed (default: 2000)")
+    profile.set_defaults(function=run_profile)
+
+    treeview = subparsers.add_parser("treeview", help="check the list of profiles")
+    treeview.add_argument("--profiles", type=int, default=5000,
+                          help="number of synthetic profiles (default: 5000)")
+    treeview.add_argument("--rows", type=int, default=20,
+                          help="number of rows displayed (default: 20)")
+    treeview.add_argument("--steps", type=int, default=2000,
+                          help="number of random changes and checks (default: 2000)")
+    treeview.add_argument("--seed", type=int, default=0,
+                          help="seed of the random changes (default: 0)")
+    treeview.set_defaults(function=run_treeview)
+
+    standin = subparsers.add_parser("netsh-standin", help="act like netsh (used by session)")
+    standin.add_argument("--transcript", required=True, help="outputs of the commands")
+    standin.add_argument("--startup", type=float, default=0.0,
+                         help="seconds to wait before answering the first command")
+    standin.add_argument("arguments", nargs=argparse.REMAINDER,
+                         help="arguments of netsh, interactive if not given")
+    standin.set_defaults(function=run_standin)
+
+    args = parser.parse_args(argv)
+    return args.function(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,153 @@
+""" This module finds how busy every Wi-Fi channel is from repeated scans of the nearby
+networks (see network_scanner) and recommends the least congested channel of every band.
+When a scan is added, it is reduced to a few numbers per channel (number of access
+points and sum of their signals, found by Counter, sorted and sum which run in C) and
+its (channel, BSSID) pairs. Scans of the last few minutes (window) are kept and only
+their per channel numbers are added up, so thousands of scans of a busy office floor are
+analysed quickly without a Python loop over every access point.
+
+For every channel the number of different BSSIDs seen, the mean number of BSSIDs per
+scan and the occupancy (sum of signal strengths per scan, in units of a 100% signal) are
+found. Channels of 2.4 GHz are 5 MHz apart and 20 MHz wide, so the occupancy of the
+neighbouring channels is also counted when the 2.4 GHz channel is recommended.
+"""
+
+import time
+from collections import Counter, deque, namedtuple
+from itertools import chain, compress, groupby
+from operator import attrgetter, itemgetter
+
+# Load of a single channel, see module docstring.
+ChannelLoad = namedtuple("ChannelLoad", ["band", "channel", "bssids", "mean_bssids",
+                                         "occupancy"])
+
+# Channels which are recommended for every band (non-overlapping 2.4 GHz channels,
+# 5 GHz channels without radar detection and preferred scanning channels of 6 GHz).
+CANDIDATE_CHANNELS = {"2.4 GHz": (1, 6, 11),
+                      "5 GHz": (36, 40, 44, 48, 149, 153, 157, 161, 165),
+                      "6 GHz": tuple(range(5, 234, 16))}
+
+_CHANNEL = attrgetter("channel")
+_BAND = attrgetter("band")
+_SIGNAL = attrgetter("signal")
+_BSSID = attrgetter("bssid")
+_FIRST = itemgetter(0)
+_KEY = itemgetter(0, 1)
+_THIRD = itemgetter(2)
+
+
+def band_of(band, channel):
+    """ Return band of the channel, the band shown by netsh is used if there is one
+    (older netsh does not show it, channels 1 to 14 are 2.4 GHz).
+    """
+
+    if band:
+        return band
+    return "2.4 GHz" if channel <= 14 else "5 GHz"
+
+
+class ChannelAnalyser:
+    """ Scans of the last window seconds and the load of every channel found from them."""
+
+    def __init__(self, window=300, clock=time.monotonic):
+        """ window is the number of seconds for which a scan is used, clock returns the
+        current time in seconds (can be replaced for testing).
+        """
+
+        self.window = window
+        self.clock = clock
+        # (time, Counter {key: access points}, {key: sum of signals}, [(key, bssid)]) of
+        # every scan, oldest first. key is (channel, band).
+        self.scans = deque()
+
+    def add_scan(self, networks, scan_time=None):
+        """ Add a scan (list of NetworkRecord), records without BSSID or channel are not
+        used. Scans older than window are removed.
+        """
+
+        scan_time = self.clock() if scan_time is None else scan_time
+        networks = list(compress(networks, map(_BSSID, networks)))
+        networks = list(compress(networks, map(_CHANNEL, networks)))
+        keys = list(zip(map(_CHANNEL, networks), map(_BAND, networks)))
+        counts = Counter(keys)
+        # Sorted (in C) by channel, so access points of a channel are next to each other
+        # and their signals are summed group by group. None (unknown signal) adds nothing.
+        totals = Counter()
+        for key, group in groupby(sorted(zip(map(_CHANNEL, networks), map(_BAND, networks),
+                                             map(_SIGNAL, networks)), key=_FIRST),
+                                  _KEY):
+            totals[key] += sum(filter(None, map(_THIRD, group)))
+        self.scans.append((scan_time, counts, totals, list(zip(keys, map(_BSSID, networks)))))
+        while self.scans and self.scans[0][0] < scan_time - self.window:
+            self.scans.popleft()
+
+    def channels(self):
+        """ Return ChannelLoad of every channel seen in the scans, sorted by band and
+        channel.
+        """
+
+        if not self.scans:
+            return []
+        counts = Counter()
+        totals = Counter()
+        for _, scan_counts, scan_totals, _ in self.scans:
+            counts.update(scan_counts)
+            totals.update(scan_totals)
+        pairs = set(chain.from_iterable(map(itemgetter(3), self.scans)))
+        distinct = Counter(map(_FIRST, pairs))
+
+        scans = len(self.scans)
+        loads = []
+        for key, count in counts.items():
+            channel, band = key
+            loads.append(ChannelLoad(band_of(band, channel), channel, distinct[key],
+                                     count / scans, totals[key] / 100 / scans))
+        return sorted(loads, key=lambda load: (load.band, load.channel))
+
+    def recommend(self, loads=None):
+        """ Return {band: (channel, score)} with the least congested channel of every
+        band which is seen in the scans (and always of 2.4 GHz and 5 GHz). score is the
+        occupancy of the channel including the overlap of neighbouring channels.
+        loads is the result of channels() (found again if not given).
+        """
+
+        loads = self.channels() if loads is None else loads
+        occupancy = {}  # {band: {channel: occupancy}}
+        for load in loads:
+            channels = occupancy.setdefault(load.band, {})
+            channels[load.channel] = channels.get(load.channel, 0) + load.occupancy
+
+        recommended = {}
+        for band in sorted(set(occupancy) | {"2.4 GHz", "5 GHz"}):
+            used = occupancy.get(band, {})
+            candidates = CANDIDATE_CHANNELS.get(band, ())
+            if band != "2.4 GHz":
+                candidates = sorted(set(candidates) | set(used))
+            if not candidates:
+                continue
+            scores = []
+            for candidate in candidates:
+                if band == "2.4 GHz":
+                    score = sum(value * (1 - abs(candidate - channel) / 5)
+                                for channel, value in used.items()
+                                if abs(candidate - channel) < 5)
+                else:
+                    score = used.get(candidate, 0)
+                scores.append((round(float(score), 6), candidate))
+            score, channel = min(scores)
+            recommended[band] = (channel, score)
+        return recommended
+
+
+def collect(scanner, analyser, scans, interval, sleep=time.sleep):
+    """ Scan scans times (interval seconds apart) with scanner (NetworkScanner) and add
+    every scan to analyser. A failed (empty) scan is not added.
+    """
+
+    for index in range(scans):
+        if index and interval > 0:
+            sleep(interval)
+        networks = scanner.scan(force=True)
+        if networks:
+            analyser.add_scan(networks)
+    return analyser
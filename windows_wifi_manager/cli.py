@@ -0,0 +1,348 @@
+""" This module is the command line interface of the App, used when windows-wifi-manager
+is run with a command. It uses WifiInformation and SystemWifiConnection without creating
+any window, so it can be run from scripts. Every profile is written as one JSON object per
+line (NDJSON) as soon as its details are found, or as a single JSON list with --format json.
+
+    windows-wifi-manager list
+    windows-wifi-manager show "Home" "Office"
+    windows-wifi-manager export
+    windows-wifi-manager delete "Old Network"
+    windows-wifi-manager import networks.csv
+    windows-wifi-manager backup profiles.zip
+    windows-wifi-manager restore profiles.zip
+    windows-wifi-manager networks
+    windows-wifi-manager channels --scans 10 --interval 3
+    windows-wifi-manager status
+"""
+
+import argparse
+import json
+import os
+import sys
+
+from windows_wifi_manager import command_runner, settings, tracing
+from windows_wifi_manager.wifi_connection import SystemWifiConnection
+from windows_wifi_manager.wifi_data import WifiInformation
+
+
+class RecordWriter:
+    """ Write records to the stream as NDJSON or as a JSON list, flushing every record so
+    the reader gets it immediately. If the reader goes away (e.g. output is piped to
+    'head'), BrokenPipeError is raised by write() to stop the command and the rest of
+    the output is discarded.
+    """
+
+    def __init__(self, stream, output_format="ndjson"):
+        self.stream = stream
+        self.output_format = output_format
+        self.count = 0
+        self.broken = False  # True once the reader of the stream is gone.
+
+    def write(self, record):
+        """ Write a single record (dictionary)."""
+
+        text = json.dumps(record, ensure_ascii=False)
+        if self.output_format == "json":
+            text = ("[" if self.count == 0 else ",") + "\n  " + text
+        else:
+            text += "\n"
+        try:
+            self.stream.write(text)
+            self.stream.flush()
+        except BrokenPipeError:
+            self.discard()
+            raise
+        self.count += 1
+
+    def close(self):
+        """ Finish the output (closes the JSON list)."""
+
+        if self.output_format == "json" and not self.broken:
+            try:
+                self.stream.write("[]\n" if self.count == 0 else "\n]\n")
+                self.stream.flush()
+            except BrokenPipeError:
+                self.discard()
+
+    def discard(self):
+        """ Point the stream at devnull, so nothing (not even the flush when Python exits)
+        fails writing to the closed pipe again.
+        """
+
+        self.broken = True
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, self.stream.fileno())
+        os.close(devnull)
+
+
+def detail_record(information, name, saved):
+    """ Return details of the profile as dictionary, saved is the set of names of the
+    saved profiles.
+    """
+
+    if name not in saved:
+        return {"name": name, "error": "Profile is not found on the system"}
+    _, ssid, authentication, key = information.wifi_details(name)
+    return {"name": name, "ssid": ssid, "authentication": authentication, "key": key}
+
+
+def list_profiles(information, _, writer):
+    """ Write the name of every saved profile."""
+
+    for name in information.list_of_wifi:
+        writer.write({"name": name})
+    return 0
+
+
+def show_profiles(information, args, writer):
+    """ Write the details of given profiles."""
+
+    status = 0
+    saved = set(information.list_of_wifi)
+    for name in args.names:
+        record = detail_record(information, name, saved)
+        status = 1 if "error" in record else status
+        writer.write(record)
+    return status
+
+
+def export_profiles(information, _, writer):
+    """ Write the details of every saved profile (all profiles are exported once)."""
+
+    information.load_all_details()
+    names = list(information.list_of_wifi)
+    saved = set(names)
+    for name in names:
+        writer.write(detail_record(information, name, saved))
+    return 0
+
+
+def delete_profiles(information, args, writer):
+    """ Delete the given profiles (several at the same time) and write the result for
+    every profile.
+    """
+
+    status = 0
+    saved = set(information.list_of_wifi)
+    for name in args.names:
+        if name not in saved:
+            writer.write({"name": name, "deleted": False,
+                          "error": "Profile is not found on the system"})
+            status = 1
+
+    for name, deleted, reason in information.delete_profiles(
+            [name for name in args.names if name in saved], max_workers=args.workers):
+        record = {"name": name, "deleted": deleted}
+        if not deleted:
+            record["error"] = reason
+            status = 1
+        writer.write(record)
+    return status
+
+
+def import_profiles(information, args, writer):
+    """ Add a profile for every row of the CSV or JSON file and write the result of
+    every row.
+    """
+
+    from windows_wifi_manager.profile_import import import_file
+
+    status = 0
+    for result in import_file(args.file, information.app_path + "\\temp_", args.workers):
+        status = status if result["added"] else 1
+        writer.write(result)
+    return status
+
+
+def backup_profiles(information, args, writer):
+    """ Back up every profile of the system to the zip file and write a record for every
+    profile in the backup.
+    """
+
+    from windows_wifi_manager.profile_backup import create_backup
+
+    try:
+        manifest = create_backup(information, args.file)
+    except (OSError, ValueError) as error:
+        print(error, file=sys.stderr)
+        return 1
+    for entry in manifest["profiles"]:
+        writer.write({"name": entry["name"], "ssid": entry["ssid"], "sha256": entry["sha256"]})
+    return 0
+
+
+def restore_profiles(information, args, writer):
+    """ Restore the profiles of the zip file and write the result of every profile."""
+
+    from windows_wifi_manager.profile_backup import restore_backup
+
+    try:
+        results = restore_backup(information, args.file, args.workers, args.force)
+    except (OSError, ValueError) as error:
+        print(error, file=sys.stderr)
+        return 1
+    status = 0
+    for result in results:
+        status = 1 if result["status"] == "failed" else status
+        writer.write(result)
+    return status
+
+
+def nearby_networks(information, _, writer):
+    """ Write every access point (BSSID) near the system and whether its network has a
+    saved profile.
+    """
+
+    from windows_wifi_manager.network_scanner import NetworkScanner, saved_markers
+
+    saved = set(information.list_of_wifi)
+    saved.update(entry[0] for entry in list(information.cache.entries.values()))
+    for network, is_saved in saved_markers(NetworkScanner().scan(), saved):
+        writer.write(dict(network._asdict(), saved=is_saved))
+    return 0
+
+
+def channel_congestion(_, args, writer):
+    """ Scan the nearby networks several times, write the load of every channel seen
+    and then the recommended channel of every band.
+    """
+
+    from windows_wifi_manager.channel_analysis import ChannelAnalyser, collect
+    from windows_wifi_manager.network_scanner import NetworkScanner
+
+    # Every scan is used, however long they take.
+    analyser = collect(NetworkScanner(ttl=0), ChannelAnalyser(window=float("inf")),
+                       args.scans, args.interval)
+    loads = analyser.channels()
+    for load in loads:
+        writer.write(load._asdict())
+    for band, (channel, score) in analyser.recommend(loads).items():
+        writer.write({"band": band, "recommended_channel": channel, "score": score})
+    return 0
+
+
+def interface_status(_, __, writer):
+    """ Write details of every Wi-Fi interface of the system."""
+
+    for interface in SystemWifiConnection().refresh_interfaces():
+        writer.write(interface._asdict())
+    return 0
+
+
+def print_timings(stream):
+    """ Write the wall time of every netsh call made by the command to the stream."""
+
+    for command, item in command_runner.timings.summary().items():
+        stream.write("%8.1f ms  x%-3d %s\n" % (item["total"] * 1000, item["calls"], command))
+    stream.flush()
+
+
+COMMANDS = {"list": list_profiles, "show": show_profiles, "export": export_profiles,
+            "delete": delete_profiles, "import": import_profiles, "backup": backup_profiles,
+            "restore": restore_profiles, "networks": nearby_networks,
+            "channels": channel_congestion, "status": interface_status}
+
+
+def build_parser():
+    """ Return the parser of command line arguments."""
+
+    parser = argparse.ArgumentParser(
+        prog="windows-wifi-manager",
+        description="Run without a command to open the Windows Wi-Fi Manager window.")
+    parser.add_argument("--format", choices=["ndjson", "json"], default="ndjson",
+                        help="one JSON object per line (default) or a single JSON list")
+    parser.add_argument("--app-dir", help="directory for exported profiles and cache "
+                                          "(default: directory of the App)")
+    parser.add_argument("--replay", metavar="TRANSCRIPT",
+                        help="serve netsh output from a recorded transcript (for testing)")
+    parser.add_argument("--record", metavar="TRANSCRIPT",
+                        help="save the output of every netsh call to a transcript which "
+                             "can be used with --replay")
+    parser.add_argument("--session", action="store_true",
+                        help="run all 'netsh wlan show' commands in one netsh process")
+    parser.add_argument("--timings", action="store_true",
+                        help="write the wall time of every netsh call to stderr")
+    parser.add_argument("--trace", metavar="FILE",
+                        help="save tracing spans (netsh, parsing, disk) as Chrome trace "
+                             "JSON, open it in chrome://tracing or Perfetto")
+    parser.add_argument("--trace-summary", action="store_true",
+                        help="write the time spent in every tracing span to stderr")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("list", help="names of saved profiles")
+    show = subparsers.add_parser("show", help="SSID, authentication and key of profiles")
+    show.add_argument("names", nargs="+", metavar="NAME")
+    subparsers.add_parser("export", help="SSID, authentication and key of every profile")
+    delete = subparsers.add_parser("delete", help="delete profiles from the system")
+    delete.add_argument("names", nargs="+", metavar="NAME")
+    delete.add_argument("--workers", type=int, default=4,
+                        help="number of profiles deleted at the same time (default: 4)")
+    import_ = subparsers.add_parser("import", help="add profiles from a CSV or JSON file")
+    import_.add_argument("file", help="file with columns ssid, authentication, encryption, "
+                                      "key and connection_mode")
+    import_.add_argument("--workers", type=int, default=4,
+                         help="number of profiles added at the same time (default: 4)")
+    backup = subparsers.add_parser("backup", help="back up every profile to a zip file")
+    backup.add_argument("file", help="zip file to create (replaced if it exists)")
+    restore = subparsers.add_parser("restore", help="add profiles from a backup zip file")
+    restore.add_argument("file", help="zip file made by the backup command")
+    restore.add_argument("--workers", type=int, default=4,
+                         help="number of profiles added at the same time (default: 4)")
+    restore.add_argument("--force", action="store_true",
+                         help="add profiles even if the same profile is on the system")
+    subparsers.add_parser("networks", help="nearby networks (every BSSID) and whether "
+                                           "they have a saved profile")
+    channels = subparsers.add_parser("channels", help="congestion of every channel and the "
+                                                      "least congested channel of every band")
+    channels.add_argument("--scans", type=int, default=10,
+                          help="number of scans of nearby networks (default: 10)")
+    channels.add_argument("--interval", type=float, default=3,
+                          help="seconds between two scans (default: 3)")
+    subparsers.add_parser("status", help="details of Wi-Fi interfaces")
+    return parser
+
+
+def main(argv=None):
+    """ Run the command given in argv (default sys.argv) and return the exit status."""
+
+    args = build_parser().parse_args(argv)
+
+    if args.replay:
+        command_runner.set_runner(command_runner.ReplayRunner(args.replay))
+    elif sys.platform != "win32":
+        print("The package or Application is made only for window users.", file=sys.stderr)
+        return 2
+    elif args.session or settings.NETSH_SESSION:
+        from windows_wifi_manager.netsh_session import NetshSession
+        command_runner.set_runner(NetshSession())
+    recorder = None
+    if args.record:
+        recorder = command_runner.RecordingRunner(command_runner.get_runner())
+        command_runner.set_runner(recorder)
+
+    writer = RecordWriter(sys.stdout, args.format)
+    information = None
+    if args.command not in ("status", "channels"):
+        information = WifiInformation(args.app_dir or settings.app_dir())
+    try:
+        return COMMANDS[args.command](information, args, writer)
+    except BrokenPipeError:
+        return 1  # Reader of the output is gone (e.g. 'head'), stop quietly.
+    finally:
+        writer.close()
+        if information is not None:
+            information.cache.close()
+        if recorder is not None:
+            recorder.save(args.record)
+            command_runner.set_runner(recorder.runner)
+        if hasattr(command_runner.get_runner(), "close"):
+            command_runner.get_runner().close()
+        if args.timings:
+            print_timings(sys.stderr)
+        if args.trace:
+            tracing.tracer.export_chrome(args.trace)
+        if args.trace_summary:
+            print(tracing.tracer.format_summary(), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
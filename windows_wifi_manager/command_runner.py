@@ -0,0 +1,216 @@
+""" This module is the single place from where every 'netsh' command of the app is
+executed. All other modules call run() of this module instead of calling subprocess
+directly, so the way commands are executed can be swapped at one place. By default the
+commands are run on the system, but a ReplayRunner can be installed which serves the
+captured output of the commands from a transcript file, which makes it possible to
+benchmark or profile the app on a machine which is not running Windows. Every command
+executed is also timed, so the latency of each netsh call can be measured.
+
+Commands are given as a list of arguments and executed directly, without a shell (no
+cmd.exe and no findstr, output is filtered by the caller in Python). So the names of
+profiles are passed to netsh as they are and quotes or symbols in them need no escaping.
+"""
+
+import json
+import subprocess
+import threading
+import time
+from collections import deque
+
+from windows_wifi_manager import tracing
+
+
+def command_key(command):
+    """ Return the string used to identify the command in a transcript and in the
+    timing records. Command can be given as a string or as a list of arguments.
+    """
+
+    if isinstance(command, str):
+        return command
+    return subprocess.list2cmdline(command)
+
+
+class SubprocessRunner:
+    """ Run the command on the system using subprocess (default runner)."""
+
+    # Do not open a console window for every command when App is run by pythonw.
+    creation_flags = getattr(subprocess, "CREATE_NO_WINDOW", 0)  # Only on Windows.
+
+    def run(self, command):
+        """ Run the command (list of arguments) without a shell and return the
+        subprocess.CompletedProcess object. If the program can not be started, returncode
+        is 1 and the error is in stderr.
+        """
+
+        try:
+            return subprocess.run(command, capture_output=True, text=True,
+                                  creationflags=self.creation_flags)
+        except OSError as error:
+            return subprocess.CompletedProcess(command, 1, "", str(error))
+
+
+class ReplayRunner:
+    """ Serve the output of the commands from a transcript file instead of running them.
+    Transcript is a JSON file in the form of
+    {"command": {"returncode": 0, "stdout": "...", "stderr": ""}, ...}
+    where "command" is the list of arguments joined by command_key(),
+    and the value can also be a list of such dictionaries, in that case the outputs
+    are served one after another (and started again from first when all are served).
+    Commands which are not in the transcript fails with returncode 1.
+    """
+
+    def __init__(self, transcript=None):
+        self.transcript = {}
+        self._served = {}
+        self._lock = threading.Lock()
+        if transcript is not None:
+            self.load(transcript)
+
+    def load(self, path):
+        """ Load (or add) the recorded outputs from the transcript file."""
+
+        with open(path, "r", encoding="utf-8") as file:
+            for command, output in json.load(file).items():
+                self.add(command, output)
+
+    def add(self, command, output):
+        """ Add the recorded output of a command. Output is either a dictionary or a
+        list of dictionaries with returncode, stdout and stderr.
+        """
+
+        if isinstance(output, dict):
+            output = [output]
+        self.transcript[command_key(command)] = list(output)
+
+    def run(self, command):
+        """ Return the recorded output of the command as subprocess.CompletedProcess."""
+
+        key = command_key(command)
+        outputs = self.transcript.get(key)
+        if not outputs:
+            return subprocess.CompletedProcess(command, 1, "", "Command not recorded: " + key)
+
+        with self._lock:
+            index = self._served.get(key, 0)
+            self._served[key] = index + 1
+        output = outputs[index % len(outputs)]
+        return subprocess.CompletedProcess(command, output.get("returncode", 0),
+                                           output.get("stdout", ""), output.get("stderr", ""))
+
+
+class RecordingRunner:
+    """ Run the commands using another runner and record every output, so that the
+    transcript can be saved and replayed later by ReplayRunner.
+    """
+
+    def __init__(self, runner=None):
+        self.runner = runner if runner is not None else SubprocessRunner()
+        self.transcript = {}
+        self._lock = threading.Lock()
+
+    def run(self, command):
+        """ Run the command and record its output."""
+
+        output = self.runner.run(command)
+        with self._lock:
+            self.transcript.setdefault(command_key(command), []).append(
+                {"returncode": output.returncode, "stdout": output.stdout,
+                 "stderr": output.stderr})
+        return output
+
+    def save(self, path):
+        """ Save the recorded outputs to a transcript file."""
+
+        with self._lock:
+            with open(path, "w", encoding="utf-8") as file:
+                json.dump(self.transcript, file, ensure_ascii=False, indent=1)
+
+
+class CallTimings:
+    """ Keeps the wall time of the last executed commands (bounded, so memory does not
+    grow however long the app runs).
+    """
+
+    def __init__(self, max_records=1000):
+        self.records = deque(maxlen=max_records)
+        self._lock = threading.Lock()
+
+    def add(self, command, seconds, returncode):
+        """ Record the wall time of a single command."""
+
+        with self._lock:
+            self.records.append((command_key(command), seconds, returncode))
+
+    def clear(self):
+        """ Remove all the records."""
+
+        with self._lock:
+            self.records.clear()
+
+    def summary(self):
+        """ Return a dictionary in the form of
+        {"command": {"calls": n, "total": s, "mean": s, "max": s}}.
+        """
+
+        with self._lock:
+            records = list(self.records)
+
+        summary = {}
+        for command, seconds, _ in records:
+            item = summary.setdefault(command, {"calls": 0, "total": 0.0, "max": 0.0})
+            item["calls"] += 1
+            item["total"] += seconds
+            item["max"] = max(item["max"], seconds)
+        for item in summary.values():
+            item["mean"] = item["total"] / item["calls"]
+        return summary
+
+
+_runner = SubprocessRunner()
+timings = CallTimings()
+
+
+def get_runner():
+    """ Return the runner which is currently used to execute the commands."""
+    return _runner
+
+
+def set_runner(runner):
+    """ Replace the runner used to execute the commands and return the previous one."""
+
+    global _runner
+    previous, _runner = _runner, runner
+    return previous
+
+
+def span_name(command):
+    """ Return the name of the tracing span of the command, values of the arguments are
+    left out (e.g. 'netsh wlan show profile name=\u2026 key=clear'), so every call of the
+    same command has the same name.
+    """
+
+    if isinstance(command, str):
+        return command
+    return " ".join(argument if argument == "key=clear" or "=" not in argument
+                    else argument.partition("=")[0] + "=\u2026" for argument in command)
+
+
+def run(command):
+    """ Execute the command (list of arguments) using the current runner and record how
+    long it took (in timings and as a tracing span). Return the
+    subprocess.CompletedProcess object.
+    """
+
+    start = time.perf_counter_ns()
+    output = _runner.run(command)
+    duration = time.perf_counter_ns() - start
+    timings.add(command, duration / 1e9, output.returncode)
+    tracing.tracer.add(span_name(command), "netsh", start, duration,
+                       {"returncode": output.returncode})
+    return output
+
+
+def netsh(*arguments):
+    """ Execute netsh with the given arguments, e.g. netsh("wlan", "show", "profile")."""
+
+    return run(["netsh"] + list(arguments))
@@ -1,207 +1,870 @@
-""" This module is responsible to create Tree View where save wifi in the
-system of user will displayed with other data like (SSID name, Authentication,
-Key) and also having functionality to delete the Wi-Fi profile from the system
-and refresh the content of the TreeView."""
-
-import os
-import subprocess
-import tkinter as tk
-import tkinter.font as tkfont
-import tkinter.ttk as ttk
-
-from . import top_level_window as db
-from . import wifi_data as saved_wifi_info
-
-
-class WifiDisplayBox:
-    """ Creates a TreeView and display all the saved wifi and their
-    SSID's, Authentication and Password.
-    """
-
-    def __init__(self, app_path, frame):
-        self.frame = frame
-        self.tree_view = None
-        self.list_of_children = None
-        self.app_path = app_path
-        self.getting_data_obj = GettingData(app_path)
-        self.create_treeview()
-        self.build_tree()
-        self.index_of_previous_item = ("", "", False)
-
-    def get_wifi_list(self):
-        """ Called generating_wifi_list() function of SavedInfoFile."""
-        return self.getting_data_obj.wifi_list()
-
-    def create_treeview(self):
-        """ Create tree view and configure style for it."""
-
-        # Defining styling for TreeView.
-        style = ttk.Style(self.frame)
-        style.configure("Treeview.Heading", font=("Playfair Display", 11,
-                                                  'bold'), foreground='#6C7A89')
-        style.configure("Treeview", font=('Calibri', 11))
-        style.map("Treeview.Heading",
-                  font=[('pressed', ("Playfair Display", 9, 'bold'))],
-                  foreground=[('pressed', '#264348'), ('active', '#264348')])
-
-        self.tree_view = ttk.Treeview(self.frame, columns=self.getting_data_obj.get_headings(),
-                                      show="headings")
-        headings_treeview = self.getting_data_obj.get_headings()
-
-        # Defining Headings to the TreeView and defining column width.
-        for i in enumerate(headings_treeview):
-            self.tree_view.heading(i[0], text=i[1], anchor=tk.NW)
-            self.tree_view.column(i[0], width=tkfont.Font().measure(i[1].title()),
-                                  minwidth=130, anchor=tk.NW)
-
-        # Adding and Scrollbars to the TreeView.
-        vertical_scrollbar = ttk.Scrollbar(orient="vertical", command=self.tree_view.yview)
-        horizontal_scrollbar = ttk.Scrollbar(orient="horizontal", command=self.tree_view.xview)
-        self.tree_view.configure(yscrollcommand=vertical_scrollbar.set)
-        self.tree_view.configure(xscrollcommand=horizontal_scrollbar.set)
-        self.tree_view.grid(column=0, row=0, sticky='nsew', in_=self.frame)
-        vertical_scrollbar.grid(column=1, row=0, sticky='ns', in_=self.frame)
-        horizontal_scrollbar.grid(column=0, row=1, sticky='ew', in_=self.frame)
-
-        self.frame.grid_columnconfigure(0, weight=1)
-        self.frame.grid_rowconfigure(0, weight=1)
-
-    def build_tree(self):
-        """ Adding the list of wifi to the treeview in the form of ["name", "", "" ,""]."""
-
-        # Add rows to the TreeView with the column[0] = name
-        for item in self.get_wifi_list():
-            self.tree_view.insert('', 'end', values=item, tags='ttk')
-
-        # binding the functions
-        self.tree_view.tag_bind('ttk', sequence="<<TreeviewSelect>>", callback=self.treeview_select)
-        self.list_of_children = list(self.tree_view.get_children())
-
-    def treeview_select(self, _=None):
-        """ Function is called when user select any of the row in TreeView and displays
-        the SSID, Authentication, Key of the selected row and deletes the SSID,
-        Authentication and Key of previous selected row.
-        """
-
-        # get id of the selected row.
-        item_id = self.tree_view.focus()
-
-        # If user move from previous selected row to newly selected row, it removes
-        # the SSId, Authentication, Key of previously selected row(except name).
-        if self.index_of_previous_item[-1]:
-            values_ = [self.index_of_previous_item[1], "", "", ""]
-            self.tree_view.item(self.index_of_previous_item[0], values=values_)
-
-        # The below code displays the SSID, Authentication, Key of newly selected row
-        name = self.tree_view.item(item_id)['values'][0]
-        current_item_detail = self.getting_data_obj.detailed_list(name)
-        self.tree_view.item(item_id, values=[*current_item_detail])
-        self.index_of_previous_item = (item_id, name, True)
-
-    def refresh_treeview(self):
-        """ Refresh the treeView and add or remove the profile from the TreeView
-        if it is not present any more or newly added respectively.
-        """
-
-        # If in a TreeView any row is selected then deselect it.
-        try:
-            if self.tree_view.focus():
-                self.tree_view.item(self.index_of_previous_item[0],
-                                    values=[self.index_of_previous_item[-2], "", "", ""])
-                self.index_of_previous_item = ("", "", False)
-
-            if os.path.isfile(self.app_path + "\\Saved Wifi list.txt"):
-                os.remove(self.app_path + "\\Saved Wifi list.txt")
-
-            # clearing the whole treeview
-            for i in self.list_of_children:
-                self.tree_view.delete(i)
-
-            # Generating fresh newly wifi list.
-            self.getting_data_obj.create_wifi_list()
-            # Modify rows of tree view and remove or add newly added data.
-            self.build_tree()
-            return True
-
-        except Exception:
-            return
-
-    def delete_profile(self, parent_window):
-        """ Delete Wi-Fi profile and all its content from the System."""
-
-        try:
-            if len(self.list_of_children) < 1:
-                text = "No item available to delete."
-                db.MessageBox(parent_window, text, "error")
-            # Return id and name of selected or highlighted row
-            iid = self.tree_view.focus()
-            name = self.tree_view.item(iid)['values'][0]
-            index_ = self.list_of_children.index(iid)  # return the index of the iid in the list
-
-            # Delete the wifi profile from tree view as well as from system
-            self.tree_view.delete(iid)
-            self.list_of_children.pop(index_)
-            self.index_of_previous_item = ("", "", False)
-
-            # Removes the Wi-Fi profile from the user system.
-            command = 'netsh wlan delete profile name="' + name + '"'
-            subprocess.run(command, shell=True, capture_output=True, text=True)
-
-            # Remove the xml or text file also, which is saved in temp_ directory.
-            text_file_name = str(sum([ord(i) for i in name]))
-            if os.path.isfile(self.app_path + "\\temp_\\Wi-Fi-" + name + ".xml"):
-                os.remove(self.app_path + "\\temp_\\Wi-Fi-" + name + ".xml")
-
-            elif os.path.isfile(self.app_path + "\\temp_\\" + text_file_name + ".txt"):
-                os.remove(self.app_path + "\\temp_\\" + text_file_name + ".txt")
-
-            # When the selected row deleted, the below code decides where to move the focus next
-            # means to select which row.
-            if len(self.list_of_children) >= 1:
-                if index_ == len(self.list_of_children):
-                    index_ = index_ - 1
-                self.tree_view.selection_set(self.list_of_children[index_])
-                self.tree_view.focus(self.list_of_children[index_])
-
-            # Pop-Up message to display that profile successfully deleted.
-            text = "Successfully deleted."
-            db.MessageBox(parent_window, text, "warning")
-
-        except Exception:
-            self.index_of_previous_item = ("", "", False)
-            text = "Unable to delete. Software is facing several issue during deletion."
-            db.MessageBox(parent_window, text, "error")
-
-
-class GettingData:
-    """ This is a helping class which will help WifiDisplayBox to call methods of SavedWifiInfo and
-    reformat and parse some of the results return by methods of SavedWifiInfo.
-    """
-
-    def __init__(self, app_path):
-        self.app_path = app_path
-        self.wifi_information = saved_wifi_info.WifiInformation(self.app_path)
-        self.headings_of_treeview = ['Wifi Name', 'SSID', 'Authentication', 'Password']
-
-    def create_wifi_list(self):
-        """ Return newly created wifi list."""
-        self.wifi_information.generating_wifi_list()
-
-    def get_headings(self):
-        """ Return list of heading names """
-        return self.headings_of_treeview
-
-    def wifi_list(self):
-        """ Return wifi data of specific profile in the form of
-        ["name", "" ,"", ""]
-        """
-        return self.wifi_information.retrieving_list_of_wifi()
-
-    def detailed_list(self, name):
-        """ Return wifi data of specific profile in the form of
-        ["name", "ssid" ,"authentication", "key"]
-        """
-        profile_detail = self.wifi_information.wifi_details(name)
-        if profile_detail[-1] is None or profile_detail[-1] == "*None*":
-            profile_detail[-1] = ""
-        return profile_detail
+""" This module is responsible to create Tree View where save wifi in the
+system of user will displayed with other data like (SSID name, Authentication,
+Key) and also having functionality to delete the Wi-Fi profile from the system
+and refresh the content of the TreeView."""
+
+import bisect
+import time
+import tkinter as tk
+import tkinter.font as tkfont
+import tkinter.ttk as ttk
+
+from . import top_level_window as db
+from . import tracing
+from . import wifi_data as saved_wifi_info
+from .background import BackgroundTasks
+
+
+class ProfileListModel:
+    """ Sorted list of profile names shown in the TreeView. Position of a name is found
+    by binary search (O(log n)), so the view can find and remove a row without scanning
+    the list. The list can be filtered: only the names for which the query is
+    part of the name or of the SSID (ignoring case) are shown.
+    """
+
+    def __init__(self, names=()):
+        self.all_names = sorted(names, key=self.sort_key)  # Every profile.
+        self.all_keys = [self.sort_key(name) for name in self.all_names]
+        self.names = list(self.all_names)  # Profiles which match the query.
+        self.keys = list(self.all_keys)
+        self.query = ""  # Casefolded query, empty if list is not filtered.
+        self.ssids = {}  # {name: ssid} of profiles whose SSID is known.
+        self.search_text = {}  # {name: casefolded name and SSID}, computed when needed.
+
+    @staticmethod
+    def sort_key(name):
+        """ Names are sorted like the list of Wi-Fi (ignoring case)."""
+        return name.lower(), name
+
+    def __len__(self):
+        return len(self.names)
+
+    def __getitem__(self, index):
+        return self.names[index]
+
+    def __contains__(self, name):
+        return self.index(name) is not None
+
+    def position(self, name):
+        """ Return the position where the name is (or would be inserted)."""
+        return bisect.bisect_left(self.keys, self.sort_key(name))
+
+    def index(self, name):
+        """ Return the position of the name, None if it is not in the list."""
+
+        index = self.position(name)
+        if index < len(self.names) and self.names[index] == name:
+            return index
+        return None
+
+    def all_index(self, name):
+        """ Return the position of the name in the list of every profile, None if it is
+        not there.
+        """
+
+        index = bisect.bisect_left(self.all_keys, self.sort_key(name))
+        if index < len(self.all_names) and self.all_names[index] == name:
+            return index
+        return None
+
+    def matches(self, name, query=None):
+        """ Return True if the query (default: current query) is part of the name or SSID."""
+
+        query = self.query if query is None else query
+        if not query:
+            return True
+        text = self.search_text.get(name)
+        if text is None:
+            text = self.search_text[name] = (name + "\n" + self.ssids.get(name, "")).casefold()
+        return query in text
+
+    def remove(self, name):
+        """ Remove the name and return its position, None if it is not shown."""
+
+        index = self.all_index(name)
+        if index is not None:
+            del self.all_names[index]
+            del self.all_keys[index]
+        self.search_text.pop(name, None)
+        index = self.index(name)
+        if index is not None:
+            del self.names[index]
+            del self.keys[index]
+        return index
+
+    def update(self, names):
+        """ Replace the list with the given names. Return (removed, added) names."""
+
+        fresh = set(names)
+        current = set(self.all_names)
+        removed = [name for name in self.all_names if name not in fresh]
+        added = [name for name in fresh if name not in current]
+        if removed or added:
+            self.all_names = sorted(fresh, key=self.sort_key)
+            self.all_keys = [self.sort_key(name) for name in self.all_names]
+            for name in removed:
+                self.search_text.pop(name, None)
+            self.filter(self.query, force=True)
+        return removed, added
+
+    def set_ssids(self, ssids):
+        """ Update the SSIDs used by the filter, ssids is in the form of {name: ssid}. A
+        profile which matches the query because of its new SSID is shown and one which
+        doesn't match anymore is hidden. Return True if the shown names are changed.
+        """
+
+        changed = [name for name, ssid in ssids.items()
+                   if ssid is not None and self.ssids.get(name) != ssid]
+        shown_changed = False
+        for name in changed:
+            self.ssids[name] = ssids[name]
+            self.search_text.pop(name, None)
+            if not self.query or self.all_index(name) is None:
+                continue
+            index = self.index(name)
+            if index is None and self.matches(name):
+                index = self.position(name)
+                self.names.insert(index, name)
+                self.keys.insert(index, self.sort_key(name))
+                shown_changed = True
+            elif index is not None and not self.matches(name):
+                del self.names[index]
+                del self.keys[index]
+                shown_changed = True
+        return shown_changed
+
+    def filter(self, query, force=False):
+        """ Show only the names which match the query. If the query only adds characters
+        to the previous one, only the names shown now are searched. Return True if the
+        shown names are changed.
+        """
+
+        query = query.strip().casefold()
+        if query == self.query and not force:
+            return False
+
+        if not query:
+            self.names, self.keys = list(self.all_names), list(self.all_keys)
+        else:
+            if self.query and query.startswith(self.query) and not force:
+                source = zip(self.names, self.keys)  # Narrowing the previous result.
+            else:
+                source = zip(self.all_names, self.all_keys)
+            shown = [(name, key) for name, key in source if self.matches(name, query)]
+            self.names = [name for name, _ in shown]
+            self.keys = [key for _, key in shown]
+        self.query = query
+        return True
+
+
+class WifiDisplayBox:
+    """ Creates a TreeView and display all the saved wifi and their
+    SSID's, Authentication and Password. The TreeView is virtualised: only the rows which
+    fit in the window exist in the TreeView and they are filled from ProfileListModel
+    when the list is scrolled, so thousands of profiles don't make the window slow.
+    """
+
+    def __init__(self, app_path, frame, tasks=None, profiler=None, batch_tasks=None):
+        self.frame = frame
+        # ActionProfiler which profiles selection of a row and deletion of profiles.
+        self.profiler = profiler
+        self.tree_view = None
+        self.vertical_scrollbar = None
+        self.model = ProfileListModel()
+        self.rows = []  # Items of the TreeView, rows[i] displays model[first + i]
+        self.detached = set()  # Items which are not displayed (end of the list).
+        self.first = 0  # Position (in model) of the row displayed on the top.
+        self.selected = None  # Name of the selected profile (whose details are shown).
+        self.selected_values = None  # Values displayed in the row of selected profile.
+        self.marked = set()  # Names of every selected profile (Ctrl or Shift + click).
+        self.anchor = None  # Name of the profile where Shift + click range starts.
+        self.deleting = False  # True while selected profiles are being deleted.
+        self.filter_text = None  # Text of the filter entry.
+        self.filter_job = None  # Pending (debounced) update of the filter.
+        self.app_path = app_path
+        self.getting_data_obj = GettingData(app_path)
+        # Details are retrieved on worker threads, so selecting a row never freezes the GUI.
+        self.tasks = tasks if tasks is not None else BackgroundTasks(frame)
+        # Deletion of profiles is a long batch job, it doesn't hold up the details of a row.
+        self.batch_tasks = (batch_tasks if batch_tasks is not None
+                            else BackgroundTasks(frame, max_workers=1))
+        self.pending_detail = None  # Future of the details which are being retrieved.
+        self.detail_request = 0  # Incremented every time the old request becomes stale.
+        self.create_treeview()
+        self.build_tree()
+
+    def get_wifi_list(self):
+        """ Called generating_wifi_list() function of SavedInfoFile."""
+        return self.getting_data_obj.wifi_list()
+
+    def create_treeview(self):
+        """ Create tree view and configure style for it."""
+
+        # Defining styling for TreeView.
+        style = ttk.Style(self.frame)
+        style.configure("Treeview.Heading", font=("Playfair Display", 11,
+                                                  'bold'), foreground='#6C7A89')
+        style.configure("Treeview", font=('Calibri', 11))
+        style.map("Treeview.Heading",
+                  font=[('pressed', ("Playfair Display", 9, 'bold'))],
+                  foreground=[('pressed', '#264348'), ('active', '#264348')])
+
+        self.tree_view = ttk.Treeview(self.frame, columns=self.getting_data_obj.get_headings(),
+                                      show="headings", selectmode="extended")
+        headings_treeview = self.getting_data_obj.get_headings()
+
+        # Defining Headings to the TreeView and defining column width.
+        for i in enumerate(headings_treeview):
+            self.tree_view.heading(i[0], text=i[1], anchor=tk.NW)
+            self.tree_view.column(i[0], width=tkfont.Font().measure(i[1].title()),
+                                  minwidth=130, anchor=tk.NW)
+
+        # Entry above the TreeView which filters the rows while user types (by name or
+        # SSID). The list is filtered when user stops typing for a moment.
+        filter_frame = tk.Frame(self.frame, background='white')
+        tk.Label(filter_frame, text="Search:", background='white',
+                 font=('Calibri', 11)).pack(side=tk.LEFT, padx=(0, 5))
+        self.filter_text = tk.StringVar(filter_frame)
+        filter_entry = ttk.Entry(filter_frame, textvariable=self.filter_text,
+                                 font=('Calibri', 11))
+        filter_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        filter_entry.bind("<Escape>", lambda _: self.filter_text.set(""))
+        self.filter_text.trace_add("write", lambda *_: self.schedule_filter())
+
+        # Adding and Scrollbars to the TreeView. Vertical scrollbar scrolls the model,
+        # not the TreeView (which only has the visible rows).
+        self.vertical_scrollbar = ttk.Scrollbar(orient="vertical", command=self.scroll)
+        horizontal_scrollbar = ttk.Scrollbar(orient="horizontal", command=self.tree_view.xview)
+        self.tree_view.configure(xscrollcommand=horizontal_scrollbar.set)
+        filter_frame.grid(column=0, row=0, columnspan=2, sticky='ew', pady=(0, 5),
+                          in_=self.frame)
+        self.tree_view.grid(column=0, row=1, sticky='nsew', in_=self.frame)
+        self.vertical_scrollbar.grid(column=1, row=1, sticky='ns', in_=self.frame)
+        horizontal_scrollbar.grid(column=0, row=2, sticky='ew', in_=self.frame)
+
+        self.frame.grid_columnconfigure(0, weight=1)
+        self.frame.grid_rowconfigure(1, weight=1)
+
+        # Scrolling and moving the selection is done on the model.
+        self.tree_view.bind("<Configure>", lambda _: self.tree_view.after_idle(self.fit_rows))
+        self.tree_view.bind("<MouseWheel>", lambda event: self.scroll_by(
+            -3 if event.delta > 0 else 3))
+        self.tree_view.bind("<Button-4>", lambda _: self.scroll_by(-3))
+        self.tree_view.bind("<Button-5>", lambda _: self.scroll_by(3))
+        self.tree_view.bind("<Up>", lambda _: self.move_selection(-1))
+        self.tree_view.bind("<Down>", lambda _: self.move_selection(1))
+        self.tree_view.bind("<Prior>", lambda _: self.move_selection(-len(self.rows)))
+        self.tree_view.bind("<Next>", lambda _: self.move_selection(len(self.rows)))
+        self.tree_view.bind("<Home>", lambda _: self.move_selection(-len(self.model)))
+        self.tree_view.bind("<End>", lambda _: self.move_selection(len(self.model)))
+        self.tree_view.bind("<Control-Button-1>", self.toggle_mark)
+        self.tree_view.bind("<Shift-Button-1>", self.mark_range)
+        self.tree_view.bind("<Control-a>", self.mark_all)
+
+    def build_tree(self):
+        """ Adding the list of wifi to the model and display the rows which fit in the
+        TreeView in the form of ["name", "", "" ,""].
+        """
+
+        self.model = ProfileListModel(item[0] for item in self.get_wifi_list())
+        self.model.set_ssids(self.getting_data_obj.cached_ssids())
+        self.set_row_count(int(self.tree_view.cget("height")))
+
+        # binding the functions
+        treeview_select = self.treeview_select
+        if self.profiler is not None:
+            treeview_select = self.profiler.wrap("treeview_select", treeview_select)
+        self.tree_view.tag_bind('ttk', sequence="<<TreeviewSelect>>", callback=treeview_select)
+
+    def set_row_count(self, count):
+        """ Create or remove items of the TreeView so it has count rows, then display the
+        model in them.
+        """
+
+        count = max(1, count)
+        while len(self.rows) < count:
+            self.rows.append(self.tree_view.insert('', 'end', values=("", "", "", ""),
+                                                   tags='ttk'))
+        if len(self.rows) > count:
+            self.tree_view.delete(*self.rows[count:])
+            self.detached.difference_update(self.rows[count:])
+            del self.rows[count:]
+        self.render()
+
+    def fit_rows(self):
+        """ Called when TreeView is resized, number of rows is changed to fill it."""
+
+        bbox = self.tree_view.bbox(self.rows[0]) if self.rows else ""
+        if not bbox:  # First row is not displayed (e.g. list is empty).
+            return
+        _, top, _, row_height = bbox
+        count = max(1, (self.tree_view.winfo_height() - top) // max(1, row_height))
+        if count != len(self.rows):
+            self.set_row_count(count)
+
+    def render(self):
+        """ Fill the items of the TreeView with the rows of the model starting from first
+        and select the items of selected profiles which are displayed.
+        """
+
+        self.first = max(0, min(self.first, len(self.model) - len(self.rows)))
+        selected_item = None
+        marked_items = []
+        for offset, iid in enumerate(self.rows):
+            position = self.first + offset
+            if position >= len(self.model):
+                if iid not in self.detached:
+                    self.tree_view.detach(iid)
+                    self.detached.add(iid)
+                continue
+            name = self.model[position]
+            if name == self.selected:
+                values = self.selected_values
+                selected_item = iid
+            else:
+                values = (name, "", "", "")
+            if name in self.marked:
+                marked_items.append(iid)
+            self.tree_view.item(iid, values=values)
+            if iid in self.detached:
+                self.tree_view.move(iid, '', offset)
+                self.detached.discard(iid)
+
+        if set(self.tree_view.selection()) != set(marked_items):
+            if marked_items:
+                self.tree_view.selection_set(marked_items)
+            else:
+                self.tree_view.selection_remove(*self.tree_view.selection())
+        if selected_item is not None:
+            self.tree_view.focus(selected_item)
+
+        # Scrollbar shows which part of the model is displayed.
+        if self.model:
+            self.vertical_scrollbar.set(self.first / len(self.model),
+                                        min(1, (self.first + len(self.rows)) / len(self.model)))
+        else:
+            self.vertical_scrollbar.set(0, 1)
+
+    def schedule_filter(self, delay=150):
+        """ Called on every change of the filter entry, filters the list when user has
+        not typed anything for delay milliseconds (so every key press doesn't search
+        the whole list).
+        """
+
+        if self.filter_job is not None:
+            self.tree_view.after_cancel(self.filter_job)
+        self.filter_job = self.tree_view.after(delay, self.apply_filter)
+
+    def apply_filter(self):
+        """ Show only the rows which match the text of the filter entry."""
+
+        self.filter_job = None
+        # SSIDs retrieved since last time are searched too.
+        changed = self.model.set_ssids(self.getting_data_obj.cached_ssids())
+        if not self.model.filter(self.filter_text.get()) and not changed:
+            return
+        if self.selected is not None and self.selected not in self.model:
+            self.cancel_pending_detail()
+            self.selected = None
+        self.marked = {name for name in self.marked if name in self.model}
+        self.first = 0 if self.selected is None else self.model.index(self.selected)
+        self.render()
+        self.tree_view.after_idle(self.fit_rows)
+
+    def scroll(self, action, amount, unit=None):
+        """ Command of vertical scrollbar, ('moveto', fraction) or ('scroll', n, unit)."""
+
+        if action == "moveto":
+            self.first = round(float(amount) * len(self.model))
+            self.render()
+        else:
+            self.scroll_by(int(amount) * (len(self.rows) if unit == "pages" else 1))
+
+    def scroll_by(self, count):
+        """ Scroll the list by count rows (up if count is negative)."""
+
+        self.first += count
+        self.render()
+        return "break"
+
+    def see(self, position):
+        """ Scroll the list (if needed) so the row at position is displayed."""
+
+        if position < self.first:
+            self.first = position
+        elif position >= self.first + len(self.rows):
+            self.first = position - len(self.rows) + 1
+
+    def move_selection(self, count):
+        """ Select the row which is count rows below (or above) the selected row."""
+
+        if self.model:
+            position = self.model.index(self.selected) if self.selected is not None else None
+            position = self.first if position is None else position + count
+            self.select(self.model[max(0, min(position, len(self.model) - 1))])
+        return "break"
+
+    @tracing.traced(category="ui")
+    def treeview_select(self, _=None):
+        """ Function is called when user select any of the row in TreeView and displays
+        the SSID, Authentication, Key of the selected row and deletes the SSID,
+        Authentication and Key of previous selected row.
+        """
+
+        # Nothing to do if the selection is the one set by render().
+        visible = self.model.names[self.first:self.first + len(self.rows)]
+        selection = {visible[self.rows.index(iid)] for iid in self.tree_view.selection()
+                     if iid in self.rows and self.rows.index(iid) < len(visible)}
+        if selection == {name for name in visible if name in self.marked}:
+            return
+
+        # get id of the row clicked by user.
+        item_id = self.tree_view.focus()
+        if item_id in self.rows and self.rows.index(item_id) < len(visible):
+            self.select(visible[self.rows.index(item_id)])
+
+    def clicked_name(self, event):
+        """ Return name of the profile in the row under the mouse, None if no row."""
+
+        item_id = self.tree_view.identify_row(event.y)
+        if item_id not in self.rows or self.first + self.rows.index(item_id) >= len(self.model):
+            return None
+        return self.model[self.first + self.rows.index(item_id)]
+
+    def toggle_mark(self, event):
+        """ Ctrl + click, add the row to the selection or remove it."""
+
+        name = self.clicked_name(event)
+        if name is None:
+            return "break"
+        if self.selected is None:
+            self.select(name)
+            return "break"
+        if name in self.marked:
+            self.marked.discard(name)
+            if name == self.selected:
+                self.cancel_pending_detail()
+                self.selected = None
+        else:
+            self.marked.add(name)
+        self.anchor = name
+        self.render()
+        return "break"
+
+    def mark_range(self, event):
+        """ Shift + click, select every row from the anchor till the clicked row."""
+
+        name = self.clicked_name(event)
+        if name is None:
+            return "break"
+        start = self.model.index(self.anchor) if self.anchor is not None else None
+        if start is None:
+            self.select(name)
+            return "break"
+        end = self.model.index(name)
+        start, end = min(start, end), max(start, end)
+        self.marked = set(self.model.names[start:end + 1])
+        if self.selected is not None:
+            self.marked.add(self.selected)
+        self.render()
+        return "break"
+
+    def mark_all(self, _=None):
+        """ Ctrl + A, select every row (which matches the filter)."""
+
+        self.marked = set(self.model.names)
+        self.render()
+        return "break"
+
+    def select(self, name):
+        """ Select the row of the profile and display its SSID, Authentication and Key.
+        The details of previous selected row are removed (except name).
+        """
+
+        # The below code retrieves the SSID, Authentication, Key of newly selected row on
+        # a worker thread and displays "loading..." in the row until they are retrieved.
+        self.cancel_pending_detail()
+        request = self.detail_request
+        self.selected = name
+        self.marked = {name}
+        self.anchor = name
+        self.selected_values = [name, "loading\u2026", "", ""]
+        self.pending_detail = self.tasks.submit(
+            self.getting_data_obj.detailed_list, name,
+            callback=lambda detail: self.show_detail(request, detail),
+            error_callback=lambda _: self.show_detail(
+                request, [name, "*Unable to find*", "", ""]))
+        self.see(self.model.index(name))
+        self.render()
+
+    def cancel_pending_detail(self):
+        """ Cancel the retrieval of details of previously selected row (if it is not
+        started yet) and mark its result as stale so it will not be displayed.
+        """
+
+        self.detail_request += 1
+        if self.pending_detail is not None:
+            self.pending_detail.cancel()
+            self.pending_detail = None
+
+    def show_detail(self, request, detail):
+        """ Display the retrieved details in the row, if user has not moved to another
+        row in the meantime.
+        """
+
+        if request != self.detail_request:
+            return
+        self.pending_detail = None
+        self.selected_values = [*detail]
+        self.render()
+
+    @tracing.traced(category="ui")
+    def refresh_treeview(self):
+        """ Refresh the treeView and add or remove the profile from the TreeView
+        if it is not present any more or newly added respectively.
+        """
+
+        try:
+            # Generating fresh newly wifi list.
+            self.getting_data_obj.create_wifi_list()
+
+            # Remember the row on the top, so the list doesn't scroll when rows are
+            # added or removed above it.
+            top_name = self.model[self.first] if self.first < len(self.model) else None
+            removed, _ = self.model.update(item[0] for item in self.get_wifi_list())
+            self.model.set_ssids(self.getting_data_obj.cached_ssids())
+
+            # Removed profiles and profiles hidden by the filter (new SSID) are unselected.
+            if self.selected is not None and self.selected not in self.model:
+                self.cancel_pending_detail()
+                self.selected = None
+            self.marked = {name for name in self.marked if name in self.model}
+            if top_name is not None:
+                self.first = self.model.position(top_name)
+            self.render()
+            self.tree_view.after_idle(self.fit_rows)
+            return True
+
+        except Exception:
+            return
+
+    def delete_profile(self, parent_window):
+        """ Delete the selected Wi-Fi profiles and all their content from the System.
+        Profiles are deleted on a worker thread and a single message with the result
+        is displayed at the end.
+        """
+
+        if self.deleting:
+            return
+        if len(self.model) < 1:
+            text = "No item available to delete."
+            db.MessageBox(parent_window, text, "error")
+            return
+        names = sorted((name for name in self.marked if name in self.model),
+                       key=self.model.sort_key)
+        if not names:
+            text = "Select the Wi-Fi profiles to delete (Ctrl or Shift + click to select many)."
+            db.MessageBox(parent_window, text, "error")
+            return
+
+        # Row which is selected after the deletion (the row below first deleted row).
+        position = min(self.model.index(name) for name in names)
+        self.deleting = True
+        self.cancel_pending_detail()
+
+        # Removes the Wi-Fi profiles from the user system, also the xml files and cached
+        # details, which are saved in temp_ directory.
+        delete_profiles = self.getting_data_obj.wifi_information.delete_profiles
+        if self.profiler is not None:
+            delete_profiles = self.profiler.wrap("delete_profile", delete_profiles)
+        self.batch_tasks.submit(
+            delete_profiles, names,
+            callback=lambda results: self.profiles_deleted(parent_window, position, results),
+            error_callback=lambda _: self.profiles_deleted(
+                parent_window, position, [(name, False, "Software is facing several issue "
+                                                        "during deletion.") for name in names]))
+
+    def profiles_deleted(self, parent_window, position, results):
+        """ Called when profiles are deleted, removes the deleted rows from TreeView at
+        once and displays the result. results is in the form of [(name, deleted, reason),].
+        """
+
+        self.deleting = False
+        for name, deleted, _ in results:
+            if deleted:
+                self.model.remove(name)
+                self.marked.discard(name)
+        if self.selected is not None and self.selected not in self.model:
+            self.selected = None
+
+        # When the selected rows are deleted, the below code decides where to move the
+        # focus next means to select which row.
+        if len(self.model) >= 1:
+            self.select(self.model[min(position, len(self.model) - 1)])
+        else:
+            self.render()
+
+        # Pop-Up message to display that profiles are successfully deleted or not.
+        failed = [(name, reason) for name, deleted, reason in results if not deleted]
+        if not failed:
+            text = "Successfully deleted." if len(results) == 1 else \
+                "Successfully deleted %d profiles." % len(results)
+            db.MessageBox(parent_window, text, "warning")
+            return
+
+        text = "Deleted %d of %d profiles.\nUnable to delete:\n" % (
+            len(results) - len(failed), len(results))
+        text += "\n".join(name + ": " + reason for name, reason in failed[:10])
+        if len(failed) > 10:
+            text += "\n\u2026 and %d more." % (len(failed) - 10)
+        db.MessageBox(parent_window, text, "error")
+
+    def saved_ssids(self):
+        """ Return set of names and known SSIDs of the saved profiles (name of a profile
+        is its SSID unless user changed it).
+        """
+        return set(self.model.all_names) | set(self.getting_data_obj.cached_ssids().values())
+
+
+class NearbyNetworksBox:
+    """ Creates a TreeView which displays the nearby networks, one row for every access
+    point (BSSID) sorted by signal, and marks the networks which have a saved profile.
+    The list is scanned again every few seconds while it is displayed (start() and
+    stop()), scans are done on a worker thread by NetworkScanner, which uses its last
+    scan if it is fresh, so refreshing the list often doesn't start netsh every time.
+    Every new scan is also given to the ChannelAnalyser (if any), whose result is
+    displayed by 'Channels' button.
+    """
+
+    HEADINGS = ["SSID", "BSSID", "Signal", "Channel", "Band", "Radio type",
+                "Authentication", "Saved"]
+
+    def __init__(self, frame, tasks, scanner, saved_ssids, interval=10000, analyser=None):
+        """ frame is the parent frame, tasks is BackgroundTasks, scanner is
+        NetworkScanner, saved_ssids is called to get the set of saved SSIDs (see
+        WifiDisplayBox.saved_ssids), interval is milliseconds between two scans and
+        analyser is ChannelAnalyser.
+        """
+
+        self.frame = frame
+        self.tasks = tasks
+        self.scanner = scanner
+        self.saved_ssids = saved_ssids
+        self.interval = interval
+        self.analyser = analyser
+        self.analysed_at = None  # scanned_at of the last scan given to analyser.
+        self.pending = None  # Future of the scan which is running.
+        self.after_id = None
+        self.running = False
+        self.tree_view = None
+        self.status_label = None
+        self.create_treeview()
+
+    def create_treeview(self):
+        """ Create tree view, the status of last scan and the button to scan now."""
+
+        top_frame = tk.Frame(self.frame, background='white')
+        self.status_label = tk.Label(top_frame, text="Not scanned yet", background='white',
+                                     font=('Calibri', 11))
+        self.status_label.pack(side=tk.LEFT)
+        ttk.Button(top_frame, text="Scan Now", cursor="hand2",
+                   command=lambda: self.refresh(force=True)).pack(side=tk.RIGHT)
+        if self.analyser is not None:
+            ttk.Button(top_frame, text="Channels", cursor="hand2",
+                       command=self.show_channels).pack(side=tk.RIGHT, padx=5)
+
+        self.tree_view = ttk.Treeview(self.frame, columns=self.HEADINGS, show="headings",
+                                      selectmode="browse")
+        for index, heading in enumerate(self.HEADINGS):
+            self.tree_view.heading(index, text=heading, anchor=tk.NW)
+            self.tree_view.column(index, width=tkfont.Font().measure(heading) + 20,
+                                  minwidth=60, anchor=tk.NW)
+        self.tree_view.tag_configure("saved", foreground="green")
+
+        vertical_scrollbar = ttk.Scrollbar(self.frame, orient="vertical",
+                                           command=self.tree_view.yview)
+        self.tree_view.configure(yscrollcommand=vertical_scrollbar.set)
+        top_frame.grid(column=0, row=0, columnspan=2, sticky='ew', pady=(0, 5))
+        self.tree_view.grid(column=0, row=1, sticky='nsew')
+        vertical_scrollbar.grid(column=1, row=1, sticky='ns')
+        self.frame.grid_columnconfigure(0, weight=1)
+        self.frame.grid_rowconfigure(1, weight=1)
+
+    def start(self):
+        """ Display the last scan and keep scanning while the list is displayed."""
+
+        if not self.running:
+            self.running = True
+            if self.scanner.scanned_at is not None:
+                self.show(self.scanner.networks)
+            self.refresh()
+
+    def stop(self):
+        """ Stop scanning (e.g. when other tab is displayed)."""
+
+        self.running = False
+        if self.after_id is not None:
+            self.frame.after_cancel(self.after_id)
+            self.after_id = None
+
+    def refresh(self, force=False):
+        """ Scan on a worker thread (unless a scan is running), the last scan is used if
+        it is fresh and force is False.
+        """
+
+        if self.after_id is not None:
+            self.frame.after_cancel(self.after_id)
+            self.after_id = None
+        if self.pending is None:
+            self.pending = self.tasks.submit(self.scanner.scan, force,
+                                             callback=self.scanned,
+                                             error_callback=lambda _: self.scanned([]))
+
+    def scanned(self, networks):
+        """ Called on Tk thread with the result of the scan."""
+
+        self.pending = None
+        # An empty list is a failed scan (netsh or the task failed), adding it would make
+        # every channel look less crowded.
+        if self.analyser is not None and networks and \
+                self.scanner.scanned_at != self.analysed_at:
+            self.analysed_at = self.scanner.scanned_at
+            self.analyser.add_scan(networks)
+        self.show(networks)
+        if self.running:
+            self.after_id = self.frame.after(self.interval, self.refresh)
+
+    def show(self, networks):
+        """ Fill the TreeView with the networks (list of NetworkRecord), the selected
+        access point stays selected.
+        """
+
+        selected = [self.tree_view.set(item, "BSSID") for item in self.tree_view.selection()]
+        self.tree_view.delete(*self.tree_view.get_children())
+        saved = self.saved_ssids()
+        networks = sorted(networks, key=lambda network: (-(network.signal or 0),
+                                                         network.ssid.lower()))
+        for network in networks:
+            is_saved = network.ssid in saved
+            item = self.tree_view.insert("", tk.END, tags=("saved",) if is_saved else (),
+                                         values=(network.ssid or "(hidden network)",
+                                                 network.bssid or "",
+                                                 "" if network.signal is None
+                                                 else "%d%%" % network.signal,
+                                                 network.channel or "", network.band or "",
+                                                 network.radio_type or "",
+                                                 network.authentication or "",
+                                                 "\u2713" if is_saved else ""))
+            if network.bssid is not None and network.bssid in selected:
+                self.tree_view.selection_set(item)
+
+        # Time of the scan itself, which can be older than now if it was fresh enough.
+        scanned_at = time.time()
+        if self.scanner.scanned_at is not None:
+            scanned_at -= self.scanner.clock() - self.scanner.scanned_at
+        self.status_label.configure(text="%d networks, %d access points (scanned at %s)" % (
+            len({network.ssid for network in networks}), len(networks),
+            time.strftime("%H:%M:%S", time.localtime(scanned_at))))
+
+    def show_channels(self):
+        """ Display the least congested channel of every band and the busiest channels,
+        found from the scans of last few minutes.
+        """
+
+        loads = self.analyser.channels()
+        if not loads:
+            db.MessageBox(self.frame.winfo_toplevel(), "No network is found yet.", "warning")
+            return
+        lines = ["Scans of last %d minutes (%d scans):" % (
+            round(self.analyser.window / 60), len(self.analyser.scans))]
+        for band, (channel, score) in self.analyser.recommend(loads).items():
+            lines.append("%s: channel %d is least congested (occupancy %.1f)" % (
+                band, channel, score))
+        lines.append("")
+        lines.append("Busiest channels:")
+        for load in sorted(loads, key=lambda load: -load.occupancy)[:8]:
+            lines.append("Channel %d (%s): %d BSSIDs, %.1f per scan, occupancy %.1f" % (
+                load.channel, load.band, load.bssids, load.mean_bssids, load.occupancy))
+        db.MessageBox(self.frame.winfo_toplevel(), "\n".join(lines), "check")
+
+
+class Sparkline(tk.Canvas):
+    """ Small line chart of recent values (e.g. signal strength) drawn on a Canvas. The
+    line is a single Canvas item whose coordinates are replaced on every update, so
+    drawing does not create new items. NaN values (no signal) break the line.
+    """
+
+    def __init__(self, parent, width=120, height=26, minimum=0, maximum=100, **options):
+        options.setdefault("highlightthickness", 0)
+        super().__init__(parent, width=width, height=height, **options)
+        self.width = width
+        self.height = height
+        self.minimum = minimum
+        self.maximum = maximum
+        self.lines = []  # Canvas items of the parts of the line.
+
+    def draw(self, values):
+        """ Draw the values (oldest first), one point per value from left to right."""
+
+        parts = [[]]
+        step = self.width / max(len(values) - 1, 1)
+        scale = (self.height - 4) / ((self.maximum - self.minimum) or 1)
+        for index, value in enumerate(values):
+            if value != value:  # NaN
+                if parts[-1]:
+                    parts.append([])
+                continue
+            value = min(max(value, self.minimum), self.maximum)
+            parts[-1].extend((index * step, self.height - 2 - (value - self.minimum) * scale))
+        parts = [part for part in parts if part]
+
+        # Items are reused and only the extra ones are created or deleted.
+        for index, part in enumerate(parts):
+            if len(part) == 2:  # A single point is drawn as a short line.
+                part = part + [part[0] + 1, part[1]]
+            if index < len(self.lines):
+                self.coords(self.lines[index], *part)
+            else:
+                self.lines.append(self.create_line(*part, fill="green", width=1.5))
+        for item in self.lines[len(parts):]:
+            self.delete(item)
+        del self.lines[len(parts):]
+
+
+class GettingData:
+    """ This is a helping class which will help WifiDisplayBox to call methods of SavedWifiInfo and
+    reformat and parse some of the results return by methods of SavedWifiInfo.
+    """
+
+    def __init__(self, app_path):
+        self.app_path = app_path
+        self.wifi_information = saved_wifi_info.WifiInformation(self.app_path)
+        self.headings_of_treeview = ['Wifi Name', 'SSID', 'Authentication', 'Password']
+
+    def create_wifi_list(self):
+        """ Return newly created wifi list."""
+        self.wifi_information.generating_wifi_list()
+
+    def cached_ssids(self):
+        """ Return SSIDs of the profiles which are cached in the form of {name: ssid}."""
+        entries = list(self.wifi_information.cache.entries.items())  # Changed by workers too.
+        return {name: entry[0] for name, entry in entries}
+
+    def get_headings(self):
+        """ Return list of heading names """
+        return self.headings_of_treeview
+
+    def wifi_list(self):
+        """ Return wifi data of specific profile in the form of
+        ["name", "" ,"", ""]
+        """
+        return self.wifi_information.retrieving_list_of_wifi()
+
+    def detailed_list(self, name):
+        """ Return wifi data of specific profile in the form of
+        ["name", "ssid" ,"authentication", "key"]
+        """
+        profile_detail = self.wifi_information.wifi_details(name)
+        if profile_detail[-1] is None or profile_detail[-1] == "*None*":
+            profile_detail[-1] = ""
+        return profile_detail
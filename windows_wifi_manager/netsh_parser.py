@@ -0,0 +1,173 @@
+""" This module parses the output of 'netsh wlan show ...' commands. Every line of such
+output which has the form of '    Heading     : value' is a field, the output is read in
+a single pass with one precompiled pattern and fields are grouped into records (e.g. one
+record per interface). Every module of the App uses this module instead of running its
+own regular expressions on the output.
+"""
+
+import re
+from collections import namedtuple
+
+from windows_wifi_manager.tracing import traced
+
+# '    Heading     : value' -> ('Heading', 'value'). Heading is everything before the first
+# colon (values like MAC address or SSID can have colons), value keeps its spaces.
+_FIELD = re.compile(r"^[ \t]*([^:\r\n]*?)[ \t]*: ?(.*?)\r?$", re.MULTILINE)
+
+# Details of a single Wi-Fi interface, values which are not shown by netsh are None
+# (e.g. ssid when interface is disconnected). signal is in percent and rates in Mbps.
+InterfaceRecord = namedtuple("InterfaceRecord", ["name", "state", "ssid", "bssid", "signal",
+                                                 "channel", "receive_rate", "transmit_rate",
+                                                 "profile"])
+
+# Heading of the field in 'netsh wlan show interfaces' and the name of the field in record.
+# Windows 10 and 11 show "AP BSSID", older versions "BSSID".
+INTERFACE_FIELDS = {"Name": "name", "State": "state", "SSID": "ssid", "AP BSSID": "bssid",
+                    "BSSID": "bssid", "Signal": "signal", "Channel": "channel",
+                    "Receive rate (Mbps)": "receive_rate",
+                    "Transmit rate (Mbps)": "transmit_rate", "Profile": "profile"}
+
+# Heading of the field in 'netsh wlan show profile name=... key=clear' and name of the field.
+PROFILE_FIELDS = {"Name": "name", "SSID name": "ssid", "Authentication": "authentication",
+                  "Key Content": "key"}
+
+# Details of a single access point (BSSID) seen by 'netsh wlan show networks mode=bssid',
+# network fields (SSID, authentication, ...) are same for every BSSID of the network.
+# signal is in percent, band (e.g. '5 GHz') is None if not shown by netsh.
+NetworkRecord = namedtuple("NetworkRecord", ["interface", "ssid", "network_type",
+                                             "authentication", "encryption", "bssid",
+                                             "signal", "radio_type", "channel", "band"])
+
+# Heading of the network fields and of the BSSID fields and the name of the field in record.
+NETWORK_FIELDS = {"Network type": "network_type", "Authentication": "authentication",
+                  "Encryption": "encryption"}
+BSSID_FIELDS = {"Signal": "signal", "Radio type": "radio_type", "Channel": "channel",
+                "Band": "band"}
+
+
+def iter_fields(output):
+    """ Yield every field of the output as (heading, value) in the order of output."""
+
+    for match in _FIELD.finditer(output):
+        if match.group(1):
+            yield match.group(1), match.group(2)
+
+
+def parse_records(output, fields, start):
+    """ Group the fields into records. fields is a dictionary {heading: name in record},
+    other headings are ignored. A new record is started every time heading 'start' is
+    found. If a heading occurs more than once in a record, first value is kept. Return
+    list of dictionaries with every name of fields (None if not found).
+    """
+
+    records = []
+    current = None
+    for heading, value in iter_fields(output):
+        name = fields.get(heading)
+        if name is None:
+            continue
+        if heading == start:
+            current = dict.fromkeys(fields.values())
+            records.append(current)
+        if current is not None and current[name] is None:
+            current[name] = value
+    return records
+
+
+@traced(category="parse")
+def parse_profile_names(output):
+    """ Return names of profiles from output of 'netsh wlan show profile'."""
+
+    return [value for heading, value in iter_fields(output) if heading == "All User Profile"]
+
+
+@traced(category="parse")
+def parse_profile_details(output):
+    """ Return list of profiles from output of 'netsh wlan show profile name=... key=clear'
+    (or 'netsh wlan show profile * key=clear' for all profiles) in the form of
+    [{"name": ..., "ssid": ..., "authentication": ..., "key": ...},]. SSID is without the
+    quotes added by netsh and key is None if it is not shown.
+    """
+
+    profiles = parse_records(output, PROFILE_FIELDS, "Name")
+    for profile in profiles:
+        ssid = profile["ssid"]
+        # Only the quotes around SSID are removed, SSID itself can have quotes.
+        if ssid is not None and len(ssid) >= 2 and ssid[0] == ssid[-1] == '"':
+            profile["ssid"] = ssid[1:-1]
+    return profiles
+
+
+@traced(category="parse")
+def parse_networks(output):
+    """ Parse output of 'netsh wlan show networks mode=bssid' and return list of
+    NetworkRecord, one for every BSSID (in the order shown by netsh). Headings like
+    'SSID 2' and 'BSSID 1' start a new network and a new BSSID, the fields of the
+    network are given to each of its BSSIDs. A network without BSSID (output without
+    mode=bssid) gives one record with bssid None.
+    """
+
+    records = []
+    interface = None
+    network = None  # Fields of the current network, None before the first SSID.
+    bssid = None  # Fields of the current BSSID.
+    bssid_count = 0
+
+    def finish():
+        if network is not None and bssid_count == 0:
+            records.append(dict(network, bssid=None, **dict.fromkeys(BSSID_FIELDS.values())))
+
+    for heading, value in iter_fields(output):
+        word, _, number = heading.partition(" ")
+        if heading == "Interface name":
+            finish()
+            interface, network, bssid_count = value, None, 0
+        elif word == "SSID" and number.isdigit():
+            finish()
+            network = dict.fromkeys(NETWORK_FIELDS.values())
+            network.update(interface=interface, ssid=value)
+            bssid_count = 0
+        elif network is None:
+            continue
+        elif word == "BSSID" and number.isdigit():
+            bssid = dict(network, bssid=value, **dict.fromkeys(BSSID_FIELDS.values()))
+            records.append(bssid)
+            bssid_count += 1
+        elif heading in BSSID_FIELDS and bssid_count:
+            if bssid[BSSID_FIELDS[heading]] is None:
+                bssid[BSSID_FIELDS[heading]] = value
+        elif heading in NETWORK_FIELDS and not bssid_count:
+            network[NETWORK_FIELDS[heading]] = value
+    finish()
+
+    networks = []
+    for record in records:
+        record["signal"] = _number(record["signal"], int)
+        record["channel"] = _number(record["channel"], int)
+        networks.append(NetworkRecord(**record))
+    return networks
+
+
+def _number(value, convert):
+    """ Convert value like '96%' or '1201' to number, return None if it is not a number."""
+
+    try:
+        return convert(value.strip().rstrip("%").strip())
+    except (AttributeError, ValueError):
+        return None
+
+
+@traced(category="parse")
+def parse_interfaces(output):
+    """ Parse output of 'netsh wlan show interfaces' and return list of InterfaceRecord
+    (one for every interface, in the order shown by netsh).
+    """
+
+    interfaces = []
+    for interface in parse_records(output, INTERFACE_FIELDS, "Name"):
+        interface["signal"] = _number(interface["signal"], int)
+        interface["channel"] = _number(interface["channel"], int)
+        interface["receive_rate"] = _number(interface["receive_rate"], float)
+        interface["transmit_rate"] = _number(interface["transmit_rate"], float)
+        interfaces.append(InterfaceRecord(**interface))
+    return interfaces
@@ -0,0 +1,186 @@
+""" This module keeps a single interactive 'netsh' process running and sends commands to
+it through stdin, so starting a new netsh process (which is slow on Windows) is not
+needed for every command. NetshSession is a runner (see command_runner) and is installed
+with command_runner.set_runner(NetshSession()).
+
+After every command an unknown command (marker) is sent, netsh answers it with
+'The following command was not found: <marker>.', so everything before that line is the
+output of the command. If the process dies or does not answer in time, it is started
+again, and if that fails too, commands are run one-shot by the fallback runner.
+Commands which are not 'netsh wlan show ...' (or can not be typed on the netsh prompt,
+e.g. name with a quote) are always run by the fallback runner.
+
+Interactive netsh does not tell whether a command failed, so the output is checked for
+the errors which make one-shot netsh exit with code 1 (like the WLAN AutoConfig service
+not running) and returncode 1 is returned for them.
+"""
+
+import queue
+import re
+import subprocess
+import threading
+import uuid
+
+from windows_wifi_manager import command_runner
+
+# Prompt printed by netsh before reading a command (e.g. 'netsh>' or 'netsh wlan>').
+_PROMPT = re.compile(r"^(?:netsh[^>\r\n]*>)+")
+
+# First line of the output of 'netsh wlan show ...' when the command failed.
+_ERROR = re.compile(r"\A\s*(?:The Wireless AutoConfig Service \(wlansvc\) is not running"
+                    r"|There is no wireless interface on the system"
+                    r"|Profile \".*\" is not found on the system"
+                    r"|The following command was not found"
+                    r"|The parameter is incorrect)", re.IGNORECASE)
+
+
+def session_line(arguments):
+    """ Return the line to type on the netsh prompt for the arguments (without 'netsh'),
+    values with spaces are quoted like name="My Wi-Fi". Return None if an argument can
+    not be typed on the prompt.
+    """
+
+    words = []
+    for argument in arguments:
+        if '"' in argument or "\n" in argument or "\r" in argument or not argument:
+            return None
+        if " " in argument or "\t" in argument:
+            key, equal, value = argument.partition("=")
+            argument = key + '="' + value + '"' if equal else '"' + argument + '"'
+        words.append(argument)
+    return " ".join(words)
+
+
+class NetshSession:
+    """ Runner which sends 'netsh wlan show ...' commands to a long-lived netsh process.
+    The returncode of such commands is found from the output (see module docstring), it
+    is 0 for an error which is not known.
+    """
+
+    def __init__(self, program=("netsh",), fallback=None, routed=(("wlan", "show"),),
+                 timeout=10, max_restarts=3):
+        """ program is the command which starts the interactive netsh, fallback is the
+        runner for the other commands (default SubprocessRunner), routed are the first
+        arguments of the commands which are sent to the session and timeout is the
+        number of seconds to wait for the answer of a command.
+        """
+
+        self.program = list(program)
+        self.fallback = fallback if fallback is not None else command_runner.SubprocessRunner()
+        self.routed = [tuple(prefix) for prefix in routed]
+        self.timeout = timeout
+        self.max_restarts = max_restarts
+        self.restarts = 0
+        self.process = None
+        self.lines = None
+        self._lock = threading.Lock()
+
+    def _start(self):
+        """ Start the interactive netsh and wait till it answers. Return True if it is
+        ready to use.
+        """
+
+        try:
+            self.process = subprocess.Popen(
+                self.program, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT, text=True, bufsize=1,
+                creationflags=command_runner.SubprocessRunner.creation_flags)
+        except OSError:
+            self.process = None
+            return False
+
+        # stdout is read on a thread, so waiting for an answer can time out.
+        self.lines = queue.Queue()
+        threading.Thread(target=self._read, args=(self.process.stdout, self.lines),
+                         daemon=True).start()
+        if self._request("") is None:
+            self._stop()
+            return False
+        return True
+
+    @staticmethod
+    def _read(stream, lines):
+        """ Put every line of the stream in the queue, None at the end of the stream."""
+
+        for line in stream:
+            lines.put(line)
+        lines.put(None)
+
+    def _request(self, line):
+        """ Send the line followed by a marker and return the output before the answer of
+        the marker, None if the process is not answering.
+        """
+
+        marker = "marker-" + uuid.uuid4().hex
+        try:
+            self.process.stdin.write((line + "\n" if line else "") + marker + "\n")
+            self.process.stdin.flush()
+        except (OSError, ValueError):
+            return None
+
+        output = []
+        while True:
+            try:
+                received = self.lines.get(timeout=self.timeout)
+            except queue.Empty:
+                return None
+            if received is None:  # netsh exited.
+                return None
+            received = _PROMPT.sub("", received)
+            if marker in received:
+                return "".join(output)
+            output.append(received)
+
+    def _stop(self):
+        """ Stop the netsh process (if running)."""
+
+        if self.process is not None:
+            try:
+                self.process.stdin.close()
+            except OSError:
+                pass
+            try:
+                self.process.wait(timeout=1)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+            self.process = None
+
+    def _session_output(self, line):
+        """ Return the output of the line from the session, starting (or restarting) the
+        netsh process if needed. Return None if session can not be used (after
+        max_restarts failures the session is not tried anymore).
+        """
+
+        with self._lock:
+            while self.restarts <= self.max_restarts:
+                if self.process is None and not self._start():
+                    self.restarts += 1
+                    continue
+                output = self._request(line)
+                if output is not None:
+                    return output
+                self._stop()  # netsh exited or is not answering, start a new one.
+                self.restarts += 1
+            return None
+
+    def run(self, command):
+        """ Return the output of the command as subprocess.CompletedProcess, from the
+        session if the command is routed to it, otherwise from the fallback runner.
+        """
+
+        if isinstance(command, str) or command[:1] != ["netsh"] or \
+                not any(tuple(command[1:1 + len(prefix)]) == prefix for prefix in self.routed):
+            return self.fallback.run(command)
+
+        line = session_line(command[1:])
+        output = None if line is None else self._session_output(line)
+        if output is None:
+            return self.fallback.run(command)  # One-shot when session is not working.
+        return subprocess.CompletedProcess(command, 1 if _ERROR.match(output) else 0,
+                                           output, "")
+
+    def close(self):
+        """ Stop the netsh process."""
+
+        with self._lock:
+            self._stop()
@@ -0,0 +1,55 @@
+""" This module finds the Wi-Fi networks near the system. 'netsh wlan show networks
+mode=bssid' is parsed (see netsh_parser) into one record for every access point (BSSID)
+and the latest scan is kept for a few seconds (ttl), so every view which wants the
+nearby networks within that time gets the same scan without starting netsh again. If
+many threads ask for a scan at the same time, netsh is run only once.
+"""
+
+import threading
+import time
+
+from windows_wifi_manager import command_runner
+from windows_wifi_manager.netsh_parser import parse_networks
+
+
+class NetworkScanner:
+    """ Scan of the nearby networks, cached for ttl seconds."""
+
+    def __init__(self, ttl=5.0, clock=time.monotonic):
+        """ ttl is the number of seconds for which a scan is used again, clock returns
+        the current time in seconds (can be replaced for testing).
+        """
+
+        self.ttl = ttl
+        self.clock = clock
+        self.networks = []  # NetworkRecord of every BSSID found by the last scan.
+        self.scanned_at = None  # clock() when last scan was done, None if never.
+        self.scans = 0  # Number of times netsh was run.
+        self._lock = threading.Lock()
+
+    def is_fresh(self):
+        """ Return True if the last scan is not older than ttl."""
+
+        return self.scanned_at is not None and self.clock() - self.scanned_at < self.ttl
+
+    def scan(self, force=False):
+        """ Return list of NetworkRecord of the nearby networks, from the last scan if it
+        is fresh (and force is False), otherwise netsh is run. If netsh fails, the
+        result is an empty list.
+        """
+
+        with self._lock:
+            if force or not self.is_fresh():
+                output = command_runner.netsh("wlan", "show", "networks", "mode=bssid")
+                self.networks = parse_networks(output.stdout) if output.returncode == 0 else []
+                self.scanned_at = self.clock()
+                self.scans += 1
+            return self.networks
+
+
+def saved_markers(networks, saved):
+    """ Return list of (NetworkRecord, bool) where bool is True if the SSID of the
+    network is in saved (set of SSIDs and names of the saved profiles).
+    """
+
+    return [(network, network.ssid in saved) for network in networks]
@@ -0,0 +1,161 @@
+""" This module backs up every Wi-Fi profile of the system into a single zip file and
+restores them from it. The backup is made from a single 'netsh wlan export profile
+key=clear', every exported XML file is stored in the zip file with a manifest
+(manifest.json) which has the name, SSID, authentication and SHA-256 hash of every
+profile. Keys are stored as plain text (like the exported files), so the backup must be
+kept safe.
+
+On restore, profiles of the system are exported once and hashed, a profile whose XML is
+identical to the one in backup is skipped and the others are added by netsh, a few of
+them at the same time.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+from windows_wifi_manager import __version__, command_runner
+from windows_wifi_manager.profile_xml import exported_files, read_profile
+
+MANIFEST_NAME = "manifest.json"
+BACKUP_FORMAT = 1
+
+
+def export_profiles(folder):
+    """ Export every profile of the system to the folder. Return {name: (file name, XML
+    bytes, ProfileRecord)} of the exported profiles. Raises OSError if netsh fails (e.g.
+    WLAN AutoConfig service is not running or access is denied).
+    """
+
+    output = command_runner.netsh("wlan", "export", "profile", "key=clear",
+                                  "folder=" + folder)
+    if output.returncode != 0:
+        raise OSError("Unable to export the profiles of the system.\n" +
+                      ((output.stdout or output.stderr or "").strip() or
+                       "netsh failed with code %d" % output.returncode))
+    exported = {}
+    for file_name in exported_files(folder):
+        with open(os.path.join(folder, file_name), "rb") as file:
+            data = file.read()
+        try:
+            profile = read_profile(BytesIO(data))
+        except Exception:
+            continue  # Skip the file which is not a valid profile.
+        if profile.name is not None:
+            exported[profile.name] = (file_name, data, profile)
+    return exported
+
+
+def create_backup(information, path):
+    """ Export every profile of the system into the zip file at path (replaced if it
+    exists). Details of the profiles are also saved in the cache of information
+    (WifiInformation). Return the manifest. If no profile is exported (OSError or
+    ValueError is raised), the file at path is not touched.
+    """
+
+    folder = tempfile.mkdtemp(prefix="backup_", dir=information.app_path + "\\temp_")
+    try:
+        exported = export_profiles(folder)
+        if not exported:
+            raise ValueError("No Wi-Fi profile is found on the system, nothing to back up.")
+        manifest = {"format": BACKUP_FORMAT, "app_version": __version__,
+                    "created": time.time(), "profiles": []}
+        with zipfile.ZipFile(path + ".part", "w", zipfile.ZIP_DEFLATED) as archive:
+            for name, (file_name, data, profile) in sorted(exported.items()):
+                archive.writestr("profiles/" + file_name, data)
+                manifest["profiles"].append({
+                    "name": name, "ssid": profile.ssid,
+                    "authentication": profile.authentication,
+                    "file": "profiles/" + file_name,
+                    "sha256": hashlib.sha256(data).hexdigest()})
+            archive.writestr(MANIFEST_NAME, json.dumps(manifest, ensure_ascii=False, indent=1))
+        os.replace(path + ".part", path)  # Old backup is replaced only by a complete one.
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
+
+    information.cache.put_many(
+        (name, profile.ssid, profile.authentication,
+         profile.key if profile.authentication != "open" else None)
+        for name, (_, _, profile) in exported.items() if profile.ssid is not None)
+    return manifest
+
+
+def read_manifest(archive):
+    """ Return the manifest of the backup (opened zipfile.ZipFile), raises ValueError if
+    it is not a backup made by this module.
+    """
+
+    try:
+        manifest = json.loads(archive.read(MANIFEST_NAME).decode("utf-8"))
+    except (KeyError, ValueError):
+        raise ValueError("File is not a backup of Wi-Fi profiles") from None
+    if manifest.get("format") != BACKUP_FORMAT:
+        raise ValueError("Backup is made by a newer version of the App")
+    return manifest
+
+
+def restore_backup(information, path, max_workers=4, force=False):
+    """ Add every profile of the backup to the system, unless the same profile (with
+    identical XML) is already there (or force is True). Return the result of every
+    profile in the form of [{"name": ..., "status": "restored", "skipped" or "failed",
+    "error": reason},] (error only if failed) and generate the list of Wi-Fi again.
+    If the profiles of the system can not be exported (to find the identical ones),
+    OSError is raised and nothing is restored, unless force is True.
+    """
+
+    try:
+        archive = zipfile.ZipFile(path)
+    except zipfile.BadZipFile:
+        raise ValueError("File is not a backup of Wi-Fi profiles") from None
+
+    folder = tempfile.mkdtemp(prefix="restore_", dir=information.app_path + "\\temp_")
+    try:
+        with archive:
+            manifest = read_manifest(archive)
+            current = {}
+            if not force:
+                current = {name: hashlib.sha256(data).hexdigest()
+                           for name, (_, data, _) in export_profiles(folder).items()}
+
+            def restore(number, entry):
+                result = {"name": entry["name"]}
+                if current.get(entry["name"]) == entry["sha256"]:
+                    result["status"] = "skipped"
+                    return result
+
+                data = archive.read(entry["file"])
+                if hashlib.sha256(data).hexdigest() != entry["sha256"]:
+                    result.update(status="failed", error="File is damaged in the backup")
+                    return result
+                file_path = folder + "\\restore_" + str(number) + ".xml"
+                with open(file_path, "wb") as file:
+                    file.write(data)
+                try:
+                    output = command_runner.netsh("wlan", "add", "profile",
+                                                  "filename=" + file_path)
+                finally:
+                    os.remove(file_path)
+                if output.returncode == 0:
+                    result["status"] = "restored"
+                else:
+                    result.update(status="failed",
+                                  error=(output.stdout or output.stderr or "").strip() or
+                                  "netsh failed with code %d" % output.returncode)
+                return result
+
+            entries = manifest["profiles"]
+            # ZipFile can be read by many threads, every read opens its own file handle.
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(entries) or 1))) \
+                    as pool:
+                results = list(pool.map(restore, range(len(entries)), entries))
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
+
+    information.generating_wifi_list()
+    return results
@@ -0,0 +1,177 @@
+""" This module adds many Wi-Fi profiles at once from a CSV or JSON file, e.g.
+
+    ssid,authentication,encryption,key,connection_mode
+    Office,WPA2PSK,AES,secret-password,auto
+    Guest,open,,,manual
+
+or [{"ssid": "Office", "authentication": "WPA2PSK", "key": "secret-password"}, ...].
+The profile XML is generated from Data/sampleProfile.xml (same template as used by
+'Add Profile'), which is read only once and turned into a format string, so generating
+the XML of a profile is only a string format. Profiles are added by netsh, a few of them
+at the same time, and the result of every row is returned.
+"""
+
+import csv
+import json
+import os
+import re
+import shutil
+import tempfile
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from xml.sax.saxutils import escape
+
+from windows_wifi_manager import command_runner
+
+TEMPLATE_PATH = os.path.dirname(os.path.realpath(__file__)) + "/Data/sampleProfile.xml"
+
+AUTHENTICATIONS = {"wpa2psk": "WPA2PSK", "wpapsk": "WPAPSK", "open": "open"}
+ENCRYPTIONS = {"aes": "AES", "tkip": "TKIP", "none": "none", "": ""}
+CONNECTION_MODES = {"auto": "auto", "manual": "manual", "": "auto"}
+
+# Other names of the columns which are accepted in the file.
+COLUMN_NAMES = {"name": "ssid", "auth": "authentication", "password": "key",
+                "mode": "connection_mode", "connection mode": "connection_mode"}
+
+# Details of a single profile to be added.
+ProfileRow = namedtuple("ProfileRow", ["ssid", "authentication", "encryption", "key",
+                                       "connection_mode"])
+
+SHARED_KEY = "<sharedKey><keyType>passPhrase</keyType><protected>false</protected>" \
+             "<keyMaterial>{key}</keyMaterial></sharedKey>"
+
+
+class ProfileTemplate:
+    """ Profile XML template, read once. The text of name, connectionMode,
+    authentication and encryption elements is replaced by fields of a format string and
+    the shared key is inserted after authEncryption element.
+    """
+
+    def __init__(self, path=TEMPLATE_PATH):
+        with open(path, "r", encoding="utf-8") as file:
+            text = file.read().replace("{", "{{").replace("}", "}}")
+
+        for tag, field in (("name", "name"), ("connectionMode", "connection_mode"),
+                           ("authentication", "authentication"),
+                           ("encryption", "encryption")):
+            # Both <name> of profile and <name> of SSID are replaced.
+            text, count = re.subn("<" + tag + ">[^<]*</" + tag + ">",
+                                  "<" + tag + ">{" + field + "}</" + tag + ">", text)
+            if count == 0:
+                raise ValueError("Element " + tag + " is not found in " + path)
+        if "</authEncryption>" not in text:
+            raise ValueError("Element authEncryption is not found in " + path)
+        self.text = text.replace("</authEncryption>", "</authEncryption>{shared_key}", 1)
+
+    def render(self, row):
+        """ Return the XML of the profile for the row (ProfileRow)."""
+
+        shared_key = "" if row.authentication == "open" else SHARED_KEY.format(
+            key=escape(row.key))
+        return self.text.format(name=escape(row.ssid), connection_mode=row.connection_mode,
+                                authentication=row.authentication,
+                                encryption=row.encryption, shared_key=shared_key)
+
+
+def columns(values):
+    """ Return the values of a row with names of columns in lower case and other names
+    replaced (e.g. 'Password' -> 'key'), every value is a string.
+    """
+
+    return {COLUMN_NAMES.get(str(column).strip().lower(), str(column).strip().lower()):
+            "" if value is None else str(value) for column, value in values.items()}
+
+
+def normalise_row(values):
+    """ Return ProfileRow from a dictionary of the values of a row (keys are names of
+    columns) or raise ValueError with the reason why the row is not valid. The rules are
+    same as of 'Add Profile' window.
+    """
+
+    values = columns(values)
+    ssid = values.get("ssid", "")
+    if ssid == "":
+        raise ValueError("SSID is empty")
+
+    authentication = values.get("authentication", "").strip().lower() or "wpa2psk"
+    authentication = AUTHENTICATIONS.get(authentication)
+    if authentication is None:
+        raise ValueError("Authentication must be WPA2PSK, WPAPSK or open")
+    encryption = ENCRYPTIONS.get(values.get("encryption", "").strip().lower())
+    if encryption is None:
+        raise ValueError("Encryption must be AES or TKIP")
+    connection_mode = CONNECTION_MODES.get(values.get("connection_mode", "").strip().lower())
+    if connection_mode is None:
+        raise ValueError("Connection mode must be auto or manual")
+
+    key = values.get("key", "")
+    if authentication == "open":
+        encryption, key = "none", ""
+    else:
+        if not 8 <= len(key) <= 63:
+            raise ValueError("Key of " + authentication + " must be 8 to 63 characters")
+        if authentication == "WPA2PSK" or encryption in ("", "none"):
+            encryption = "AES"
+    return ProfileRow(ssid, authentication, encryption, key, connection_mode)
+
+
+def read_rows(path):
+    """ Read the rows of a CSV or JSON (list of objects) file. Return list of
+    dictionaries, one for every row.
+    """
+
+    if path.lower().endswith(".json"):
+        with open(path, "r", encoding="utf-8-sig") as file:
+            rows = json.load(file)
+        if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+            raise ValueError("JSON file must be a list of objects")
+        return rows
+
+    with open(path, "r", encoding="utf-8-sig", newline="") as file:
+        return list(csv.DictReader(file))
+
+
+def add_profiles(rows, folder, max_workers=4, template=None):
+    """ Add a profile for every row (dictionary) and return the result of every row in
+    the form of [{"row": 1, "ssid": ..., "added": bool, "error": reason},] (error only if
+    not added). XML files are written to a new folder inside of folder (so imports
+    running at the same time never share a file) and removed after netsh adds them. At
+    most max_workers netsh commands are run at the same time.
+    """
+
+    template = template if template is not None else ProfileTemplate()
+    folder = tempfile.mkdtemp(prefix="import_", dir=folder)
+
+    def add(number, values):
+        result = {"row": number, "ssid": columns(values).get("ssid", "")}
+        try:
+            row = normalise_row(values)
+        except ValueError as error:
+            result.update(added=False, error=str(error))
+            return result
+
+        path = os.path.join(folder, "profile_" + str(number) + ".xml")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write(template.render(row))
+        try:
+            output = command_runner.netsh("wlan", "add", "profile", "filename=" + path)
+        finally:
+            os.remove(path)
+
+        result["added"] = output.returncode == 0
+        if output.returncode != 0:
+            result["error"] = (output.stdout or output.stderr or "").strip() or \
+                "netsh failed with code %d" % output.returncode
+        return result
+
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(rows) or 1))) as pool:
+            return list(pool.map(add, range(1, len(rows) + 1), rows))
+    finally:
+        shutil.rmtree(folder, ignore_errors=True)
+
+
+def import_file(path, folder, max_workers=4):
+    """ Add profiles of every row of the CSV or JSON file, see add_profiles()."""
+
+    return add_profiles(read_rows(path), folder, max_workers)
@@ -0,0 +1,96 @@
+""" This module reads the XML file of a Wi-Fi profile (as exported by 'netsh wlan export
+profile key=clear') and returns its name, SSID, authentication and key. The file is read
+as a stream by the expat parser and reading stops as soon as everything is found, so
+the rest of the file is never parsed and no tree is built. The tag names of the profile
+namespace are computed only once.
+"""
+
+import os
+import xml.parsers.expat
+from collections import namedtuple
+
+PROFILE_NAMESPACE = "http://www.microsoft.com/networking/WLAN/profile/v1"
+
+# Details of a profile, key is None for profile without key (e.g. open network).
+ProfileRecord = namedtuple("ProfileRecord", ["name", "ssid", "authentication", "key"])
+
+# Tag names as reported by expat ("namespace tag") and the name used in this module.
+_TAGS = {PROFILE_NAMESPACE + " " + tag: tag
+         for tag in ("name", "SSID", "authentication", "keyMaterial", "security")}
+
+
+class _Found(Exception):
+    """ Raised from the handler to stop parsing when everything is found."""
+
+
+class _ProfileHandler:
+    """ Handlers of expat events which collect the details of the profile."""
+
+    def __init__(self):
+        self.details = {"name": None, "ssid": None, "authentication": None, "key": None}
+        self.depth = 0
+        self.in_ssid = False
+        self.text = []
+
+    def start(self, tag, _):
+        """ Called at start of every element."""
+
+        self.depth += 1
+        self.text.clear()
+        if _TAGS.get(tag) == "SSID":
+            self.in_ssid = True
+
+    def end(self, tag):
+        """ Called at end of every element."""
+
+        self.depth -= 1
+        tag = _TAGS.get(tag)
+        if tag is None:
+            return
+        details = self.details
+        if tag == "name":
+            if self.depth == 1:  # <name> which is direct child of root is name of profile.
+                details["name"] = "".join(self.text)
+            elif self.in_ssid and details["ssid"] is None:
+                details["ssid"] = "".join(self.text)
+        elif tag == "SSID":
+            self.in_ssid = False
+        elif tag == "authentication":
+            details["authentication"] = "".join(self.text)
+        elif tag == "keyMaterial":
+            details["key"] = "".join(self.text)
+            raise _Found  # Key comes after name, SSID and authentication.
+        elif tag == "security":
+            raise _Found  # Profile has no key, nothing more to be found.
+
+
+def exported_files(folder):
+    """ Return sorted names of the files of the folder which can be exported profiles.
+    netsh names them '<interface>-<profile>.xml' and the interface can have any name
+    (e.g. 'Wi-Fi 2' or 'WLAN'), so every XML file is one.
+    """
+
+    return sorted(file_name for file_name in os.listdir(folder)
+                  if file_name.lower().endswith(".xml"))
+
+
+def read_profile(source):
+    """ Read the profile from source (path or binary file object) and return
+    ProfileRecord. Raises xml.parsers.expat.ExpatError if it is not a valid XML.
+    """
+
+    if isinstance(source, str):
+        with open(source, "rb") as file:
+            return read_profile(file)
+
+    handler = _ProfileHandler()
+    parser = xml.parsers.expat.ParserCreate(namespace_separator=" ")
+    parser.buffer_text = True  # Text of an element is given in one piece.
+    parser.StartElementHandler = handler.start
+    parser.EndElementHandler = handler.end
+    parser.CharacterDataHandler = handler.text.append
+    try:
+        parser.ParseFile(source)
+    except _Found:
+        pass
+    return ProfileRecord(**handler.details)
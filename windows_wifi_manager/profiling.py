@@ -0,0 +1,129 @@
+""" This module profiles the actions of the user (like clicking Refresh List) with cProfile,
+so a report of "the App froze when I clicked ..." can come with the data of where the
+time went. Profiling is off unless it is turned on (environment variable
+WINDOWS_WIFI_MANAGER_PROFILE=1 or Help → Profile Actions). When it is on, every call of a
+wrapped callback is profiled and saved as a .pstats file in a folder of the App
+directory, only the newest few files are kept.
+
+Only the thread which calls the wrapped function is profiled. Callbacks run on the Tk
+thread, which is the thread that makes the window freeze. An action which only hands its
+work over to a worker thread is profiled by wrapping the function given to
+BackgroundTasks.submit instead, other work of worker threads is seen in the tracing
+spans (see tracing).
+"""
+
+import io
+import os
+import threading
+import time
+from functools import wraps
+
+EXTENSION = ".pstats"
+
+
+class ActionProfiler:
+    """ Profiles the wrapped callbacks while enabled, see module docstring."""
+
+    def __init__(self, folder, keep=20, enabled=False):
+        """ folder is where .pstats files are saved (created on first use) and keep is the
+        number of files kept, older files are deleted.
+        """
+
+        self.folder = folder
+        self.keep = keep
+        self.enabled = enabled
+        self.last_path = None  # File of the last profiled action.
+        # _active.on is True while an action is profiled on the thread.
+        self._active = threading.local()
+        self._number = 0  # Makes the names of files saved in the same second different.
+
+    def wrap(self, name, function):
+        """ Return function which is profiled (when enabled) on every call and saved
+        as a file named after the action (name).
+        """
+
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            # Nested actions (e.g. a callback which calls another wrapped callback) are a
+            # part of the outer profile, only one profiler can run on a thread.
+            if not self.enabled or getattr(self._active, "on", False):
+                return function(*args, **kwargs)
+            import cProfile  # Only needed when actions are profiled.
+
+            profiler = cProfile.Profile()
+            self._active.on = True
+            try:
+                try:
+                    profiler.enable()
+                except ValueError:  # Another profiler (e.g. of a debugger) is running.
+                    return function(*args, **kwargs)
+                try:
+                    return function(*args, **kwargs)
+                finally:
+                    profiler.disable()
+                    try:
+                        self.save(profiler, name)
+                    except OSError:
+                        pass  # Profile is lost, but the action itself is not affected.
+            finally:
+                self._active.on = False
+        return wrapper
+
+    def save(self, profiler, name):
+        """ Save the profile (cProfile.Profile) of the action and delete the oldest files
+        if there are more than keep. Return path of the file.
+        """
+
+        os.makedirs(self.folder, exist_ok=True)
+        self._number += 1
+        path = os.path.join(self.folder, "%s-%04d-%s%s" % (
+            time.strftime("%Y%m%d-%H%M%S"), self._number % 10000, name, EXTENSION))
+        profiler.dump_stats(path)
+        self.last_path = path
+        self.rotate()
+        return path
+
+    def files(self):
+        """ Return paths of the saved profiles, oldest first."""
+
+        try:
+            names = os.listdir(self.folder)
+        except OSError:
+            return []
+        # File names start with the time they were saved, so they are sorted by time.
+        return [os.path.join(self.folder, file_name) for file_name in sorted(names)
+                if file_name.endswith(EXTENSION)]
+
+    def rotate(self):
+        """ Delete the oldest profiles, so only the newest keep are left."""
+
+        files = self.files()
+        for path in files[:max(0, len(files) - self.keep)]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass  # File is in use (e.g. opened by a viewer), it is deleted next time.
+
+    def latest(self):
+        """ Return path of the newest profile (also from an earlier run), None if there
+        is none.
+        """
+
+        if self.last_path is not None and os.path.exists(self.last_path):
+            return self.last_path
+        files = self.files()
+        return files[-1] if files else None
+
+
+def report(path, limit=25):
+    """ Return the functions of the profile (.pstats file) which took the most time as
+    text, sorted by cumulative time and by time spent in the function itself.
+    """
+
+    import pstats  # Only needed when a profile is displayed.
+
+    stream = io.StringIO()
+    stats = pstats.Stats(path, stream=stream).strip_dirs()
+    stats.sort_stats("cumulative").print_stats(limit)
+    stats.sort_stats("tottime").print_stats(limit)
+    return stream.getvalue()
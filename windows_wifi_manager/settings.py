@@ -0,0 +1,55 @@
+""" This module defines the name of the software and the directory where the App content
+is stored. The directory is found (and created) only when it is needed for the first
+time, so importing the modules of the App stays fast.
+"""
+
+import os
+
+SOFTWARE_NAME = "SavedPasswordFinder"
+SOFTWARE_AUTHOR = "NihalAgarwal"
+
+# Seconds for which result of last "Check for updates" is used instead of checking again.
+UPDATE_CHECK_INTERVAL = 24 * 60 * 60
+
+# Seconds for which a scan of nearby networks is used again instead of running netsh, and
+# milliseconds between two scans while the list of nearby networks is displayed.
+SCAN_TTL = 5
+SCAN_INTERVAL = 10000
+# Seconds of scans used to find how congested every channel is.
+CHANNEL_WINDOW = 300
+
+# Number of samples of the signal strength kept for every Wi-Fi interface (older ones are
+# overwritten). A sample is taken on every check of the connection, 2 to 30 seconds apart.
+SIGNAL_HISTORY_SIZE = 600
+
+# If environment variable WINDOWS_WIFI_MANAGER_NETSH_SESSION is 1, 'netsh wlan show' commands
+# are sent to a single long-lived netsh process (see netsh_session) instead of starting
+# netsh for every command.
+NETSH_SESSION = os.environ.get("WINDOWS_WIFI_MANAGER_NETSH_SESSION") == "1"
+
+# Level of the messages logged to stderr by the window (e.g. "info" for the time to first
+# paint), set by environment variable WINDOWS_WIFI_MANAGER_LOG. Nothing is logged if not set.
+LOG_LEVEL = os.environ.get("WINDOWS_WIFI_MANAGER_LOG", "")
+
+# If environment variable WINDOWS_WIFI_MANAGER_PROFILE is 1, actions of the user are
+# profiled from the start (see profiling), and the number of profiles which are kept.
+PROFILE_ACTIONS = os.environ.get("WINDOWS_WIFI_MANAGER_PROFILE") == "1"
+PROFILE_KEEP = 20
+
+_APP_DIR = None
+
+
+def app_dir():
+    """ Return the directory where the App content is stored and create it if it is
+    not there.
+    """
+
+    global _APP_DIR
+    if _APP_DIR is None:
+        import appdirs  # Only needed once, so imported on first use.
+
+        path = appdirs.user_data_dir(SOFTWARE_NAME, SOFTWARE_AUTHOR)
+        if not os.path.isdir(path):
+            os.makedirs(path)
+        _APP_DIR = path
+    return _APP_DIR
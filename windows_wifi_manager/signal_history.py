@@ -0,0 +1,159 @@
+""" This module keeps the recent signal strength, receive/transmit rate and channel of
+every Wi-Fi interface. Samples are the interfaces found by every check of the
+ConnectionMonitor (so no other 'netsh wlan show interfaces' is run, and samples are as
+far apart as the checks) and are stored in fixed size ring buffers backed by
+array.array, so memory used is same no matter how long the App runs (older samples are
+overwritten). Missing values (e.g. signal while disconnected) are
+stored as NaN. When an interface connects to another network (SSID), its samples of the
+previous network are removed, so they are not drawn as one line with the new ones.
+"""
+
+import csv
+import math
+import time
+from array import array
+
+# Fields of InterfaceRecord which are recorded.
+FIELDS = ("signal", "receive_rate", "transmit_rate", "channel")
+
+
+class RingBuffer:
+    """ Fixed size buffer of floats, when it is full the oldest value is overwritten."""
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.data = array("d", bytes(8 * capacity))  # Allocated once, capacity zeros.
+        self.start = 0  # Index of the oldest value.
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def append(self, value):
+        """ Add the value, overwriting the oldest one if buffer is full."""
+
+        if self.count < self.capacity:
+            self.data[(self.start + self.count) % self.capacity] = value
+            self.count += 1
+        else:
+            self.data[self.start] = value
+            self.start = (self.start + 1) % self.capacity
+
+    def values(self):
+        """ Return the values (oldest first) as array."""
+
+        end = self.start + self.count
+        if end <= self.capacity:
+            return self.data[self.start:end]
+        return self.data[self.start:] + self.data[:end - self.capacity]
+
+    def clear(self):
+        """ Remove every value."""
+
+        self.start = self.count = 0
+
+
+def summary(values):
+    """ Return {"min", "mean", "p50", "p90", "max", "count"} of the values, NaN values
+    are skipped. Return None if there is no value.
+    """
+
+    values = sorted(value for value in values if not math.isnan(value))
+    if not values:
+        return None
+
+    def percentile(percent):
+        # Nearest rank, always one of the values.
+        return values[max(0, math.ceil(percent / 100 * len(values)) - 1)]
+
+    return {"min": values[0], "mean": math.fsum(values) / len(values),
+            "p50": percentile(50), "p90": percentile(90), "max": values[-1],
+            "count": len(values)}
+
+
+class InterfaceHistory:
+    """ Recent samples of a single interface, one RingBuffer for time and one for every
+    field of FIELDS.
+    """
+
+    def __init__(self, capacity):
+        self.times = RingBuffer(capacity)
+        self.buffers = {field: RingBuffer(capacity) for field in FIELDS}
+        self.ssid = None  # Network of the samples, None until connected.
+
+    def __len__(self):
+        return len(self.times)
+
+    def add(self, sample_time, interface):
+        """ Add a sample of the interface (InterfaceRecord) taken at sample_time. If it is
+        connected to another network than the earlier samples, they are removed first.
+        """
+
+        if interface.state == "connected" and interface.ssid is not None and \
+                interface.ssid != self.ssid:
+            if self.ssid is not None:
+                self.clear()
+            self.ssid = interface.ssid
+        self.times.append(sample_time)
+        for field, buffer in self.buffers.items():
+            value = getattr(interface, field)
+            if interface.state != "connected" or value is None:
+                value = math.nan
+            buffer.append(value)
+
+    def clear(self):
+        """ Remove every sample."""
+
+        self.times.clear()
+        for buffer in self.buffers.values():
+            buffer.clear()
+
+    def values(self, field):
+        """ Return the values of the field (oldest first) as array."""
+
+        return self.buffers[field].values()
+
+    def summary(self, field):
+        """ Return summary (see summary()) of the values of the field."""
+
+        return summary(self.buffers[field].values())
+
+    def export_csv(self, path):
+        """ Write every sample to a CSV file, one row per sample with local time."""
+
+        columns = [self.times.values()] + [self.values(field) for field in FIELDS]
+        with open(path, "w", encoding="utf-8", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow(("time",) + FIELDS)
+            for row in zip(*columns):
+                writer.writerow([time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(row[0]))] +
+                                ["" if math.isnan(value) else "%g" % value
+                                 for value in row[1:]])
+
+
+class SignalSampler:
+    """ Keeps the last capacity samples of every interface. sample() is given the
+    interfaces found by every check of ConnectionMonitor (its interfaces_callback) and
+    callback is called with the samples of every interface after every sample.
+    """
+
+    def __init__(self, callback=None, capacity=300):
+        self.callback = callback
+        self.capacity = capacity
+        self.histories = {}  # {interface name: InterfaceHistory}
+
+    def sample(self, interfaces):
+        """ Record the InterfaceRecord of every interface found now (called on Tk thread)."""
+
+        self.add(time.time(), interfaces)
+        if self.callback is not None:
+            self.callback(self.histories)
+
+    def add(self, sample_time, interfaces):
+        """ Record the sample of every interface (list of InterfaceRecord)."""
+
+        for interface in interfaces:
+            history = self.histories.get(interface.name)
+            if history is None:
+                history = self.histories[interface.name] = InterfaceHistory(self.capacity)
+            history.add(sample_time, interface)
@@ -8,16 +8,10 @@ window at the centre of the parent window (irrespective of what the size of the
 is."""
 import os
 import tkinter
-import webbrowser
 from abc import ABC, abstractmethod
 from tkinter import ttk
-from xml.dom import minidom
 
-try:
-    import lxml.etree as etree
-except ImportError:
-    import xml.etree.ElementTree as etree
-import subprocess
+from windows_wifi_manager import tracing
 
 
 class BasicDialog(tkinter.Toplevel, ABC):
@@ -287,45 +281,21 @@ class AddProfile(BasicDialog):
     def apply(self):
         """ Create xml file and add profile to system"""
 
-        file_name = str(sum([ord(i) for i in self.ssid.get()]))
+        # Only needed when a profile is added, so imported here to start the App faster.
+        from windows_wifi_manager.profile_import import add_profiles
 
-        def saving_file(xml):
-            """ Save user profile in xml format to temp_ dir."""
-
-            xml_string = etree.tostring(xml)
-            parsed = minidom.parseString(xml_string)
-            with open(self.app_path + "\\temp_\\" + file_name + ".xml", "w") as file:
-                file.write(parsed.toprettyxml(indent="        "))
-
-        parse_xml = etree.parse(os.path.dirname(os.path.realpath(__file__)) +
-                                "/data/sampleProfile.xml")
-
-        # The below code will parse the sample xml file
-        # and fill important details entered by the user.
-        root_tree = parse_xml.getroot()
-        root_tree[0].text = self.ssid.get()
-        root_tree[1][0][0].text = self.ssid.get()
-        root_tree[3].text = self.connection_mode.get().lower()
-        security = root_tree[4][0]
-        security[0][0].text = self.authentication.get()
-        security[0][1].text = self.encryption.get()
-        if self.authentication.get() != "open":
-            etree.SubElement(security, "sharedKey")
-            etree.SubElement(security[1], "keyType").text = "passPhrase"
-            etree.SubElement(security[1], "protected").text = "false"
-            etree.SubElement(security[1], "keyMaterial").text = self.password.get()
-
-        # Save the xml file
-        saving_file(root_tree)
-
-        # Add profile to the system.
-        temp_path = 'netsh wlan add profile filename="' + self.app_path + "\\temp_\\"
-        output_ = subprocess.run(temp_path + file_name + '.xml"', shell=True,
-                                 capture_output=True, text=True)
-        os.remove(self.app_path + "\\temp_\\" + file_name + ".xml")
+        # The xml file is generated from the sample xml file with the details entered
+        # by the user, saved to temp_ dir and added to the system.
+        with tracing.span("AddProfile.apply", "ui"):
+            result = add_profiles([{"ssid": self.ssid.get(),
+                                    "connection_mode": self.connection_mode.get(),
+                                    "authentication": self.authentication.get(),
+                                    "encryption": self.encryption.get(),
+                                    "key": self.password.get()}],
+                                  self.app_path + "\\temp_")[0]
 
         # If unable to add profile.
-        if output_.returncode != 0:
+        if not result["added"]:
             message = "Sorry, Unable to add profile.\n(You entered wrong details " \
                       "or else you don't have admin rights.)"
             image_ = "error"
@@ -400,7 +370,7 @@ class MessageBox(BasicDialog):
 
         image_label = tkinter.Label(master, image=self.image_, bg="white")
         image_label.image = self.image_
-        message_label = tkinter.Label(master, text=self.text_, bg="white",
+        message_label = tkinter.Label(master, text=self.text_, bg="white", justify=tkinter.LEFT,
                                       font=("Playfair Display", 12))
         msg_for_user = "Software is under development. " \
                        "Contact developer for software related issues(check 'About')."
@@ -428,6 +398,43 @@ class MessageBox(BasicDialog):
         return
 
 
+class TextWindow(BasicDialog):
+    """ Display a long text (like a table) in a read only box with a fixed width font."""
+
+    def __init__(self, parent, text, width=100, height=25):
+
+        self.text_ = text
+        self.width = width
+        self.height = height
+        BasicDialog.__init__(self, parent, title=None)
+
+    def body(self, master):
+
+        text_box = tkinter.Text(master, width=self.width, height=self.height, wrap=tkinter.NONE,
+                                font=("Courier New", 9), relief=tkinter.FLAT)
+        scroll_bar = ttk.Scrollbar(master, orient=tkinter.VERTICAL, command=text_box.yview)
+        text_box.configure(yscrollcommand=scroll_bar.set)
+        text_box.insert("1.0", self.text_)
+        text_box.configure(state=tkinter.DISABLED)
+        text_box.grid(row=0, column=0, sticky="nsew", padx=(5, 0), pady=(8, 2))
+        scroll_bar.grid(row=0, column=1, sticky="ns", padx=(0, 5), pady=(8, 2))
+
+    def button_box(self):
+
+        below_hz_frame = tkinter.Frame(self)
+        ok_button = ttk.Button(below_hz_frame, text="OK", width=10,
+                               command=self.ok, default=tkinter.ACTIVE)
+        self.bind("<Return>", self.ok)
+        ok_button.pack(side=tkinter.RIGHT, padx=15, pady=5)
+        below_hz_frame.pack(fill=tkinter.X)
+
+    def validate(self):
+        return 1
+
+    def apply(self):
+        return
+
+
 class About(BasicDialog):
     """ This class designs the About top-level window, it opens when
     the user user click on 'About' in menu bar in Application main window.
@@ -443,6 +450,8 @@ class About(BasicDialog):
         def link_click(_):
             """ Detects the tag and open the link."""
 
+            import webbrowser  # Only needed when a link is clicked.
+
             tag_name = about_content.tag_names(tkinter.CURRENT)[0]
             about_content.tag_config(tag_name, foreground="#551A8B")
             if tag_name == 'hyper':
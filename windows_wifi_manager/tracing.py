@@ -0,0 +1,147 @@
+""" This module records how long the slow parts of the App take. A span is a named piece
+of work with a category ('netsh' for the wall time of a netsh call, 'parse' for parsing
+its output or a file, 'io' for reading or writing the disk, 'ui' for Tk callbacks, 'task'
+for work on a worker thread and 'app' for everything else), recorded as
+
+    with tracing.span("read exported profiles", "io"):
+        ...
+
+or by decorating a function with @tracing.traced(category="parse"). Spans are kept in a
+bounded buffer (oldest are dropped), so tracing can stay on however long the App runs.
+They can be saved as Chrome trace-event JSON (open it in chrome://tracing or Perfetto)
+or summarised per span name as a table.
+"""
+
+import json
+import math
+import os
+import threading
+import time
+from collections import deque
+from functools import wraps
+
+
+class _Span:
+    """ Context manager which records a span when it exits."""
+
+    __slots__ = ("tracer", "name", "category", "args", "start")
+
+    def __init__(self, tracer, name, category, args):
+        self.tracer = tracer
+        self.name = name
+        self.category = category
+        self.args = args
+        self.start = None
+
+    def __enter__(self):
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, error_type, _, __):
+        if error_type is not None:
+            self.args = dict(self.args or {}, error=error_type.__name__)
+        self.tracer.add(self.name, self.category, self.start,
+                        time.perf_counter_ns() - self.start, self.args)
+        return False
+
+
+class Tracer:
+    """ Bounded buffer of the last max_spans spans."""
+
+    def __init__(self, max_spans=20000):
+        self.spans = deque(maxlen=max_spans)
+        self.enabled = True
+        self.origin = time.perf_counter_ns()  # Time 0 of the trace.
+        self.threads = {}  # {thread id: thread name}, of the threads which made a span.
+
+    def add(self, name, category, start, duration, args=None):
+        """ Record a span, start and duration are in nanoseconds (perf_counter_ns)."""
+
+        if self.enabled:
+            thread_id = threading.get_ident()
+            if thread_id not in self.threads:
+                self.threads[thread_id] = threading.current_thread().name
+            # deque.append is thread safe, no lock is needed.
+            self.spans.append((name, category, start, duration, thread_id, args))
+
+    def span(self, name, category="app", args=None):
+        """ Return a context manager which records the work done inside it as a span."""
+
+        return _Span(self, name, category, args)
+
+    def traced(self, name=None, category="app"):
+        """ Decorator which records every call of the function as a span named name
+        (qualified name of the function if not given).
+        """
+
+        def decorator(function):
+            span_name = name or function.__qualname__
+
+            @wraps(function)
+            def wrapper(*args, **kwargs):
+                with _Span(self, span_name, category, None):
+                    return function(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def clear(self):
+        """ Remove every span."""
+
+        self.spans.clear()
+
+    def chrome_trace(self):
+        """ Return the spans in Chrome trace-event format (as dictionary)."""
+
+        pid = os.getpid()
+        events = [{"name": "thread_name", "ph": "M", "pid": pid, "tid": thread_id,
+                   "args": {"name": thread_name}}
+                  for thread_id, thread_name in list(self.threads.items())]
+        for name, category, start, duration, thread_id, args in list(self.spans):
+            event = {"name": name, "cat": category, "ph": "X", "pid": pid, "tid": thread_id,
+                     "ts": (start - self.origin) / 1000, "dur": duration / 1000}
+            if args:
+                event["args"] = args
+            events.append(event)
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_chrome(self, path):
+        """ Save the spans as Chrome trace-event JSON file."""
+
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(self.chrome_trace(), file, ensure_ascii=False)
+
+    def summary(self):
+        """ Return {(category, name): {"count", "total", "mean", "p90", "max"}} of the
+        spans, times are in seconds.
+        """
+
+        durations = {}
+        for name, category, _, duration, _, _ in list(self.spans):
+            durations.setdefault((category, name), []).append(duration)
+
+        summary = {}
+        for key, values in durations.items():
+            values.sort()
+            total = sum(values)
+            summary[key] = {"count": len(values), "total": total / 1e9,
+                            "mean": total / len(values) / 1e9,
+                            "p90": values[max(0, math.ceil(0.9 * len(values)) - 1)] / 1e9,
+                            "max": values[-1] / 1e9}
+        return summary
+
+    def format_summary(self, limit=None):
+        """ Return the summary as a text table, spans with largest total time first."""
+
+        rows = sorted(self.summary().items(), key=lambda item: -item[1]["total"])[:limit]
+        lines = ["%-7s %-45s %7s %10s %9s %9s %9s" % (
+            "type", "span", "count", "total ms", "mean ms", "p90 ms", "max ms")]
+        for (category, name), item in rows:
+            lines.append("%-7s %-45s %7d %10.1f %9.2f %9.2f %9.2f" % (
+                category, name[:45], item["count"], item["total"] * 1000,
+                item["mean"] * 1000, item["p90"] * 1000, item["max"] * 1000))
+        return "\n".join(lines)
+
+
+tracer = Tracer()
+span = tracer.span
+traced = tracer.traced
@@ -0,0 +1,137 @@
+""" This module checks if a newer version of the App is released on PyPI. The check is
+done on a worker thread (see BackgroundTasks) and the result is saved in a JSON file in
+the App directory, so the check is not repeated again and again within the interval.
+A small local HTTP server (LocalUpdateServer) answers like PyPI, to try the check
+without internet.
+"""
+
+import json
+import os
+import threading
+import time
+
+from windows_wifi_manager import __version__
+
+UPDATE_URL = "https://pypi.org/pypi/windows-wifi-manager/json"
+
+
+def version_tuple(version):
+    """ Convert version like '0.2.0' to (0, 2, 0) so versions can be compared."""
+
+    parts = []
+    for part in version.split("."):
+        digits = ""
+        for char in part:
+            if not char.isdigit():
+                break
+            digits += char
+        parts.append(int(digits or 0))
+    return tuple(parts)
+
+
+class UpdateChecker:
+    """ Check the latest released version and remember the result for some time."""
+
+    def __init__(self, cache_path, url=UPDATE_URL, interval=24 * 60 * 60, timeout=5):
+        """ cache_path is the JSON file where last result is saved, interval is the number
+        of seconds for which the saved result is used, timeout is in seconds.
+        """
+
+        self.cache_path = cache_path
+        self.url = url
+        self.interval = interval
+        self.timeout = timeout
+
+    def cached_result(self):
+        """ Return the last result if it was checked within the interval, else None."""
+
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as file:
+                result = json.load(file)
+        except (OSError, ValueError):
+            return None
+
+        # Result saved by another version of the App is not valid anymore.
+        if result.get("current_version") != __version__ or \
+                not 0 <= time.time() - result.get("checked_at", 0) < self.interval:
+            return None
+        return result
+
+    def check(self, force=False):
+        """ Return the result in the form of {"current_version": ..., "latest_version": ...,
+        "update_available": bool, "checked_at": time}. Unless force is True, the saved result
+        is returned if it is not older than the interval. Raises requests.RequestException
+        (or ValueError for invalid answer) if the check fails. Safe to call from any thread.
+        """
+
+        if not force:
+            result = self.cached_result()
+            if result is not None:
+                return result
+
+        import requests  # Only needed when the check is really done.
+
+        response = requests.get(self.url, timeout=self.timeout)
+        response.raise_for_status()
+        latest_version = response.json()["info"]["version"]
+        result = {"current_version": __version__, "latest_version": latest_version,
+                  "update_available": version_tuple(latest_version) > version_tuple(__version__),
+                  "checked_at": time.time()}
+
+        try:
+            with open(self.cache_path, "w", encoding="utf-8") as file:
+                json.dump(result, file)
+        except OSError:
+            pass  # Result is still correct, it just will not be remembered.
+        return result
+
+
+class LocalUpdateServer:
+    """ HTTP server on localhost which answers every GET request like the PyPI JSON API
+    with the given version. Used as a stand-in for PyPI:
+
+        with LocalUpdateServer("9.9.9") as url:
+            UpdateChecker(path, url=url).check()
+    """
+
+    def __init__(self, latest_version, delay=0):
+        """ delay is the number of seconds to wait before answering (to try timeouts)."""
+
+        from http.server import BaseHTTPRequestHandler, HTTPServer
+
+        body = json.dumps({"info": {"version": latest_version}}).encode()
+
+        class Handler(BaseHTTPRequestHandler):
+            """ Answer every GET request with the JSON body."""
+
+            def do_GET(self):
+                time.sleep(delay)
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *_):
+                return
+
+        self.server = HTTPServer(("127.0.0.1", 0), Handler)
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return "http://127.0.0.1:%d/pypi/windows-wifi-manager/json" % self.server.server_port
+
+    def __exit__(self, *_):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+# used for testing
+if __name__ == "__main__":
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as TEMP_DIR, LocalUpdateServer("99.0.0") as URL:
+        CHECKER = UpdateChecker(os.path.join(TEMP_DIR, "update_check.json"), url=URL)
+        print(CHECKER.check())  # checked from the local server
+        print(CHECKER.cached_result())  # saved result is used within the interval
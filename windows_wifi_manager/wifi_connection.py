@@ -1,72 +1,207 @@
-""" This script file is responsible to return the check whether system is
-connected to any Wi-Fi network and return SSID name and also give functionality
-to disconnect from the current connected network.
-"""
-import re
-import subprocess
-
-from windows_wifi_manager.top_level_window import MessageBox
-
-
-class SystemWifiConnection:
-    """ Check system is connected to any Wi-Fi network and also the functionality
-    of disconnect and refresh(to check whether system is connected to any network or
-    not.
-    """
-
-    def __init__(self, parent):
-        """ Declare ssid_name, interface_name(Wi-Fi), parent(reference to parent window
-        which is used to display error pop-up message.
-        """
-
-        self.parent = parent
-        self.interface_name = None
-        self.ssid_name = None
-
-    def is_connected(self):
-        """ Check if system is connected to any Wi-Fi network. If true,
-        return ssid_name and interface name else return None.
-        """
-
-        command = 'netsh wlan show interfaces | findstr "Name State SSID"'
-        output = subprocess.run(command, shell=True, capture_output=True, text=True)
-        my_regex = r"Name.*?connected.*?(?= *BSSID)"
-        network_status = re.search(my_regex, output.stdout, re.DOTALL)
-
-        if network_status is None:
-            return None
-        network_status = network_status.group()
-        self.interface_name = re.findall(r"[\n\r-<>():]?.*Name\s*: ([^\n\r]*)", network_status)[0]
-        self.ssid_name = re.findall(r"[\n\r-<>():]?.*SSID\s*: ([^\n\r]*)", network_status)[0]
-        return self.ssid_name
-
-    def disconnect_connection(self):
-        """ Disconnects if system is connected to any Wi-Fi network"""
-
-        command = 'netsh wlan disconnect interface = "' + self.interface_name + '"'
-        output = subprocess.run(command, shell=True, capture_output=True, text=True)
-
-        # Check if system is disconnected from network successfully.
-        if output.returncode != 0:
-            message = "Sorry, unable to disconnect"
-            MessageBox(self.parent, message, "error")  # Display message of error.
-            return False
-        return True
-
-    # WARNING
-    # There is a bug in below function i.e., when user disconnect and reconnect to same network
-    # and network is not available anymore. It still shows the result that connection to same
-    # network is done successfully. It is a bug of 'command prompt'.
-    def reconnect_network(self):
-        """ Try to reconnect to same network. """
-        command = 'netsh wlan connect name="' + self.ssid_name + '" interface = "' \
-                  + self.interface_name + '"'
-        output = subprocess.run(command, shell=True, capture_output=True, text=True)
-
-        # Check if system reconnect to same network successfully.
-        if output.returncode != 0:
-            message = "Unable to reconnect(either previous network is not available" \
-                      " in range or profile is deleted)"
-            MessageBox(self.parent, message, "error")  # Display message of error.
-            return False
-        return True
+""" This script file is responsible to return the check whether system is
+connected to any Wi-Fi network and return SSID name and also give functionality
+to disconnect from the current connected network. System can have more than one
+Wi-Fi interface (e.g. built-in adapter and USB dongle), details of all of them are
+parsed from a single 'netsh wlan show interfaces' (see netsh_parser).
+"""
+from windows_wifi_manager import command_runner, tracing
+from windows_wifi_manager.netsh_parser import parse_interfaces
+
+
+class SystemWifiConnection:
+    """ Check system is connected to any Wi-Fi network and also the functionality
+    of disconnect and refresh(to check whether system is connected to any network or
+    not.
+    """
+
+    def __init__(self, parent=None):
+        """ Declare ssid_name, interface_name(Wi-Fi), parent(reference to parent window
+        which is used to display error pop-up message, None when used without GUI).
+        """
+
+        self.parent = parent
+        self.interface_name = None
+        self.ssid_name = None
+        self.profile_name = None
+        self.interfaces = []  # InterfaceRecord of every interface found in last check.
+        # Name of the interface chosen by user, if None the first connected one is used.
+        self.selected_interface = None
+
+    def show_error(self, message):
+        """ Display pop-up message of error, if used with GUI."""
+
+        if self.parent is not None:
+            # Imported here so the class can be used without tkinter (e.g. from cli).
+            from windows_wifi_manager.top_level_window import MessageBox
+            MessageBox(self.parent, message, "error")
+
+    def refresh_interfaces(self):
+        """ Read details of all the Wi-Fi interfaces of the system and return them as list
+        of InterfaceRecord.
+        """
+
+        output = command_runner.netsh("wlan", "show", "interfaces")
+        self.interfaces = parse_interfaces(output.stdout) if output.returncode == 0 else []
+        return self.interfaces
+
+    def find_interface(self, interface_name=None):
+        """ Return InterfaceRecord of the interface with given name (or the selected one),
+        if there is no such interface, the first connected interface is returned.
+        """
+
+        interface_name = interface_name or self.selected_interface
+        for interface in self.interfaces:
+            if interface.name == interface_name:
+                return interface
+        for interface in self.interfaces:
+            if interface.state == "connected":
+                return interface
+        return None
+
+    @tracing.traced()
+    def is_connected(self):
+        """ Check if system is connected to any Wi-Fi network. If true,
+        return ssid_name (of the selected interface) else return None.
+        """
+
+        self.refresh_interfaces()
+        interface = self.find_interface()
+        if interface is None or interface.state != "connected":
+            return None
+        self.interface_name = interface.name
+        self.ssid_name = interface.ssid
+        self.profile_name = interface.profile or interface.ssid
+        return self.ssid_name
+
+    def disconnect_connection(self, interface_name=None):
+        """ Disconnects the interface (by default the one found by is_connected) if it
+        is connected to any Wi-Fi network.
+        """
+
+        interface_name = interface_name or self.interface_name
+        output = command_runner.netsh("wlan", "disconnect", "interface=" + interface_name)
+
+        # Check if system is disconnected from network successfully.
+        if output.returncode != 0:
+            message = "Sorry, unable to disconnect"
+            self.show_error(message)
+            return False
+        return True
+
+    # WARNING
+    # There is a bug in below function i.e., when user disconnect and reconnect to same network
+    # and network is not available anymore. It still shows the result that connection to same
+    # network is done successfully. It is a bug of 'command prompt'.
+    def reconnect_network(self, interface_name=None):
+        """ Try to reconnect the interface (by default the one found by is_connected)
+        to same network. """
+        interface_name = interface_name or self.interface_name
+        output = command_runner.netsh("wlan", "connect", "name=" + self.profile_name,
+                                      "interface=" + interface_name)
+
+        # Check if system reconnect to same network successfully.
+        if output.returncode != 0:
+            message = "Unable to reconnect(either previous network is not available" \
+                      " in range or profile is deleted)"
+            self.show_error(message)
+            return False
+        return True
+
+
+class ConnectionMonitor:
+    """ Keeps checking in background whether system is connected to any Wi-Fi network
+    and calls the callback (on Tk thread) only when the connection changes, e.g. from
+    no network to 'Home' or from 'Home' to 'Office' or an interface is added. The time
+    between two checks doubles every time nothing is changed (up to max_interval) and is
+    reset when it changes. It is the only part of the window which runs 'netsh wlan show
+    interfaces', everything else which needs the interfaces (like the signal history) is
+    given them by interfaces_callback after every check.
+    """
+
+    def __init__(self, connection, tasks, callback, min_interval=2000, max_interval=30000,
+                 interfaces_callback=None, profiler=None):
+        """ connection is SystemWifiConnection, tasks is BackgroundTasks used to run
+        the check, callback is called with the ssid name (or None) and intervals are in
+        milliseconds. interfaces_callback is called (on Tk thread) with the list of
+        InterfaceRecord found by every check (empty if the check failed). profiler
+        (ActionProfiler) profiles the checks started by an action of the user.
+        """
+
+        self.connection = connection
+        self.tasks = tasks
+        self.callback = callback
+        self.interfaces_callback = interfaces_callback
+        self.profiler = profiler
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.interval = min_interval
+        self.state = None
+        self.started = False  # Callback is called for the first check even if ssid is None.
+        self.pending = None  # Future of the check which is running.
+        self.after_id = None
+
+    def start(self):
+        """ Start monitoring, the first check is done immediately."""
+
+        self.started = False
+        self.poll_now()
+
+    def stop(self):
+        """ Stop monitoring."""
+
+        if self.after_id is not None:
+            self.tasks.widget.after_cancel(self.after_id)
+            self.after_id = None
+        if self.pending is not None:
+            self.pending.cancel()
+            self.pending = None
+
+    def poll_now(self, action=None):
+        """ Check the connection now (e.g. after user clicked Refresh or Disconnect)
+        and start again with the minimum interval. If action is given, the check is
+        profiled (on the worker thread) as that action.
+        """
+
+        if self.after_id is not None:
+            self.tasks.widget.after_cancel(self.after_id)
+            self.after_id = None
+        self.interval = self.min_interval
+        self._poll(action)
+
+    def _poll(self, action=None):
+        """ Run the check on a worker thread, unless one is already running."""
+
+        self.after_id = None
+        if self.pending is None:
+            check = self._check
+            if action is not None and self.profiler is not None:
+                check = self.profiler.wrap(action, check)
+            self.pending = self.tasks.submit(check, callback=self._checked,
+                                             error_callback=lambda _: self._checked((None, [])))
+
+    def _check(self):
+        """ Run on a worker thread, return the ssid name (or None) and the interfaces found
+        by the same netsh call.
+        """
+
+        ssid_name = self.connection.is_connected()
+        return ssid_name, list(self.connection.interfaces)
+
+    def _checked(self, result):
+        """ Called on Tk thread with the result of the check."""
+
+        self.pending = None
+        ssid_name, interfaces = result
+        if self.interfaces_callback is not None:
+            self.interfaces_callback(interfaces)
+        # Interfaces added or removed (e.g. USB dongle) is also a change.
+        state = (ssid_name, tuple((interface.name, interface.state, interface.ssid)
+                                  for interface in interfaces))
+        if not self.started or state != self.state:
+            self.started = True
+            self.state = state
+            self.interval = self.min_interval
+            self.callback(ssid_name)
+        else:
+            self.interval = min(self.interval * 2, self.max_interval)
+        self.after_id = self.tasks.widget.after(self.interval, self._poll)
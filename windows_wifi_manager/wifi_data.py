@@ -1,219 +1,392 @@
-"""This module takes the name of the profile and return the Wi-Fi details like SSID name,
-Authentication and Key. Generating the Saved Wi-Fi details of some special SSID's gives a
-problem. For a different type of SSID name, like some SSID name contain 'emojis' while some
-contain special symbols which create a lot of problems when dealing with command prompt. So,
-generating XML file of the per profile doesn't resolve some problem but not all. Some SSID's
-like 'Redm"i=" are still creating problems.
-"""
-
-import os
-import re
-import subprocess
-import xml.etree.ElementTree as etree
-
-
-class WifiInformation:
-    """ This class generates and return the SSID, Authentication, Key
-    for the Wi-Fi profile as given as input.
-    """
-
-    def __init__(self, app_path):
-
-        """
-            This method is used to check if the necessary folder, file is present,
-        otherwise create it. Also, initialize object variables.
-        """
-
-        self.app_path = app_path
-
-        if not os.path.isdir(self.app_path + "\\temp_"):
-            os.mkdir(self.app_path + "\\temp_")
-
-        if os.path.isfile(self.app_path + "/Saved Wifi list.txt"):
-            os.remove(self.app_path + "/Saved Wifi list.txt")
-            self.generating_wifi_list()
-
-        else:
-            self.generating_wifi_list()
-
-    def generating_wifi_list(self):
-        """ Generates the list of Wi-Fi saved in you system and save it in parent folder of temp_.
-        """
-
-        with open(self.app_path + "/Saved Wifi list.txt", "w") as file:
-
-            output = subprocess.run("netsh wlan show profile", shell=True,
-                                    capture_output=True, text=True)
-
-            # Parsing and finding required information and saving it into the file.
-            if output.returncode == 0:
-                my_regex = r"[\n\r-<>():].*All User Profile\s*: ([^\n\r]*)"
-                list_of_wifi = re.findall(my_regex, output.stdout)
-                list_of_wifi.sort(key = lambda x: x.lower())
-                for i in list_of_wifi:
-                    file.write(i + "\n")
-
-    def retrieving_list_of_wifi(self):
-        """ The below code returns list of tuple in the form of [(name, "", "", ""),].
-        """
-
-        list_of_wifi_detail = []
-        with open(self.app_path + "/Saved Wifi list.txt", 'r') as file:
-            wifi_detail = file.readlines()
-            for item in wifi_detail:
-                list_of_wifi_detail.append((item[:-1], "", "", ""))
-        return list_of_wifi_detail
-
-    def wifi_details_(self, name, text_file_name, wifi_detail):
-        """ Called if XML or text file for particular wifi doesn't exist.
-         It tries another possible way to retrieve information.
-         """
-
-        # Getting information for specific profile using
-        # netsh wlan show profile name= "name" key =clear
-        # then using findstr to search
-        cmd = 'netsh wlan show profile name="' + name + \
-              '" key=clear | findstr "Name name Authentication Key"'
-        output = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-
-        # If command executed successfully.
-        if output.returncode == 0:
-            ssid_regex = r"[\n\r-<>():].*Name\s*: ([^\n\r]*)"
-            ssid_name = re.findall(ssid_regex, output.stdout)[0]
-            authentication_regex = r"[\n\r-<>():].*Authentication\s*: ([^\n\r]*)"
-            authentication = re.findall(authentication_regex, output.stdout)[0]
-
-            if authentication == "Open":
-                key_content = "None"
-            else:
-                key_content_regex = r"[\n\r-<>():].*Key Content\s*: ([^\n\r]*)"
-                key_content = re.findall(key_content_regex, output.stdout)[0]
-
-            return self.data_saving(text_file_name, ssid_name, authentication,
-                                    key_content, wifi_detail)
-
-        # THIS LAST OPTION DOESN'T PROVIDE THE KEY FOR WIFI. IT ONLY PROVIDE SSID's
-        # AND AUTHENTICATION BECAUSE 'netsh wlan show profile * key=clear' PROVIDES
-        # EVERYTHING FOR SPECIFIC PROFILE EXCEPT KEY. THE BELOW CODE IS USED TO RETRIEVE
-        # INFORMATION FOR SSID's LIKE "Red"mi=", "abc:>gh=", etc. IF ANY ONE CAN SOLVE
-        # THE ISSUE THEN YOU CAN BY REMOVING THE CODE FROM ELSE BLOCK AND PUT YOUR OWN
-        # CODE, BUT DON'T REMOVE THE RETURN STATEMENT.
-
-        try:
-            cmd = 'netsh wlan show profile * key =clear | findstr ' \
-                  '"Name name Authentication Key"'
-            output = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-            if output.returncode != 0:
-                raise Exception
-            my_regex = name + r".*?(?=Name)"
-            info_of_ssid = re.findall(my_regex, output.stdout, re.DOTALL)[0]
-            ssid_name_regex = r"[\n\r-<>():].*SSID name\s*: ([^\n\r]*)"
-            ssid_name = re.findall(ssid_name_regex, info_of_ssid)[0]
-            authentication_regex = r"[\n\r-<>():].*Authentication\s*: ([^\n\r]*)"
-            authentication = re.findall(authentication_regex, info_of_ssid)[0]
-            key_content = "*Unable to find*"
-
-        except Exception:
-            ssid_name = name
-            authentication = "*Unable to find*"
-            key_content = "*Unable to find*"
-
-        return self.data_saving(text_file_name, ssid_name, authentication,
-                                key_content, wifi_detail)
-
-    @staticmethod
-    def xml_parsing(tree, wifi_detail):
-        """Parsing XML file to retrieve ssid, authentication and key(if any).
-        """
-
-        root = tree.getroot()
-        namespace = re.match(
-            r"{[^\s\n\r]+}", root.tag).group()
-
-        ssid = tree.find(".//" + namespace + "SSID")
-        ssid = ssid.find(".//" + namespace + "name")
-        wifi_detail.append(ssid.text)
-        authentication = tree.find(".//" + namespace + "authentication")
-        wifi_detail.append(authentication.text)
-        if authentication.text != "open":
-            key_content = tree.find(".//" + namespace + "keyMaterial")
-            wifi_detail.append(key_content.text)
-        else:
-            wifi_detail.append(None)
-
-        return wifi_detail
-
-    def wifi_details(self, name):
-        """ Using the 'name' parameter find the profile and check every possible way
-        to retrieve SSID, authentication and key(if any).
-        """
-
-        wifi_detail = [name]
-        text_file_name = str(sum([ord(i) for i in name]))
-
-        # if xml file of particular wifi profile is there in temp folder
-        if os.path.isfile(self.app_path + "\\temp_\\Wi-Fi-" + name + ".xml"):
-            tree = etree.parse(self.app_path + "\\temp_\\Wi-Fi-" + name + ".xml")
-
-            return self.xml_parsing(tree, wifi_detail)
-
-        # if text file of particular wifi profile is there in temp folder
-        elif os.path.isfile(self.app_path + "\\temp_\\" + text_file_name + ".txt"):
-            return self.data_retrieval(text_file_name, wifi_detail)
-
-        else:
-            # export all profile data into their specified xml file and save
-            # to specific folder which is path to temp_ folder
-
-            cmd = 'netsh wlan export profile key=clear folder="' + self.app_path + '\\temp_"'
-            output = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-
-            if output.returncode != 0:
-                return self.wifi_details_(name, text_file_name, wifi_detail)
-
-            # If xml file of particular wifi profile is there in temp folder
-            elif os.path.isfile(self.app_path + "\\temp_\\Wi-Fi-" + name + ".xml"):
-                tree = etree.parse(self.app_path + "\\temp_\\Wi-Fi-" + name + ".xml")
-                return self.xml_parsing(tree, wifi_detail)
-
-            return self.wifi_details_(name, text_file_name, wifi_detail)
-
-    def data_retrieval(self, text_file_name, wifi_detail):
-        """ Getting SSID name, authentication and password from the text file."""
-
-        with open(self.app_path + "\\temp_\\" + text_file_name + ".txt", "r") as file:
-            wifi_detail.append(file.readline()[:-1])
-            auth_temp = file.readline()[:-1]
-            wifi_detail.append(auth_temp)
-            if auth_temp != "*None*":
-                wifi_detail.append(file.readline()[:-1])
-            else:
-                wifi_detail.append(None)
-            return wifi_detail
-
-    def data_saving(self, text_file_name, ssid, authentication, key, wifi_detail):
-        """ Saving SSID name, authentication and password to text file."""
-
-        with open(self.app_path + "\\temp_\\" + str(text_file_name) + ".txt", "w") as file:
-            file.writelines(ssid.strip('""') + "\n")
-            file.writelines(authentication + "\n")
-            wifi_detail.append(ssid.strip('""'))
-            wifi_detail.append(authentication)
-            if authentication != "Open" or authentication != "open":
-                file.writelines(key + "\n")
-                wifi_detail.append(key)
-            else:
-                file.writelines("*None*" + "\n")
-                wifi_detail.append(None)
-
-        return wifi_detail
-
-
-# used for testing
-if __name__ == "__main__":
-    PATH = "C:\\Users\\Nihal\\AppData\\Local\\NihalAgarwal\\SavedPasswordFinder"
-    OBJ1 = WifiInformation(PATH)
-    # Display the list of tuple in the form of [('name', "", "", ""),]
-    print(OBJ1.retrieving_list_of_wifi())
-    # Display the list of detail for the given wifi.
-    print(OBJ1.wifi_details("mr. n="))
+"""This module takes the name of the profile and return the Wi-Fi details like SSID name,
+Authentication and Key. Some SSID names contain 'emojis' or special symbols (like
+'Redm"i=') which created a lot of problems when the commands were run through command
+prompt. Now netsh is run directly with a list of arguments (see command_runner), so the
+name is passed to netsh as it is, and the details are read from the exported XML files.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+from windows_wifi_manager import command_runner, netsh_parser, tracing
+
+
+class ProfileCache:
+    """ Cache of the SSID, authentication and key of profiles saved in a single SQLite
+    file. The whole cache is loaded in memory once when the object is created, after that
+    lookups are done in memory and only changes are written to the file. Details older
+    than max_age seconds are stale (e.g. the key was changed since), they are not returned
+    so they are retrieved from the system again.
+    """
+
+    # Incremented when the table changes, a cache file of another version is emptied.
+    SCHEMA_VERSION = 3
+    MAX_AGE = 24 * 60 * 60
+
+    def __init__(self, path, max_age=MAX_AGE):
+        self.path = path
+        self.max_age = max_age
+        self.lock = threading.Lock()  # Cache is used from worker threads too.
+        with tracing.span("ProfileCache load", "io"):
+            try:
+                self.connection = self.connect(self.path)
+            except sqlite3.OperationalError:
+                # File can't be used now (e.g. it is locked by another App), but it is not
+                # corrupted, so it is kept and the cache is only in memory until closed.
+                self.connection = self.connect(":memory:")
+            except sqlite3.DatabaseError:
+                self.connection = None
+            if self.connection is None:
+                # Cache file is corrupted, it is only a cache so start with an empty one.
+                # It is removed after the except block, when nothing holds it open
+                # (Windows doesn't remove a file which is open).
+                os.remove(self.path)
+                self.connection = self.connect(self.path)
+
+            # Details of every cached profile in the form of
+            # {name: (ssid, authentication, key, source_time)}
+            self.entries = {row[0]: row[1:] for row in self.connection.execute(
+                "SELECT name, ssid, authentication, key, source_time FROM profiles")}
+
+    def connect(self, path):
+        """ Open the cache file at path and create the table if it is not there. If the
+        file is corrupted, it is closed and sqlite3.DatabaseError is raised.
+        """
+
+        connection = sqlite3.connect(path, check_same_thread=False)
+        try:
+            # It is only a cache (recreated if corrupted), so don't wait for the disk on commit.
+            connection.execute("PRAGMA synchronous = OFF")
+            if connection.execute("PRAGMA user_version").fetchone()[0] != self.SCHEMA_VERSION:
+                connection.execute("DROP TABLE IF EXISTS profiles")
+                connection.execute("PRAGMA user_version = %d" % self.SCHEMA_VERSION)
+            connection.execute("CREATE TABLE IF NOT EXISTS profiles (name TEXT PRIMARY KEY, "
+                               "ssid TEXT, authentication TEXT, key TEXT, "
+                               "source_time REAL)")
+            # Rows are read here, so a file which is corrupted inside fails now.
+            connection.execute("SELECT count(*) FROM profiles").fetchone()
+            connection.commit()
+        except sqlite3.DatabaseError:
+            connection.close()
+            raise
+        return connection
+
+    def get(self, name):
+        """ Return [ssid, authentication, key] of the profile or None if it is not cached
+        or is stale.
+        """
+
+        entry = self.entries.get(name)
+        if entry is None or not 0 <= time.time() - entry[3] <= self.max_age:
+            return None
+        return list(entry[:3])
+
+    def put_many(self, items, source_time=None):
+        """ Save details of many profiles at once, items is an iterable in the form of
+        [(name, ssid, authentication, key),]. source_time is the time when details were
+        retrieved from the system (current time if not given).
+        """
+
+        if source_time is None:
+            source_time = time.time()
+        rows = [(name, ssid, authentication, key, source_time)
+                for name, ssid, authentication, key in items]
+        with self.lock, tracing.span("ProfileCache write", "io"):
+            self.connection.executemany("INSERT OR REPLACE INTO profiles VALUES (?, ?, ?, ?, ?)",
+                                        rows)
+            self.connection.commit()
+            for row in rows:
+                self.entries[row[0]] = row[1:]
+
+    def put(self, name, ssid, authentication, key, source_time=None):
+        """ Save details of a single profile."""
+        self.put_many([(name, ssid, authentication, key)], source_time)
+
+    def remove(self, names):
+        """ Remove the profiles from the cache."""
+
+        names = [name for name in names if name in self.entries]
+        if not names:
+            return
+        with self.lock, tracing.span("ProfileCache write", "io"):
+            self.connection.executemany("DELETE FROM profiles WHERE name = ?",
+                                        [(name,) for name in names])
+            self.connection.commit()
+            for name in names:
+                self.entries.pop(name, None)
+
+    def invalidate(self, list_of_wifi):
+        """ Called when list of profiles is changed, removes every cached profile which
+        is not in the list anymore.
+        """
+
+        current = set(list_of_wifi)
+        self.remove([name for name in self.entries if name not in current])
+
+    def close(self):
+        """ Close the cache file."""
+
+        with self.lock:
+            self.connection.close()
+
+
+class WifiInformation:
+    """ This class generates and return the SSID, Authentication, Key
+    for the Wi-Fi profile as given as input.
+    """
+
+    # Seconds after a failed export before profiles are exported again (until then every
+    # profile which is not cached is retrieved by its own netsh command).
+    EXPORT_RETRY_INTERVAL = 30
+
+    def __init__(self, app_path):
+
+        """
+            This method is used to check if the necessary folder, file is present,
+        otherwise create it. Also, initialize object variables.
+        """
+
+        self.app_path = app_path
+        self.list_of_wifi = []  # Sorted names of the saved profiles.
+
+        # True once all the profiles are exported by load_all_details().
+        self.profiles_exported = False
+        self.export_failed_at = None  # time.monotonic() of the last failed export.
+        # Details are retrieved from worker threads, the lock makes sure profiles are
+        # exported by only one of them.
+        self.export_lock = threading.Lock()
+
+        if not os.path.isdir(self.app_path + "\\temp_"):
+            os.mkdir(self.app_path + "\\temp_")
+
+        self.cache = ProfileCache(self.app_path + "\\temp_\\profile_cache.db")
+        self.generating_wifi_list()
+
+    @tracing.traced()
+    def generating_wifi_list(self):
+        """ Generates the list of Wi-Fi saved in you system and keep it in memory."""
+
+        output = command_runner.netsh("wlan", "show", "profile")
+
+        # Parsing and finding required information.
+        list_of_wifi = []
+        if output.returncode == 0:
+            list_of_wifi = netsh_parser.parse_profile_names(output.stdout)
+            list_of_wifi.sort(key = lambda x: x.lower())
+            # The list of profiles has underlined headings (in every language), an output
+            # without them is an error message, which must not empty the cache.
+            if list_of_wifi or "---" in output.stdout:
+                self.cache.invalidate(list_of_wifi)
+        self.list_of_wifi = list_of_wifi
+
+        # List of profile may be changed, so export the profiles again when needed.
+        self.profiles_exported = False
+        self.export_failed_at = None
+
+    def retrieving_list_of_wifi(self):
+        """ The below code returns list of tuple in the form of [(name, "", "", ""),].
+        """
+
+        return [(name, "", "", "") for name in self.list_of_wifi]
+
+    def save_snapshot(self, path=None):
+        """ Save the list of Wi-Fi to the text file at path ('Saved Wifi list.txt' in parent
+        folder of temp_ if not given), one name per line. It is only written when the user
+        asks for it (Profiles -> Save Profile List), the list itself is kept in memory.
+        Return the path of file.
+        """
+
+        if path is None:
+            path = self.app_path + "\\Saved Wifi list.txt"
+        with open(path, "w", encoding="utf-8") as file:
+            for name in self.list_of_wifi:
+                file.write(name + "\n")
+        return path
+
+    def wifi_details_(self, name, wifi_detail):
+        """ Called if XML or text file for particular wifi doesn't exist.
+         It tries another possible way to retrieve information.
+         """
+
+        # Getting information for specific profile using
+        # netsh wlan show profile name=name key=clear
+        # the required fields are picked from the output by netsh_parser.
+        output = command_runner.netsh("wlan", "show", "profile", "name=" + name, "key=clear")
+
+        # If command executed successfully.
+        profiles = netsh_parser.parse_profile_details(output.stdout)
+        if output.returncode == 0 and profiles and profiles[0]["authentication"] is not None:
+            profile = profiles[0]
+            ssid_name = profile["ssid"] or name
+            authentication = profile["authentication"]
+            key_content = profile["key"] if profile["key"] is not None else "None"
+            return self.data_saving(name, ssid_name, authentication, key_content, wifi_detail)
+
+        # THIS LAST OPTION DOESN'T PROVIDE THE KEY FOR WIFI. IT ONLY PROVIDE SSID's
+        # AND AUTHENTICATION BECAUSE 'netsh wlan show profile * key=clear' PROVIDES
+        # EVERYTHING FOR SPECIFIC PROFILE EXCEPT KEY. THE BELOW CODE IS USED TO RETRIEVE
+        # INFORMATION FOR SSID's LIKE "Red"mi=", "abc:>gh=", etc. IF ANY ONE CAN SOLVE
+        # THE ISSUE THEN YOU CAN BY REMOVING THE CODE FROM ELSE BLOCK AND PUT YOUR OWN
+        # CODE, BUT DON'T REMOVE THE RETURN STATEMENT.
+
+        try:
+            output = command_runner.netsh("wlan", "show", "profile", "*", "key=clear")
+            if output.returncode != 0:
+                raise Exception
+            profile = [profile for profile in netsh_parser.parse_profile_details(output.stdout)
+                       if profile["name"] == name][0]
+            ssid_name = profile["ssid"]
+            authentication = profile["authentication"]
+            key_content = profile["key"] or "*Unable to find*"
+
+        except Exception:
+            ssid_name = name
+            authentication = "*Unable to find*"
+            key_content = "*Unable to find*"
+
+        return self.data_saving(name, ssid_name, authentication, key_content, wifi_detail)
+
+    def load_all_details(self):
+        """ Export all the profiles at once and parse every exported XML file of temp_
+        folder into the cache, so details of any profile can be returned without running
+        any other command. Only profiles which are in the list of Wi-Fi are cached (a file
+        left from a deleted profile is skipped). Return True if profiles are exported
+        successfully, otherwise they are exported again next time.
+        """
+
+        # Not needed until profiles are exported.
+        from windows_wifi_manager.profile_xml import exported_files, read_profile
+
+        # export all profile data into their specified xml file and save
+        # to specific folder which is path to temp_ folder
+        output = command_runner.netsh("wlan", "export", "profile", "key=clear",
+                                      "folder=" + self.app_path + "\\temp_")
+
+        # Files are read first and parsed after, so disk and parsing are traced apart.
+        contents = []
+        temp_path = self.app_path + "\\temp_"
+        with tracing.span("read exported profiles", "io"):
+            for file_name in exported_files(temp_path):
+                with open(os.path.join(temp_path, file_name), "rb") as file:
+                    contents.append(file.read())
+
+        profiles = []
+        saved = set(self.list_of_wifi)
+        with tracing.span("parse exported profiles", "parse"):
+            for data in contents:
+                try:
+                    profile = read_profile(BytesIO(data))
+                except Exception:
+                    continue  # Skip the file which is not a valid profile.
+                if profile.name not in saved or profile.ssid is None:
+                    continue
+                key = profile.key if profile.authentication != "open" else None
+                profiles.append((profile.name, profile.ssid, profile.authentication, key))
+
+        self.cache.put_many(profiles)
+        self.profiles_exported = output.returncode == 0
+        self.export_failed_at = None if self.profiles_exported else time.monotonic()
+        return self.profiles_exported
+
+    @tracing.traced()
+    def wifi_details(self, name):
+        """ Using the 'name' parameter find the profile and check every possible way
+        to retrieve SSID, authentication and key(if any).
+        """
+
+        wifi_detail = [name]
+
+        # If profile is not cached, profiles are exported (only once, after that the
+        # details are served from the cache).
+        detail = self.cache.get(name)
+        if detail is None:
+            with self.export_lock:
+                if not self.profiles_exported and (
+                        self.export_failed_at is None or
+                        time.monotonic() - self.export_failed_at > self.EXPORT_RETRY_INTERVAL):
+                    self.load_all_details()
+            detail = self.cache.get(name)
+
+        if detail is not None:
+            wifi_detail.extend(detail)
+            return wifi_detail
+
+        return self.wifi_details_(name, wifi_detail)
+
+    def delete_profile(self, name):
+        """ Delete the Wi-Fi profile from the system and remove its exported xml file and
+        cached details. Return True if netsh deleted the profile.
+        """
+
+        return self.delete_profiles([name])[0][1]
+
+    def delete_profiles(self, names, max_workers=4):
+        """ Delete many Wi-Fi profiles, at most max_workers netsh commands are run at the
+        same time. Exported xml files, cached details and the list of Wi-Fi are updated
+        once for all the profiles. Return list of (name, deleted, reason) in the order of
+        names, reason is the message of netsh if profile is not deleted.
+        """
+
+        def delete(name):
+            output = command_runner.netsh("wlan", "delete", "profile", "name=" + name)
+            if output.returncode == 0:
+                return name, True, ""
+            reason = (output.stdout or output.stderr or "").strip()
+            return name, False, reason or "netsh failed with code %d" % output.returncode
+
+        names = list(dict.fromkeys(names))  # Every profile is deleted only once.
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(names)))) as pool:
+            results = list(pool.map(delete, names))
+
+        deleted = {name for name, done, _ in results if done}
+        self.remove_exported(names)
+        self.cache.remove(names)
+        if deleted:
+            self.list_of_wifi = [name for name in self.list_of_wifi if name not in deleted]
+        return results
+
+    def remove_exported(self, names):
+        """ Remove the exported XML files of the profiles from temp_ folder. The name of
+        the file depends on the interface (e.g. 'WLAN-<name>.xml') and some characters of
+        the name are replaced in it, so the name of the profile is read from every file.
+        """
+
+        # Not needed until profiles are deleted.
+        from windows_wifi_manager.profile_xml import exported_files, read_profile
+
+        temp_path = self.app_path + "\\temp_"
+        if not os.path.isdir(temp_path):
+            return
+        names = set(names)
+        for file_name in exported_files(temp_path):
+            path = os.path.join(temp_path, file_name)
+            try:
+                if read_profile(path).name in names:
+                    os.remove(path)
+            except Exception:
+                continue  # Skip the file which is not a valid profile.
+
+    def data_saving(self, name, ssid, authentication, key, wifi_detail):
+        """ Saving SSID name, authentication and password to the cache. SSID is already
+        without the quotes added by netsh.
+        """
+
+        if authentication in ("Open", "open"):
+            key = None
+        self.cache.put(name, ssid, authentication, key)
+        wifi_detail.extend([ssid, authentication, key])
+        return wifi_detail
+
+
+# used for testing
+if __name__ == "__main__":
+    PATH = "C:\\Users\\Nihal\\AppData\\Local\\NihalAgarwal\\SavedPasswordFinder"
+    OBJ1 = WifiInformation(PATH)
+    # Display the list of tuple in the form of [('name', "", "", ""),]
+    print(OBJ1.retrieving_list_of_wifi())
+    # Display the list of detail for the given wifi.
+    print(OBJ1.wifi_details("mr. n="))